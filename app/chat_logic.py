@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 import json
 from datetime import UTC, datetime
 from time import monotonic
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterator
 
 from src.zubot.core.agent_types import SessionEvent
 from src.zubot.core.context_assembler import assemble_messages
@@ -31,12 +32,13 @@ from src.zubot.core.memory_index import (
 )
 from src.zubot.core.memory_summary_worker import get_memory_summary_worker
 from src.zubot.core.session_store import append_session_events
-from src.zubot.core.tool_registry import invoke_tool, list_tools
+from src.zubot.core.tool_registry import invoke_tool, is_parallel_safe_tool, list_tools
 from src.zubot.core.config_loader import get_timezone, load_config
 from src.zubot.core.central_service import get_central_service
 
 MAX_RECENT_EVENTS = 60
 MAX_TOOL_LOOP_STEPS = 4
+MAX_PARALLEL_TOOL_CALLS = 4
 SUMMARY_MAX_INPUT_TOKENS = 4000
 SUMMARY_MAX_RECURSION_DEPTH = 6
 DEFAULT_SESSION_TTL_MINUTES = 12 * 60
@@ -700,6 +702,18 @@ def _build_time_location_context() -> tuple[str | None, dict[str, Any]]:
     return "\n".join(lines), debug
 
 
+def _invoke_tool_calls(calls: list[tuple[str, dict[str, Any]]]) -> Iterator[dict[str, Any]]:
+    """Run one step's tool calls, overlapping them when all are parallel-safe; yields payloads in call order."""
+    # A step may write a file and then read it, or append twice to one file, so any
+    # state-changing tool keeps the whole step sequential in the model's call order.
+    if len(calls) <= 1 or not all(is_parallel_safe_tool(tool_name) for tool_name, _ in calls):
+        return iter([invoke_tool(tool_name, **tool_args) for tool_name, tool_args in calls])
+    # Read-only/network calls are independent, so wall time is the slowest call, not the sum.
+    with ThreadPoolExecutor(max_workers=min(len(calls), MAX_PARALLEL_TOOL_CALLS)) as executor:
+        futures = [executor.submit(invoke_tool, tool_name, **tool_args) for tool_name, tool_args in calls]
+        return iter([future.result() for future in futures])
+
+
 def _run_llm_with_tools(
     *,
     messages: list[dict[str, Any]],
@@ -733,26 +747,43 @@ def _run_llm_with_tools(
             }
         )
 
+        parsed_calls: list[tuple[str, dict[str, Any], Any, dict[str, Any] | None]] = []
         for idx, call in enumerate(tool_calls):
             if not isinstance(call, dict):
                 continue
             tool_name, tool_args, tool_call_id = _parse_tool_call(call, idx=idx)
             if tool_name is None:
-                tool_payload = {
-                    "ok": False,
-                    "error": "Malformed tool call: missing function name.",
-                    "source": "tool_registry",
-                }
-                tool_name = "unknown_tool"
+                parsed_calls.append(
+                    (
+                        "unknown_tool",
+                        tool_args,
+                        tool_call_id,
+                        {"ok": False, "error": "Malformed tool call: missing function name.", "source": "tool_registry"},
+                    )
+                )
             elif "_raw_arguments" in tool_args:
-                tool_payload = {
-                    "ok": False,
-                    "error": f"Invalid JSON arguments for `{tool_name}`.",
-                    "source": "tool_registry",
-                    "raw_arguments": tool_args["_raw_arguments"],
-                }
+                parsed_calls.append(
+                    (
+                        tool_name,
+                        tool_args,
+                        tool_call_id,
+                        {
+                            "ok": False,
+                            "error": f"Invalid JSON arguments for `{tool_name}`.",
+                            "source": "tool_registry",
+                            "raw_arguments": tool_args["_raw_arguments"],
+                        },
+                    )
+                )
             else:
-                tool_payload = invoke_tool(tool_name, **tool_args)
+                parsed_calls.append((tool_name, tool_args, tool_call_id, None))
+
+        tool_payloads = _invoke_tool_calls(
+            [(tool_name, tool_args) for tool_name, tool_args, _, payload in parsed_calls if payload is None]
+        )
+        for tool_name, tool_args, tool_call_id, tool_payload in parsed_calls:
+            if tool_payload is None:
+                tool_payload = next(tool_payloads)
 
             executed_tools.append(
                 {
@@ -15,6 +15,7 @@ from .daily_memory import (
 )
 from .fact_memory import extract_facts_from_events, extract_facts_from_text
 from .config_loader import (
+    cached_settings,
     clear_config_cache,
     get_central_service_config,
     get_default_model,
@@ -88,6 +89,7 @@ __all__ = [
     "ContextItem",
     "ContextState",
     "check_access",
+    "cached_settings",
     "clear_config_cache",
     "call_llm",
     "cleanup_session_logs_older_than",
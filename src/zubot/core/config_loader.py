@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import json
 import os
+from functools import wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 DEFAULT_CONFIG_PATH = Path("config/config.json")
 _CONFIG_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
 
+_T = TypeVar("_T")
+
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
@@ -59,6 +62,39 @@ def clear_config_cache() -> None:
     _CONFIG_CACHE.clear()
 
 
+def cached_settings(builder: Callable[[dict[str, Any]], _T]) -> Callable[[], _T]:
+    """Wrap a `payload -> settings` builder so it only reruns when the config changes.
+
+    `load_config` returns the same object until the file changes, so settings
+    derived from it can be reused without re-walking the config tree. A missing
+    or invalid config builds from `{}`. The wrapper takes no arguments and
+    exposes `cache_clear()`.
+    """
+    cache: tuple[dict[str, Any], _T] | None = None
+
+    @wraps(builder)
+    def wrapper() -> _T:
+        nonlocal cache
+        try:
+            payload = load_config()
+        except (FileNotFoundError, ValueError):
+            payload = {}
+
+        cached = cache
+        if cached is not None and cached[0] is payload:
+            return cached[1]
+        settings = builder(payload)
+        cache = (payload, settings)
+        return settings
+
+    def cache_clear() -> None:
+        nonlocal cache
+        cache = None
+
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
 def get_timezone(config: dict[str, Any] | None = None) -> str | None:
     payload = config or load_config()
     value = payload.get("timezone")
@@ -82,6 +82,16 @@ def normalize_sheet_row(row: Mapping[str, Any]) -> dict[str, str]:
     return out
 
 
+def canonicalize_sheet_row(row: Mapping[str, Any]) -> dict[str, str]:
+    """Return the canonical sheet row in one pass.
+
+    Equivalent to `db_row_to_sheet_row(sheet_row_to_db_row(row))`: the sheet/DB
+    column mapping is one-to-one, so that round trip only normalizes key order
+    and string values.
+    """
+    return normalize_sheet_row(row)
+
+
 def sheet_row_to_db_row(row: Mapping[str, Any]) -> dict[str, str]:
     """Map a sheet-shaped row object to DB column names."""
     normalized = normalize_sheet_row(row)
@@ -42,6 +42,9 @@ class ToolSpec:
     category: str
     description: str
     parameters: dict[str, Any] = field(default_factory=dict)
+    # True only for read-only / network-only tools, whose calls may overlap within one
+    # model step; anything that writes files or task state runs strictly in order.
+    parallel_safe: bool = False
 
 
 class ToolRegistry:
@@ -337,6 +340,7 @@ def _create_default_registry() -> ToolRegistry:
             name="list_task_runs",
             handler=_list_task_runs,
             category="orchestration",
+            parallel_safe=True,
             description="List recent task runs from the central queue store.",
             parameters={"limit": {"type": "integer", "required": False}},
         )
@@ -346,6 +350,7 @@ def _create_default_registry() -> ToolRegistry:
             name="list_waiting_runs",
             handler=_list_waiting_runs,
             category="orchestration",
+            parallel_safe=True,
             description="List task runs currently waiting for user input.",
             parameters={"limit": {"type": "integer", "required": False}},
         )
@@ -384,6 +389,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_task_state",
             handler=_get_task_state,
             category="orchestration",
+            parallel_safe=True,
             description="Get a task state value by task_id/state_key.",
             parameters={
                 "task_id": {"type": "string", "required": True},
@@ -410,6 +416,7 @@ def _create_default_registry() -> ToolRegistry:
             name="has_task_item_seen",
             handler=_has_task_item_seen,
             category="orchestration",
+            parallel_safe=True,
             description="Check if a task has already seen an external item key.",
             parameters={
                 "task_id": {"type": "string", "required": True},
@@ -426,6 +433,7 @@ def _create_default_registry() -> ToolRegistry:
                 runs_limit=kwargs.get("runs_limit", 20),
             ),
             category="orchestration",
+            parallel_safe=True,
             description="Return task-agent check-in status with concise textual summary.",
             parameters={
                 "include_runs": {"type": "boolean", "required": False},
@@ -439,6 +447,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_location",
             handler=get_location,
             category="kernel",
+            parallel_safe=True,
             description="Return normalized user location and timezone context.",
         )
     )
@@ -447,6 +456,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_current_time",
             handler=get_current_time,
             category="kernel",
+            parallel_safe=True,
             description="Return current UTC/local time for a location timezone.",
             parameters={"location": {"type": "object", "required": False}},
         )
@@ -456,6 +466,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_weather",
             handler=get_weather,
             category="kernel",
+            parallel_safe=True,
             description="Return current weather conditions for a location.",
             parameters={"location": {"type": "object", "required": False}},
         )
@@ -465,6 +476,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_future_weather",
             handler=get_future_weather,
             category="kernel",
+            parallel_safe=True,
             description="Return hourly/daily weather forecast horizon.",
             parameters={
                 "location": {"type": "object", "required": False},
@@ -479,6 +491,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_today_weather",
             handler=get_today_weather,
             category="kernel",
+            parallel_safe=True,
             description="Return compact weather summary for today.",
             parameters={"location": {"type": "object", "required": False}},
         )
@@ -488,6 +501,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_weather_24hr",
             handler=get_weather_24hr,
             category="kernel",
+            parallel_safe=True,
             description="Return normalized weather outlook for the next 24 hours.",
             parameters={"location": {"type": "object", "required": False}},
         )
@@ -497,6 +511,7 @@ def _create_default_registry() -> ToolRegistry:
             name="get_week_outlook",
             handler=get_week_outlook,
             category="kernel",
+            parallel_safe=True,
             description="Return normalized 7-day weather outlook.",
             parameters={"location": {"type": "object", "required": False}},
         )
@@ -506,6 +521,7 @@ def _create_default_registry() -> ToolRegistry:
             name="read_file",
             handler=read_file,
             category="kernel",
+            parallel_safe=True,
             description="Read a text file with path-policy enforcement.",
             parameters={
                 "path": {"type": "string", "required": True},
@@ -518,6 +534,7 @@ def _create_default_registry() -> ToolRegistry:
             name="list_dir",
             handler=list_dir,
             category="kernel",
+            parallel_safe=True,
             description="List directory entries with path-policy enforcement.",
             parameters={"path": {"type": "string", "required": False}},
         )
@@ -527,6 +544,7 @@ def _create_default_registry() -> ToolRegistry:
             name="path_exists",
             handler=path_exists,
             category="kernel",
+            parallel_safe=True,
             description="Check whether a path exists with read-policy enforcement.",
             parameters={"path": {"type": "string", "required": True}},
         )
@@ -536,6 +554,7 @@ def _create_default_registry() -> ToolRegistry:
             name="stat_path",
             handler=stat_path,
             category="kernel",
+            parallel_safe=True,
             description="Return stat metadata for a file or directory.",
             parameters={"path": {"type": "string", "required": True}},
         )
@@ -576,6 +595,7 @@ def _create_default_registry() -> ToolRegistry:
             name="web_search",
             handler=web_search,
             category="kernel",
+            parallel_safe=True,
             description="Search the web using Brave Search API.",
             parameters={
                 "query": {"type": "string", "required": True},
@@ -590,6 +610,7 @@ def _create_default_registry() -> ToolRegistry:
             name="fetch_url",
             handler=fetch_url,
             category="kernel",
+            parallel_safe=True,
             description="Fetch URL content and extract readable text.",
             parameters={"url": {"type": "string", "required": True}},
         )
@@ -599,6 +620,7 @@ def _create_default_registry() -> ToolRegistry:
             name="read_json",
             handler=read_json,
             category="data",
+            parallel_safe=True,
             description="Read and parse JSON from a policy-allowed file path.",
             parameters={"path": {"type": "string", "required": True}},
         )
@@ -625,6 +647,7 @@ def _create_default_registry() -> ToolRegistry:
             name="search_text",
             handler=search_text,
             category="data",
+            parallel_safe=True,
             description="Search text across readable files in repo scope.",
             parameters={
                 "query": {"type": "string", "required": True},
@@ -662,5 +685,13 @@ def list_tools(*, category: str | None = None) -> list[dict[str, Any]]:
     return out
 
 
+def is_parallel_safe_tool(name: str) -> bool:
+    """Whether `name` is a registered tool marked safe to run concurrently with others."""
+    try:
+        return get_tool_registry().get(name).parallel_safe
+    except KeyError:
+        return False
+
+
 def invoke_tool(name: str, **kwargs: Any) -> dict[str, Any]:
     return get_tool_registry().invoke(name, **kwargs)
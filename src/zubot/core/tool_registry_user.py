@@ -14,6 +14,7 @@ def register_user_specific_tools(registry: Any, tool_spec_cls: Any) -> None:
             name="get_indeed_jobs",
             handler=get_indeed_jobs,
             category="kernel",
+            parallel_safe=True,
             description="Get Indeed job listings via HasData (fixed: domain=www.indeed.com, sort=date).",
             parameters={
                 "keyword": {"type": "string", "required": True},
@@ -26,6 +27,7 @@ def register_user_specific_tools(registry: Any, tool_spec_cls: Any) -> None:
             name="get_indeed_job_detail",
             handler=get_indeed_job_detail,
             category="kernel",
+            parallel_safe=True,
             description="Get detailed Indeed job info via HasData job endpoint.",
             parameters={"url": {"type": "string", "required": True}},
         )
@@ -6,12 +6,15 @@ These are lightweight scaffolds. Provider-specific integrations are added later.
 from .kernel import (
     append_file,
     append_job_app_row,
+    append_job_app_rows,
     create_and_upload_docx,
     create_local_docx,
     delete_job_app_row_by_key,
+    delete_job_app_rows_by_keys,
     fetch_url,
     get_current_time,
     get_future_weather,
+    get_future_weather_columns,
     get_google_access_token,
     get_location,
     get_today_weather,
@@ -24,6 +27,7 @@ from .kernel import (
     read_file,
     stat_path,
     upload_file_to_google_drive,
+    upload_files_to_google_drive,
     web_search,
     write_file,
 )
@@ -32,12 +36,15 @@ from .data import read_json, search_text, write_json
 __all__ = [
     "append_file",
     "append_job_app_row",
+    "append_job_app_rows",
     "create_and_upload_docx",
     "create_local_docx",
     "delete_job_app_row_by_key",
+    "delete_job_app_rows_by_keys",
     "fetch_url",
     "get_current_time",
     "get_future_weather",
+    "get_future_weather_columns",
     "get_google_access_token",
     "get_location",
     "get_today_weather",
@@ -52,6 +59,7 @@ __all__ = [
     "search_text",
     "stat_path",
     "upload_file_to_google_drive",
+    "upload_files_to_google_drive",
     "web_search",
     "write_file",
     "write_json",
@@ -2,14 +2,32 @@
 
 from .filesystem import append_file, list_dir, path_exists, read_file, stat_path, write_file
 from .google_auth import get_google_access_token
-from .google_drive_docs import create_and_upload_docx, create_local_docx, upload_file_to_google_drive
-from .google_sheets_job_apps import append_job_app_row, delete_job_app_row_by_key, list_job_app_rows
-from .hasdata_indeed import get_indeed_job_detail, get_indeed_jobs
+from .google_drive_docs import (
+    create_and_upload_docx,
+    create_local_docx,
+    upload_file_to_google_drive,
+    upload_files_to_google_drive,
+)
+from .google_sheets_job_apps import (
+    append_job_app_row,
+    append_job_app_rows,
+    delete_job_app_row_by_key,
+    delete_job_app_rows_by_keys,
+    list_job_app_rows,
+)
+from .hasdata_indeed import (
+    aget_indeed_job_detail,
+    aget_indeed_jobs,
+    get_indeed_job_detail,
+    get_indeed_job_details,
+    get_indeed_jobs,
+)
 from .location import get_location
 from .time import get_current_time
 from .web_fetch import fetch_url
 from .weather import (
     get_future_weather,
+    get_future_weather_columns,
     get_today_weather,
     get_weather,
     get_weather_24hr,
@@ -18,16 +36,22 @@ from .weather import (
 from .web_search import web_search
 
 __all__ = [
+    "aget_indeed_job_detail",
+    "aget_indeed_jobs",
     "append_file",
     "append_job_app_row",
+    "append_job_app_rows",
     "create_and_upload_docx",
     "create_local_docx",
     "delete_job_app_row_by_key",
+    "delete_job_app_rows_by_keys",
     "fetch_url",
     "get_current_time",
     "get_google_access_token",
     "get_future_weather",
+    "get_future_weather_columns",
     "get_indeed_job_detail",
+    "get_indeed_job_details",
     "get_indeed_jobs",
     "get_location",
     "get_today_weather",
@@ -40,6 +64,7 @@ __all__ = [
     "read_file",
     "stat_path",
     "upload_file_to_google_drive",
+    "upload_files_to_google_drive",
     "web_search",
     "write_file",
 ]
@@ -0,0 +1,478 @@
+"""Shared keep-alive HTTP transport for kernel tools.
+
+`open_pooled` is a drop-in for `urllib.request.urlopen(request, timeout=...)`
+that reuses idle `http.client` connections per (scheme, host, port), so
+back-to-back API calls skip the TCP/TLS handshake, and asks for gzip/deflate
+(plus brotli when the `brotli` package is installed) bodies, decoded
+transparently by `PooledResponse.read` (`read(amt)` never returns more than
+`amt` decoded bytes). Error semantics match urlopen: HTTP status >= 400 raises
+`HTTPError`, connection failures raise `URLError`. `get_json` / `post_json` are
+the shared JSON helpers built on it, and `get_json_cached` adds a per-URL TTL
+cache for idempotent lookups.
+"""
+
+from __future__ import annotations
+
+import http.client
+import io
+import json
+import select
+import ssl
+import zlib
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from time import monotonic
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+try:  # Optional; `br` is only advertised when it can be decoded.
+    import brotli
+except ImportError:
+    brotli = None
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+POOL_MAX_IDLE_PER_HOST = 4
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+# Matches urllib's HTTPRedirectHandler limit and status set.
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+REDIRECT_DRAIN_MAX_BYTES = 64 * 1024
+
+_PoolKey = tuple[str, str, int]
+
+_POOL: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+_POOL_LOCK = Lock()
+_SSL_CONTEXT = ssl.create_default_context()
+# Compact, UTF-8 request bodies; one shared encoder instead of a new one per `json.dumps(**kwargs)` call.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _read_json(response: Any) -> Any:
+    """Parse a JSON body straight from its bytes (no intermediate `str`)."""
+    return json.loads(response.read())
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket should have nothing to read; readable means the
+    # peer closed it (EOF) or sent something unsolicited.
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _checkout(key: _PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    with _POOL_LOCK:
+        idle = _POOL.get(key) or []
+        while idle:
+            conn = idle.pop()
+            if _is_dropped(conn):
+                conn.close()
+                continue
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+    scheme, host, port = key
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout, context=_SSL_CONTEXT), False
+    return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+
+def _checkin(key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+    with _POOL_LOCK:
+        idle = _POOL.setdefault(key, [])
+        if len(idle) < POOL_MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def clear_pool() -> None:
+    """Close and forget every idle pooled connection."""
+    with _POOL_LOCK:
+        conns = [conn for idle in _POOL.values() for conn in idle]
+        _POOL.clear()
+    for conn in conns:
+        conn.close()
+
+
+_BROTLI_FEED_BYTES = 1024
+
+
+class _BrotliDecoder:
+    """`zlib.decompressobj`-shaped adapter over `brotli.Decompressor`, including `max_length`."""
+
+    def __init__(self) -> None:
+        self._inner = brotli.Decompressor()
+        self._pending = b""
+        self.unconsumed_tail = b""
+
+    def decompress(self, data: bytes, max_length: int = 0) -> bytes:
+        # Feed small input slices and stop once `max_length` is reached, so one
+        # highly compressed chunk cannot expand into an unbounded buffer.
+        out = bytearray(self._pending)
+        pos = 0
+        while pos < len(data) and not (max_length and len(out) >= max_length):
+            out += self._inner.process(data[pos : pos + _BROTLI_FEED_BYTES])
+            pos += _BROTLI_FEED_BYTES
+        self.unconsumed_tail = data[pos:]
+        if max_length and len(out) > max_length:
+            self._pending = bytes(out[max_length:])
+            del out[max_length:]
+        else:
+            self._pending = b""
+        return bytes(out)
+
+    def flush(self) -> bytes:
+        pending, self._pending = self._pending, b""
+        return pending
+
+
+class _DeflateDecoder:
+    """`Content-Encoding: deflate` decoder that also accepts raw deflate bodies.
+
+    The spec says zlib-wrapped, but some servers send bare deflate data. The
+    first bytes decide: when the zlib header check fails, the input seen so far
+    is replayed through a raw (`-MAX_WBITS`) decompressor.
+    """
+
+    def __init__(self) -> None:
+        # wbits=32+MAX_WBITS auto-detects the gzip or zlib container.
+        self._inner = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        # Input fed before the two header bytes were checked, kept for the replay.
+        self._head: bytes | None = b""
+
+    @property
+    def unconsumed_tail(self) -> bytes:
+        return self._inner.unconsumed_tail
+
+    def decompress(self, data: bytes, max_length: int = 0) -> bytes:
+        if self._head is None:
+            return self._inner.decompress(data, max_length)
+        head = self._head + data
+        try:
+            out = self._inner.decompress(data, max_length)
+        except zlib.error:
+            self._head = None
+            self._inner = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._inner.decompress(head, max_length)
+        self._head = None if len(head) >= 2 else head
+        return out
+
+    def flush(self) -> bytes:
+        return self._inner.flush()
+
+
+def _decoder_for(encoding: str) -> Any:
+    if encoding in {"gzip", "x-gzip"}:
+        # wbits=32+MAX_WBITS auto-detects the gzip or zlib container.
+        return zlib.decompressobj(32 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return _DeflateDecoder()
+    if encoding == "br" and brotli is not None:
+        return _BrotliDecoder()
+    return None
+
+
+class PooledResponse:
+    """Minimal urlopen-style response that returns its connection to the pool once drained."""
+
+    def __init__(self, response: http.client.HTTPResponse, *, url: str, key: _PoolKey, conn: http.client.HTTPConnection):
+        self._response = response
+        self._key = key
+        self._conn: http.client.HTTPConnection | None = conn
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self._decoder = _decoder_for((response.headers.get("Content-Encoding") or "").strip().lower())
+        # Compressed input already read off the wire but not yet decoded (see `read`).
+        self._tail = b""
+
+    def _read_raw(self, amt: int | None) -> bytes:
+        data = self._response.read() if amt is None else self._response.read(amt)
+        if self._response.isclosed():
+            self.close()
+        return data
+
+    def read(self, amt: int | None = None) -> bytes:
+        decoder = self._decoder
+        if decoder is None:
+            return self._read_raw(amt)
+        if amt is None:
+            return decoder.decompress(self._tail + self._read_raw(None)) + decoder.flush()
+        while True:
+            raw = self._tail or self._read_raw(amt)
+            if not raw:
+                return decoder.flush()
+            # `max_length` bounds the decoded size: a small gzip chunk can expand to
+            # megabytes, and callers such as `web_fetch` rely on `read(amt)` <= amt.
+            data = decoder.decompress(raw, amt)
+            self._tail = decoder.unconsumed_tail
+            # A compressed chunk can decode to nothing; b"" must only mean end of body.
+            if data:
+                return data
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def getheader(self, name: str, default: Any = None) -> Any:
+        return self.headers.get(name, default)
+
+    def close(self) -> None:
+        conn = self._conn
+        self._conn = None
+        if conn is None:
+            return
+        if self._response.isclosed() and not self._response.will_close:
+            _checkin(self._key, conn)
+        else:
+            # Unread body left on the wire; the connection cannot be reused.
+            self._response.close()
+            conn.close()
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
+
+
+def _uses_proxy(scheme: str, host: str) -> bool:
+    return scheme in getproxies() and not proxy_bypass(host)
+
+
+def open_pooled(request: Request, *, timeout: float) -> Any:
+    """Send `request` over a pooled keep-alive connection.
+
+    Proxied hosts and non-HTTP schemes are handed to `urlopen`. GET/HEAD redirects
+    are followed on the pool (up to `MAX_REDIRECTS`); a redirect for any other
+    method raises `HTTPError` rather than re-sending the request body.
+    """
+    return _open_pooled(request, timeout=timeout, redirects_left=MAX_REDIRECTS)
+
+
+def _discard_redirect_body(pooled: PooledResponse) -> None:
+    # Small bodies are drained raw (never decoded) so the connection can be reused;
+    # anything larger or unsized just drops the connection.
+    length = pooled.headers.get("Content-Length")
+    if length is not None and length.isdigit() and int(length) <= REDIRECT_DRAIN_MAX_BYTES:
+        pooled._read_raw(None)
+    pooled.close()
+
+
+def _redirect_request(request: Request, response: Any, redirects_left: int) -> Request:
+    target = urljoin(request.full_url, response.headers["Location"])
+    method = request.get_method()
+    refusal = None
+    if method not in {"GET", "HEAD"}:
+        refusal = f"Refusing to re-send {method} on redirect"
+    elif urlsplit(target).scheme.lower() not in {"http", "https"}:
+        refusal = f"Redirect to unsupported URL: {target}"
+    elif redirects_left <= 0:
+        refusal = "Too many redirects"
+    if refusal is not None:
+        raise HTTPError(request.full_url, response.status, refusal, response.headers, io.BytesIO(b""))
+    # Same header policy as urllib's redirect handler: keep everything but the body headers.
+    headers = {
+        name: value for name, value in request.header_items() if name.lower() not in {"content-length", "content-type"}
+    }
+    return Request(target, headers=headers, method=method)
+
+
+def _open_pooled(request: Request, *, timeout: float, redirects_left: int) -> Any:
+    parts = urlsplit(request.full_url)
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ""
+    if scheme not in {"http", "https"} or not host or _uses_proxy(scheme, host):
+        return urlopen(request, timeout=timeout)
+
+    key: _PoolKey = (scheme, host, parts.port or (443 if scheme == "https" else 80))
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    method = request.get_method()
+    headers = dict(request.header_items())
+    headers.setdefault("Host", parts.netloc)
+    # Only the pooled path decodes compressed bodies, so only it advertises them.
+    if not any(name.lower() == "accept-encoding" for name in headers):
+        headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    while True:
+        conn, reused = _checkout(key, timeout)
+        try:
+            conn.request(method, path, body=request.data, headers=headers)
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as exc:
+            conn.close()
+            # A reused connection the server already closed; safe to resend reads/idempotent writes.
+            if reused and method in IDEMPOTENT_METHODS:
+                continue
+            raise URLError(exc) from exc
+        except TimeoutError:
+            conn.close()
+            raise
+        except OSError as exc:
+            conn.close()
+            raise URLError(exc) from exc
+        break
+
+    pooled = PooledResponse(response, url=request.full_url, key=key, conn=conn)
+    if response.status in REDIRECT_STATUSES and response.headers.get("Location"):
+        _discard_redirect_body(pooled)
+        next_request = _redirect_request(request, response, redirects_left)
+        return _open_pooled(next_request, timeout=timeout, redirects_left=redirects_left - 1)
+    if response.status >= 400:
+        body = pooled.read()
+        pooled.close()
+        raise HTTPError(request.full_url, response.status, response.reason, response.headers, io.BytesIO(body))
+    return pooled
+
+
+def get_json(url: str, headers: dict[str, str], timeout: float) -> Any:
+    """GET `url` over the shared pool and return the decoded JSON body."""
+    request = Request(url, headers=headers, method="GET")
+    with open_pooled(request, timeout=timeout) as response:
+        # Parse straight from the response bytes; no intermediate decoded copy.
+        return _read_json(response)
+
+
+def get_json_conditional(
+    url: str, headers: dict[str, str], timeout: float, *, etag: str | None = None
+) -> tuple[Any, str | None, bool]:
+    """GET with `If-None-Match`; returns `(payload, etag, modified)`.
+
+    On 304 Not Modified the payload is None and the caller's `etag` is echoed back.
+    """
+    payload, etag, _last_modified, modified = _get_json_validated(url, headers, timeout, etag=etag, last_modified=None)
+    return payload, etag, modified
+
+
+def _get_json_validated(
+    url: str, headers: dict[str, str], timeout: float, *, etag: str | None, last_modified: str | None
+) -> tuple[Any, str | None, str | None, bool]:
+    """GET with `If-None-Match` / `If-Modified-Since`; returns `(payload, etag, last_modified, modified)`."""
+    request_headers = dict(headers)
+    if etag:
+        request_headers["If-None-Match"] = etag
+    if last_modified:
+        request_headers["If-Modified-Since"] = last_modified
+    request = Request(url, headers=request_headers, method="GET")
+    try:
+        with open_pooled(request, timeout=timeout) as response:
+            if response.status == 304:
+                response.read()
+                return None, etag, last_modified, False
+            response_headers = response.headers
+            return _read_json(response), response_headers.get("ETag"), response_headers.get("Last-Modified"), True
+    except HTTPError as exc:
+        # The urlopen fallback reports 304 as an HTTPError.
+        if exc.code == 304 and (etag or last_modified):
+            return None, etag, last_modified, False
+        raise
+
+
+def post_json(url: str, headers: dict[str, str], payload: Any, timeout: float) -> Any:
+    """POST `payload` as JSON over the shared pool and return the decoded JSON body."""
+    request_headers = dict(headers)
+    request_headers["Content-Type"] = "application/json"
+    request = Request(url, data=_JSON_ENCODER.encode(payload).encode("utf-8"), headers=request_headers, method="POST")
+    with open_pooled(request, timeout=timeout) as response:
+        return _read_json(response)
+
+
+def post_json_discard(url: str, headers: dict[str, str], payload: Any, timeout: float) -> None:
+    """POST `payload` as JSON and drain the response without decoding it."""
+    request_headers = dict(headers)
+    request_headers["Content-Type"] = "application/json"
+    request = Request(url, data=_JSON_ENCODER.encode(payload).encode("utf-8"), headers=request_headers, method="POST")
+    with open_pooled(request, timeout=timeout) as response:
+        # Draining lets the keep-alive connection go back to the pool.
+        response.read()
+
+
+class TTLCache:
+    """Small thread-safe LRU whose entries expire `ttl_sec` after being stored.
+
+    Expired entries stay until evicted so `lookup` can still offer them for revalidation.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Any | None:
+        found = self.lookup(key)
+        return found[0] if found is not None and found[1] else None
+
+    def lookup(self, key: str) -> tuple[Any, bool] | None:
+        """Return `(value, fresh)` for `key`, including expired entries, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1], entry[0] > monotonic()
+
+    def set(self, key: str, value: Any, ttl_sec: float) -> None:
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl_sec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def cached_json(url: str, *, cache: TTLCache, ttl_sec: float) -> Any | None:
+    """A copy of the fresh `get_json_cached` entry for `url`, or None when a request is needed.
+
+    Lets rate-limited callers answer cache hits before they queue for the network.
+    """
+    if ttl_sec <= 0:
+        return None
+    found = cache.lookup(url)
+    if found is None or not found[1]:
+        return None
+    return deepcopy(found[0][0])
+
+
+def get_json_cached(url: str, headers: dict[str, str], timeout: float, *, cache: TTLCache, ttl_sec: float) -> Any:
+    """`get_json`, answered from `cache` while an entry for `url` is fresh; `ttl_sec <= 0` bypasses it.
+
+    Once an entry expires it is revalidated with its `ETag` / `Last-Modified`, so an
+    unchanged resource costs a header-only 304. Keys are the URL only, so credentials
+    must travel in headers. Callers always get their own copy, never the cached object.
+    """
+    if ttl_sec <= 0:
+        return get_json(url, headers, timeout)
+    found = cache.lookup(url)
+    if found is not None and found[1]:
+        return deepcopy(found[0][0])
+    stale_payload, etag, last_modified = found[0] if found is not None else (None, None, None)
+    payload, etag, last_modified, modified = _get_json_validated(
+        url, headers, timeout, etag=etag, last_modified=last_modified
+    )
+    if not modified:
+        payload = stale_payload
+    cache.set(url, (payload if not modified else deepcopy(payload), etag, last_modified), ttl_sec)
+    return deepcopy(payload) if not modified else payload
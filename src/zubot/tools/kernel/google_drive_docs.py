@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import io
+import itertools
 import json
-import mimetypes
-from datetime import UTC, datetime
+import string
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from email.parser import BytesParser
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
-from urllib.parse import quote, urlencode
+from threading import Lock
+from time import gmtime, monotonic, sleep
+from typing import Any, Callable, Iterable, Iterator
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
 from urllib.request import Request, urlopen
 
-from src.zubot.core.config_loader import load_config
+from src.zubot.core.config_loader import cached_settings
 from src.zubot.tools.kernel.google_auth import get_google_access_token
 
 DEFAULT_TIMEOUT_SEC = 15
@@ -18,8 +26,41 @@ DEFAULT_UPLOAD_PATH = "Job Applications/Cover Letters"
 DEFAULT_OUTPUT_DIR = "outputs/cover_letters"
 DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
-
-
+FOLDER_ID_CACHE_TTL_SEC = 300.0
+UPLOAD_READ_CHUNK_BYTES = 64 * 1024
+RETRY_ATTEMPTS = 4
+RETRY_BACKOFF_BASE_SEC = 0.5
+RETRY_AFTER_MAX_SEC = 30.0
+RETRYABLE_HTTP_CODES = frozenset({429, 500, 502, 503, 504})
+RESUMABLE_UPLOAD_THRESHOLD_BYTES = 5 * 1024 * 1024
+RESUMABLE_CHUNK_BYTES = 8 * 1024 * 1024
+UPLOAD_FIELDS = "id,name,webViewLink,mimeType,parents"
+MULTIPART_BOUNDARY = "zubotBoundary7MA4YWxkTrZu0gW"
+MULTIPART_CONTENT_TYPE = f"multipart/related; boundary={MULTIPART_BOUNDARY}"
+DRIVE_API_ORIGIN = "https://www.googleapis.com"
+DRIVE_BATCH_URL = f"{DRIVE_API_ORIGIN}/batch/drive/v3"
+DRIVE_BATCH_MAX_REQUESTS = 100
+BATCH_BOUNDARY = "zubotBatch3hQ9dLwX2pVn8rKs"
+BATCH_UPLOAD_MAX_WORKERS = 4
+# Constant files.list parameters; only `q` and `fields` vary per call.
+_DRIVE_LIST_URL_PREFIX = f"{DRIVE_API_ORIGIN}/drive/v3/files?pageSize=50&spaces=drive&"
+# Drive query string literals escape both quotes and backslashes.
+_QUERY_ESCAPE_TABLE = str.maketrans({"'": "\\'", "\\": "\\\\"})
+# files.list `q` shapes; substitute already-escaped name (`n`) and parent id (`p`).
+_FOLDER_QUERY = string.Template(
+    "name = '$n' and mimeType = '" + FOLDER_MIME_TYPE + "' and '$p' in parents and trashed = false"
+)
+_FILE_QUERY = string.Template("name = '$n' and '$p' in parents and trashed = false")
+
+# destination_path -> (monotonic expiry, folder_id)
+_FOLDER_ID_CACHE: dict[str, tuple[float, str]] = {}
+_FOLDER_ID_CACHE_LOCK = Lock()
+# Leaf folders created by `_resolve_or_create_folder_path` that have not been
+# uploaded into yet; they are known to be empty.
+_FRESH_FOLDER_IDS: set[str] = set()
+
+
+@lru_cache(maxsize=1)
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[4]
 
@@ -31,7 +72,9 @@ def _resolve_repo_relative_path(raw_path: str) -> Path:
     normalized_parts = [part for part in candidate.parts if part not in (".", "")]
     if any(part == ".." for part in normalized_parts):
         raise ValueError("Path traversal is not allowed.")
-    return (_repo_root() / candidate).resolve()
+    # Absolute paths and `..` are rejected above, so the lexical join already
+    # stays under the repo root; skip `resolve()` and its per-component stats.
+    return _repo_root().joinpath(*normalized_parts)
 
 
 def _ensure_docx_filename(filename: str) -> str:
@@ -40,25 +83,18 @@ def _ensure_docx_filename(filename: str) -> str:
         raise ValueError("filename must be non-empty.")
     if "/" in base or "\\" in base:
         raise ValueError("filename must not contain path separators.")
-    if base.lower().endswith(".docx"):
+    if base[-5:].lower() == ".docx":
         return base
     return f"{base}.docx"
 
 
-def _google_drive_settings() -> dict[str, Any]:
+@cached_settings
+def _google_drive_settings(payload: dict[str, Any]) -> dict[str, Any]:
     try:
-        payload = load_config()
-    except (FileNotFoundError, ValueError):
-        payload = {}
-
-    config: dict[str, Any] = {}
-    profiles = payload.get("tool_profiles")
-    if isinstance(profiles, dict):
-        user_specific = profiles.get("user_specific")
-        if isinstance(user_specific, dict):
-            block = user_specific.get("google_drive")
-            if isinstance(block, dict):
-                config = block
+        block = payload["tool_profiles"]["user_specific"]["google_drive"]
+    except (KeyError, TypeError):
+        block = None
+    config: dict[str, Any] = block if isinstance(block, dict) else {}
 
     spreadsheet_id = config.get("job_application_spreadsheet_id")
     default_upload_path = config.get("default_upload_path")
@@ -75,17 +111,121 @@ def _google_drive_settings() -> dict[str, Any]:
     }
 
 
+def _reset_settings_cache() -> None:
+    _google_drive_settings.cache_clear()
+
+
+def _cached_folder_id(destination_path: str) -> str | None:
+    with _FOLDER_ID_CACHE_LOCK:
+        entry = _FOLDER_ID_CACHE.get(destination_path)
+        if entry is None:
+            return None
+        expires_at, folder_id = entry
+        if expires_at <= monotonic():
+            _FOLDER_ID_CACHE.pop(destination_path, None)
+            return None
+        return folder_id
+
+
+def _store_folder_id(destination_path: str, folder_id: str) -> None:
+    with _FOLDER_ID_CACHE_LOCK:
+        _FOLDER_ID_CACHE[destination_path] = (monotonic() + FOLDER_ID_CACHE_TTL_SEC, folder_id)
+
+
+def _invalidate_folder_id(destination_path: str) -> None:
+    with _FOLDER_ID_CACHE_LOCK:
+        _FOLDER_ID_CACHE.pop(destination_path, None)
+
+
+def clear_folder_id_cache() -> None:
+    """Clear cached destination-path -> Drive folder id mappings."""
+    with _FOLDER_ID_CACHE_LOCK:
+        _FOLDER_ID_CACHE.clear()
+        _FRESH_FOLDER_IDS.clear()
+
+
+def _consume_fresh_folder(folder_id: str) -> bool:
+    with _FOLDER_ID_CACHE_LOCK:
+        if folder_id in _FRESH_FOLDER_IDS:
+            _FRESH_FOLDER_IDS.discard(folder_id)
+            return True
+        return False
+
+
+def _is_stale_folder_error(exc: Exception) -> bool:
+    return isinstance(exc, HTTPError) and exc.code in (404, 410)
+
+
+@lru_cache(maxsize=4)
 def _authorized_headers(access_token: str) -> dict[str, str]:
+    """Return shared auth headers for `access_token`; callers must not mutate them."""
     return {
         "Authorization": f"Bearer {access_token}",
         "Accept": "application/json",
     }
 
 
+@lru_cache(maxsize=4)
+def _json_headers(access_token: str) -> dict[str, str]:
+    """Return shared auth + JSON body headers; callers must not mutate them."""
+    return {**_authorized_headers(access_token), "Content-Type": "application/json"}
+
+
+def _is_retryable_drive_error(exc: Exception, *, idempotent: bool) -> bool:
+    if isinstance(exc, HTTPError):
+        # 429 means the request was rejected before processing, so even a
+        # non-idempotent POST (folder create, upload) is safe to resend.
+        if exc.code == 429:
+            return True
+        return idempotent and exc.code in RETRYABLE_HTTP_CODES
+    if isinstance(exc, (URLError, TimeoutError, ConnectionError)):
+        return idempotent
+    return False
+
+
+def _retry_delay_sec(exc: Exception, attempt: int) -> float:
+    if isinstance(exc, HTTPError) and exc.headers is not None:
+        retry_after = exc.headers.get("Retry-After")
+        if isinstance(retry_after, str) and retry_after.strip().isdigit():
+            # A server-chosen wait must not stall the tool call indefinitely.
+            return min(float(retry_after.strip()), RETRY_AFTER_MAX_SEC)
+    return RETRY_BACKOFF_BASE_SEC * (2 ** (attempt - 1))
+
+
+def _open_with_retries(
+    make_request: Callable[[], Request],
+    *,
+    timeout_sec: int,
+    idempotent: bool,
+) -> tuple[bytes, Message]:
+    """Send a Drive request, retrying transient failures with exponential backoff.
+
+    `make_request` is called once per attempt because streamed request bodies
+    cannot be replayed. Returns the response body and headers.
+    """
+    attempt = 1
+    while True:
+        try:
+            with urlopen(make_request(), timeout=timeout_sec) as response:
+                return response.read(), response.headers
+        except Exception as exc:
+            if attempt >= RETRY_ATTEMPTS or not _is_retryable_drive_error(exc, idempotent=idempotent):
+                raise
+            sleep(_retry_delay_sec(exc, attempt))
+            attempt += 1
+
+
+def _send_with_retries(make_request: Callable[[], Request], *, timeout_sec: int, idempotent: bool) -> bytes:
+    body, _headers = _open_with_retries(make_request, timeout_sec=timeout_sec, idempotent=idempotent)
+    return body
+
+
 def _fetch_json(url: str, headers: dict[str, str], timeout_sec: int) -> dict[str, Any]:
-    req = Request(url, headers=headers, method="GET")
-    with urlopen(req, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
+    body = _send_with_retries(
+        lambda: Request(url, headers=headers, method="GET"),
+        timeout_sec=timeout_sec,
+        idempotent=True,
+    )
     payload = json.loads(body)
     if not isinstance(payload, dict):
         raise ValueError("Google Drive response must be a JSON object.")
@@ -93,66 +233,182 @@ def _fetch_json(url: str, headers: dict[str, str], timeout_sec: int) -> dict[str
 
 
 def _post_json(url: str, headers: dict[str, str], payload: dict[str, Any], timeout_sec: int) -> dict[str, Any]:
-    request_headers = dict(headers)
-    request_headers["Content-Type"] = "application/json"
-    req = Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=request_headers,
-        method="POST",
+    """POST `payload` as JSON; `headers` must already carry the JSON Content-Type."""
+    encoded = json.dumps(payload).encode("utf-8")
+    body = _send_with_retries(
+        lambda: Request(url, data=encoded, headers=headers, method="POST"),
+        timeout_sec=timeout_sec,
+        idempotent=False,
     )
-    with urlopen(req, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
     data = json.loads(body)
     if not isinstance(data, dict):
         raise ValueError("Google Drive response must be a JSON object.")
     return data
 
 
+def _iter_file_chunks(path: Path) -> Iterator[bytes]:
+    with path.open("rb") as handle:
+        while chunk := handle.read(UPLOAD_READ_CHUNK_BYTES):
+            yield chunk
+
+
+@lru_cache(maxsize=8)
+def _multipart_template(content_type: str) -> tuple[bytes, bytes, bytes]:
+    """Return the fixed (head, mid, trailer) byte segments around metadata and content."""
+    head = f"--{MULTIPART_BOUNDARY}\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n".encode("utf-8")
+    mid = f"\r\n--{MULTIPART_BOUNDARY}\r\nContent-Type: {content_type}\r\n\r\n".encode("utf-8")
+    trailer = f"\r\n--{MULTIPART_BOUNDARY}--\r\n".encode("utf-8")
+    return head, mid, trailer
+
+
 def _upload_multipart(
     *,
     access_token: str,
     metadata: dict[str, Any],
-    content: bytes,
     content_type: str,
     timeout_sec: int,
+    content: bytes | None = None,
+    content_path: Path | None = None,
 ) -> dict[str, Any]:
-    boundary = "zubotBoundary7MA4YWxkTrZu0gW"
-    parts = [
-        f"--{boundary}\r\n".encode("utf-8"),
-        b"Content-Type: application/json; charset=UTF-8\r\n\r\n",
-        json.dumps(metadata).encode("utf-8"),
-        b"\r\n",
-        f"--{boundary}\r\n".encode("utf-8"),
-        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8"),
-        content,
-        b"\r\n",
-        f"--{boundary}--\r\n".encode("utf-8"),
-    ]
-    body = b"".join(parts)
-
-    url = "https://www.googleapis.com/upload/drive/v3/files?uploadType=multipart&fields=id,name,webViewLink,mimeType,parents"
+    if (content is None) == (content_path is None):
+        raise ValueError("Provide exactly one of content or content_path.")
+
+    head, mid, trailer = _multipart_template(content_type)
+    preamble = b"".join((head, json.dumps(metadata).encode("utf-8"), mid))
+
+    content_length = content_path.stat().st_size if content_path is not None else len(content)
+
+    def body() -> Iterable[bytes]:
+        # Hand urllib an iterable body with an explicit Content-Length so the file
+        # content is written to the socket as-is instead of being copied into one
+        # contiguous request buffer.
+        if content_path is not None:
+            return itertools.chain((preamble,), _iter_file_chunks(content_path), (trailer,))
+        return (preamble, content, trailer)
+
+    url = f"https://www.googleapis.com/upload/drive/v3/files?uploadType=multipart&fields={UPLOAD_FIELDS}"
     headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/json",
-        "Content-Type": f"multipart/related; boundary={boundary}",
+        **_authorized_headers(access_token),
+        "Content-Type": MULTIPART_CONTENT_TYPE,
+        "Content-Length": str(len(preamble) + content_length + len(trailer)),
     }
-    req = Request(url, data=body, headers=headers, method="POST")
-    with urlopen(req, timeout=timeout_sec) as response:
-        raw = response.read().decode("utf-8")
+    raw = _send_with_retries(
+        lambda: Request(url, data=body(), headers=headers, method="POST"),
+        timeout_sec=timeout_sec,
+        idempotent=False,
+    )
     payload = json.loads(raw)
     if not isinstance(payload, dict):
         raise ValueError("Google Drive upload response must be a JSON object.")
     return payload
 
 
+def _committed_offset(headers: Message | None) -> int:
+    # Drive reports persisted bytes as `Range: bytes=0-<last>`; no header means nothing yet.
+    range_header = headers.get("Range") if headers is not None else None
+    if isinstance(range_header, str) and "-" in range_header:
+        return int(range_header.rsplit("-", 1)[1]) + 1
+    return 0
+
+
+def _query_resumable_offset(*, session_url: str, total: int, timeout_sec: int) -> tuple[int, dict[str, Any] | None]:
+    headers = {"Content-Length": "0", "Content-Range": f"bytes */{total}"}
+    try:
+        with urlopen(Request(session_url, data=b"", headers=headers, method="PUT"), timeout=timeout_sec) as response:
+            raw = response.read()
+    except HTTPError as exc:
+        if exc.code == 308:
+            return _committed_offset(exc.headers), None
+        raise
+    return total, json.loads(raw)
+
+
+def _upload_resumable(
+    *,
+    access_token: str,
+    metadata: dict[str, Any],
+    content_type: str,
+    timeout_sec: int,
+    content: bytes | None = None,
+    content_path: Path | None = None,
+) -> dict[str, Any]:
+    """Upload through a Drive resumable session in fixed-size chunks.
+
+    Failed chunks are not re-POSTed; the session is asked how many bytes it
+    committed and the upload resumes from there.
+    """
+    if (content is None) == (content_path is None):
+        raise ValueError("Provide exactly one of content or content_path.")
+
+    total = content_path.stat().st_size if content_path is not None else len(content)
+    start_url = f"https://www.googleapis.com/upload/drive/v3/files?uploadType=resumable&fields={UPLOAD_FIELDS}"
+    start_headers = {
+        **_authorized_headers(access_token),
+        "Content-Type": "application/json; charset=UTF-8",
+        "X-Upload-Content-Type": content_type,
+        "X-Upload-Content-Length": str(total),
+    }
+    encoded_metadata = json.dumps(metadata).encode("utf-8")
+    # An abandoned session is harmless, so starting one is safe to retry.
+    _body, response_headers = _open_with_retries(
+        lambda: Request(start_url, data=encoded_metadata, headers=start_headers, method="POST"),
+        timeout_sec=timeout_sec,
+        idempotent=True,
+    )
+    session_url = response_headers.get("Location")
+    if not isinstance(session_url, str) or not session_url:
+        raise ValueError("Google Drive resumable upload response missing session Location.")
+
+    view = memoryview(content) if content is not None else None
+    handle = content_path.open("rb") if content_path is not None else None
+    payload: dict[str, Any] | None = None
+    offset = 0
+    failures = 0
+    try:
+        while payload is None:
+            end = min(offset + RESUMABLE_CHUNK_BYTES, total)
+            if handle is not None:
+                handle.seek(offset)
+                chunk: bytes | memoryview = handle.read(end - offset)
+            else:
+                chunk = view[offset:end]
+            headers = {
+                "Content-Length": str(len(chunk)),
+                "Content-Range": f"bytes {offset}-{end - 1}/{total}",
+            }
+            try:
+                with urlopen(Request(session_url, data=chunk, headers=headers, method="PUT"), timeout=timeout_sec) as response:
+                    payload = json.loads(response.read())
+                continue
+            except HTTPError as exc:
+                if exc.code == 308:
+                    offset = _committed_offset(exc.headers)
+                    failures = 0
+                    continue
+                error: Exception = exc
+            except (URLError, TimeoutError, ConnectionError) as exc:
+                error = exc
+
+            failures += 1
+            if failures >= RETRY_ATTEMPTS or not _is_retryable_drive_error(error, idempotent=True):
+                raise error
+            sleep(_retry_delay_sec(error, failures))
+            offset, payload = _query_resumable_offset(session_url=session_url, total=total, timeout_sec=timeout_sec)
+    finally:
+        if handle is not None:
+            handle.close()
+
+    if not isinstance(payload, dict):
+        raise ValueError("Google Drive upload response must be a JSON object.")
+    return payload
+
+
 def _build_drive_list_url(query: str, fields: str) -> str:
-    params = urlencode({"q": query, "fields": fields, "pageSize": 50, "spaces": "drive"})
-    return f"https://www.googleapis.com/drive/v3/files?{params}"
+    return f"{_DRIVE_LIST_URL_PREFIX}q={quote(query, safe='')}&fields={quote(fields, safe='(),')}"
 
 
 def _escape_query_value(value: str) -> str:
-    return value.replace("'", "\\'")
+    return value.translate(_QUERY_ESCAPE_TABLE)
 
 
 def _find_child_folder_id(
@@ -162,12 +418,7 @@ def _find_child_folder_id(
     folder_name: str,
     timeout_sec: int,
 ) -> str | None:
-    escaped_name = _escape_query_value(folder_name)
-    escaped_parent = _escape_query_value(parent_id)
-    query = (
-        f"name = '{escaped_name}' and mimeType = '{FOLDER_MIME_TYPE}' "
-        f"and '{escaped_parent}' in parents and trashed = false"
-    )
+    query = _FOLDER_QUERY.substitute(n=_escape_query_value(folder_name), p=_escape_query_value(parent_id))
     url = _build_drive_list_url(query, "files(id,name)")
     payload = _fetch_json(url, _authorized_headers(access_token), timeout_sec)
     files = payload.get("files")
@@ -192,7 +443,7 @@ def _create_folder(
         "parents": [parent_id],
     }
     url = "https://www.googleapis.com/drive/v3/files?fields=id,name,mimeType,parents"
-    created = _post_json(url, _authorized_headers(access_token), payload, timeout_sec)
+    created = _post_json(url, _json_headers(access_token), payload, timeout_sec)
     folder_id = created.get("id")
     if not isinstance(folder_id, str) or not folder_id:
         raise ValueError("Folder creation response missing id.")
@@ -205,6 +456,7 @@ def _resolve_or_create_folder_path(*, access_token: str, path: str, timeout_sec:
         raise ValueError("destination_path must include at least one folder segment.")
 
     parent_id = "root"
+    leaf_created = False
     for segment in parts:
         found = _find_child_folder_id(
             access_token=access_token,
@@ -214,6 +466,7 @@ def _resolve_or_create_folder_path(*, access_token: str, path: str, timeout_sec:
         )
         if found:
             parent_id = found
+            leaf_created = False
             continue
         parent_id = _create_folder(
             access_token=access_token,
@@ -221,6 +474,10 @@ def _resolve_or_create_folder_path(*, access_token: str, path: str, timeout_sec:
             folder_name=segment,
             timeout_sec=timeout_sec,
         )
+        leaf_created = True
+    if leaf_created:
+        with _FOLDER_ID_CACHE_LOCK:
+            _FRESH_FOLDER_IDS.add(parent_id)
     return parent_id
 
 
@@ -242,6 +499,28 @@ def _resolve_destination_folder_id(
     settings: dict[str, Any],
     destination_path: str,
     timeout_sec: int,
+    use_cache: bool = True,
+) -> str:
+    if use_cache:
+        cached = _cached_folder_id(destination_path)
+        if cached:
+            return cached
+    folder_id = _resolve_destination_folder_id_uncached(
+        access_token=access_token,
+        settings=settings,
+        destination_path=destination_path,
+        timeout_sec=timeout_sec,
+    )
+    _store_folder_id(destination_path, folder_id)
+    return folder_id
+
+
+def _resolve_destination_folder_id_uncached(
+    *,
+    access_token: str,
+    settings: dict[str, Any],
+    destination_path: str,
+    timeout_sec: int,
 ) -> str:
     configured_folder_id = settings.get("cover_letters_folder_id")
     if configured_folder_id and destination_path == settings["default_upload_path"]:
@@ -258,110 +537,125 @@ def _resolve_destination_folder_id(
     return _resolve_or_create_folder_path(access_token=access_token, path=destination_path, timeout_sec=timeout_sec)
 
 
+def _file_exists_query(parent_id: str, filename: str) -> str:
+    return _FILE_QUERY.substitute(n=_escape_query_value(filename), p=_escape_query_value(parent_id))
+
+
 def _file_exists_in_folder(*, access_token: str, parent_id: str, filename: str, timeout_sec: int) -> bool:
-    escaped_name = _escape_query_value(filename)
-    escaped_parent = _escape_query_value(parent_id)
-    query = f"name = '{escaped_name}' and '{escaped_parent}' in parents and trashed = false"
-    url = _build_drive_list_url(query, "files(id,name)")
+    url = _build_drive_list_url(_file_exists_query(parent_id, filename), "files(id,name)")
     payload = _fetch_json(url, _authorized_headers(access_token), timeout_sec)
     files = payload.get("files")
     return isinstance(files, list) and len(files) > 0
 
 
-def _with_timestamp_suffix(filename: str) -> str:
-    stem = Path(filename).stem
-    ext = Path(filename).suffix or ".docx"
-    stamp = datetime.now(tz=UTC).strftime("%Y%m%d-%H%M%S")
-    return f"{stem}-{stamp}{ext}"
+def _parse_batch_response(raw: bytes, content_type: str) -> dict[str, tuple[int, Any]]:
+    """Split a `multipart/mixed` batch response into {content_id: (status, json_body)}."""
+    message = BytesParser().parsebytes(b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + raw)
+    if not message.is_multipart():
+        raise ValueError("Google Drive batch response is not multipart.")
+    parsed: dict[str, tuple[int, Any]] = {}
+    for part in message.get_payload():
+        content_id = str(part.get("Content-ID") or "").strip().strip("<>").removeprefix("response-")
+        inner = (part.get_payload(decode=True) or b"").replace(b"\r\n", b"\n")
+        head, _, body = inner.partition(b"\n\n")
+        status_fields = head.split(b"\n", 1)[0].split()
+        status = int(status_fields[1]) if len(status_fields) > 1 and status_fields[1].isdigit() else 0
+        try:
+            data = json.loads(body) if body.strip() else None
+        except ValueError:
+            data = None
+        parsed[content_id] = (status, data)
+    return parsed
+
+
+def _send_exists_batch(*, access_token: str, checks: list[tuple[str, str]], timeout_sec: int) -> list[bool | None]:
+    parts = []
+    for index, (parent_id, filename) in enumerate(checks):
+        path = _build_drive_list_url(_file_exists_query(parent_id, filename), "files(id)").removeprefix(DRIVE_API_ORIGIN)
+        parts.append(
+            f"--{BATCH_BOUNDARY}\r\nContent-Type: application/http\r\nContent-ID: <item{index}>\r\n\r\n"
+            f"GET {path}\r\n\r\n"
+        )
+    parts.append(f"--{BATCH_BOUNDARY}--\r\n")
+    body = "".join(parts).encode("utf-8")
+    headers = {**_authorized_headers(access_token), "Content-Type": f"multipart/mixed; boundary={BATCH_BOUNDARY}"}
+    # The batched sub-requests are all reads, so the batch POST is safe to retry.
+    raw, response_headers = _open_with_retries(
+        lambda: Request(DRIVE_BATCH_URL, data=body, headers=headers, method="POST"),
+        timeout_sec=timeout_sec,
+        idempotent=True,
+    )
+    responses = _parse_batch_response(raw, str(response_headers.get("Content-Type") or ""))
+    results: list[bool | None] = []
+    for index in range(len(checks)):
+        status, data = responses.get(f"item{index}", (0, None))
+        files = data.get("files") if isinstance(data, dict) else None
+        if not 200 <= status < 300 or not isinstance(files, list):
+            results.append(None)
+            continue
+        results.append(len(files) > 0)
+    return results
 
 
-def _error(source: str, message: str) -> dict[str, Any]:
-    return {"ok": False, "source": source, "error": message}
+def _batch_file_exists(*, access_token: str, checks: list[tuple[str, str]], timeout_sec: int) -> list[bool | None]:
+    """Run (parent_id, filename) conflict checks through Drive's batch endpoint.
 
+    Returns one entry per check; `None` marks a sub-request that failed.
+    """
+    results: list[bool | None] = []
+    for start in range(0, len(checks), DRIVE_BATCH_MAX_REQUESTS):
+        results.extend(
+            _send_exists_batch(
+                access_token=access_token,
+                checks=checks[start : start + DRIVE_BATCH_MAX_REQUESTS],
+                timeout_sec=timeout_sec,
+            )
+        )
+    return results
 
-def create_local_docx(
-    *,
-    filename: str,
-    title: str | None = None,
-    paragraphs: list[str],
-    output_dir: str = DEFAULT_OUTPUT_DIR,
-) -> dict[str, Any]:
-    source = "google_docx_local"
-
-    if not isinstance(paragraphs, list) or not paragraphs:
-        return _error("google_docx_local_error", "paragraphs must be a non-empty list of strings.")
-    if any(not isinstance(item, str) or not item.strip() for item in paragraphs):
-        return _error("google_docx_local_error", "paragraphs must contain non-empty strings.")
-
-    try:
-        safe_name = _ensure_docx_filename(filename)
-        output_dir_path = _resolve_repo_relative_path(output_dir)
-    except ValueError as exc:
-        return _error("google_docx_local_error", str(exc))
 
-    output_dir_path.mkdir(parents=True, exist_ok=True)
-    local_path = output_dir_path / safe_name
+def _with_timestamp_suffix(filename: str) -> str:
+    path = Path(filename)
+    stem, ext = path.stem, path.suffix or ".docx"
+    t = gmtime()
+    return f"{stem}-{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}-{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}{ext}"
 
-    try:
-        from docx import Document  # type: ignore
-    except Exception:
-        return _error("google_docx_local_error", "python-docx is not available in the environment.")
 
-    try:
-        doc = Document()
-        if isinstance(title, str) and title.strip():
-            doc.add_heading(title.strip(), level=1)
-        for paragraph in paragraphs:
-            doc.add_paragraph(paragraph.strip())
-        doc.save(str(local_path))
-    except Exception as exc:
-        return _error("google_docx_local_error", f"Failed to write DOCX: {exc}")
-
-    bytes_written = None
-    try:
-        bytes_written = local_path.stat().st_size
-    except OSError:
-        bytes_written = None
+def _error(source: str, message: str) -> dict[str, Any]:
+    return {"ok": False, "source": source, "error": message}
 
-    return {
-        "ok": True,
-        "source": source,
-        "local_path": str(local_path.relative_to(_repo_root())),
-        "filename": safe_name,
-        "bytes_written": bytes_written,
-        "error": None,
-    }
 
+def _normalize_destination(
+    settings: dict[str, Any],
+    destination_path: str | None,
+    destination_folder_id: str | None,
+) -> tuple[str, str | None]:
+    target_path = destination_path.strip() if isinstance(destination_path, str) and destination_path.strip() else settings["default_upload_path"]
+    target_folder_id = destination_folder_id.strip() if isinstance(destination_folder_id, str) and destination_folder_id.strip() else None
+    return target_path, target_folder_id
 
-def upload_file_to_google_drive(
-    *,
-    local_path: str,
-    destination_path: str = DEFAULT_UPLOAD_PATH,
-    destination_folder_id: str | None = None,
-    filename: str | None = None,
-) -> dict[str, Any]:
-    source = "google_drive_upload"
 
+def _prepare_local_upload(local_path: Any, filename: str | None) -> tuple[Path, str]:
+    """Validate an upload source file and return (resolved_path, drive_filename)."""
     if not isinstance(local_path, str) or not local_path.strip():
-        return _error("google_drive_upload_error", "local_path must be non-empty.")
-
-    try:
-        resolved_local_path = _resolve_repo_relative_path(local_path)
-    except ValueError as exc:
-        return _error("google_drive_upload_error", str(exc))
-
+        raise ValueError("local_path must be non-empty.")
+    resolved_local_path = _resolve_repo_relative_path(local_path)
     if not resolved_local_path.exists() or not resolved_local_path.is_file():
-        return _error("google_drive_upload_error", "local_path does not exist as a file.")
+        raise ValueError("local_path does not exist as a file.")
+    return resolved_local_path, _ensure_docx_filename(filename or resolved_local_path.name)
 
-    try:
-        desired_name = _ensure_docx_filename(filename or resolved_local_path.name)
-    except ValueError as exc:
-        return _error("google_drive_upload_error", str(exc))
 
+def _upload_to_drive(
+    *,
+    desired_name: str,
+    destination_path: str,
+    destination_folder_id: str | None,
+    content: bytes | None = None,
+    content_path: Path | None = None,
+) -> dict[str, Any]:
     settings = _google_drive_settings()
     timeout_sec = settings["timeout_sec"]
-    target_path = destination_path.strip() if isinstance(destination_path, str) and destination_path.strip() else settings["default_upload_path"]
-    target_folder_id = destination_folder_id.strip() if isinstance(destination_folder_id, str) and destination_folder_id.strip() else None
+    target_path, target_folder_id = _normalize_destination(settings, destination_path, destination_folder_id)
 
     token = get_google_access_token()
     if not token.get("ok"):
@@ -390,28 +684,74 @@ def upload_file_to_google_drive(
 
     final_name = desired_name
     try:
-        if _file_exists_in_folder(
-            access_token=access_token,
-            parent_id=folder_id,
-            filename=desired_name,
-            timeout_sec=timeout_sec,
-        ):
+        if _consume_fresh_folder(folder_id):
+            # The destination folder was created during resolution, so nothing in it can collide.
+            name_taken = False
+        else:
+            try:
+                name_taken = _file_exists_in_folder(
+                    access_token=access_token,
+                    parent_id=folder_id,
+                    filename=desired_name,
+                    timeout_sec=timeout_sec,
+                )
+            except Exception as exc:
+                if target_folder_id or not _is_stale_folder_error(exc):
+                    raise
+                # A cached folder id was deleted/moved since it was resolved; drop it
+                # and resolve the destination path again before giving up.
+                _invalidate_folder_id(target_path)
+                try:
+                    folder_id = _resolve_destination_folder_id(
+                        access_token=access_token,
+                        settings=settings,
+                        destination_path=target_path,
+                        timeout_sec=timeout_sec,
+                        use_cache=False,
+                    )
+                except Exception as resolve_exc:
+                    return _error("google_drive_path_resolve_error", f"Failed to resolve destination path: {resolve_exc}")
+                name_taken = not _consume_fresh_folder(folder_id) and _file_exists_in_folder(
+                    access_token=access_token,
+                    parent_id=folder_id,
+                    filename=desired_name,
+                    timeout_sec=timeout_sec,
+                )
+        if name_taken:
             final_name = _with_timestamp_suffix(desired_name)
     except Exception as exc:
         return _error("google_drive_upload_error", f"Failed to check filename conflict: {exc}")
 
-    content_type = mimetypes.guess_type(final_name)[0] or DOCX_MIME_TYPE
-    try:
-        content = resolved_local_path.read_bytes()
-    except OSError as exc:
-        return _error("google_drive_upload_error", f"Failed to read local file: {exc}")
+    return _upload_resolved(
+        access_token=access_token,
+        folder_id=folder_id,
+        final_name=final_name,
+        timeout_sec=timeout_sec,
+        content=content,
+        content_path=content_path,
+    )
+
 
+def _upload_resolved(
+    *,
+    access_token: str,
+    folder_id: str,
+    final_name: str,
+    timeout_sec: int,
+    content: bytes | None = None,
+    content_path: Path | None = None,
+) -> dict[str, Any]:
+    # `_ensure_docx_filename` guarantees a `.docx` name, so the MIME type is fixed.
+    content_type = DOCX_MIME_TYPE
     metadata = {"name": final_name, "parents": [folder_id], "mimeType": content_type}
+    content_size = content_path.stat().st_size if content_path is not None else len(content or b"")
+    upload = _upload_resumable if content_size > RESUMABLE_UPLOAD_THRESHOLD_BYTES else _upload_multipart
     try:
-        payload = _upload_multipart(
+        payload = upload(
             access_token=access_token,
             metadata=metadata,
             content=content,
+            content_path=content_path,
             content_type=content_type,
             timeout_sec=timeout_sec,
         )
@@ -425,7 +765,7 @@ def upload_file_to_google_drive(
 
     return {
         "ok": True,
-        "source": source,
+        "source": "google_drive_upload",
         "drive_file_id": drive_file_id,
         "drive_file_name": payload.get("name") or final_name,
         "destination_folder_id": folder_id,
@@ -435,6 +775,233 @@ def upload_file_to_google_drive(
     }
 
 
+def _build_docx_bytes(*, title: str | None, paragraphs: list[str]) -> bytes:
+    from docx import Document  # type: ignore
+
+    doc = Document()
+    if isinstance(title, str) and title.strip():
+        doc.add_heading(title.strip(), level=1)
+    for paragraph in paragraphs:
+        doc.add_paragraph(paragraph.strip())
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _write_local_docx(
+    *,
+    filename: str,
+    title: str | None,
+    paragraphs: list[str],
+    output_dir: str,
+) -> tuple[dict[str, Any], bytes | None]:
+    """Render and persist a DOCX, returning the tool payload and rendered bytes."""
+    source = "google_docx_local"
+
+    if not isinstance(paragraphs, list) or not paragraphs:
+        return _error("google_docx_local_error", "paragraphs must be a non-empty list of strings."), None
+    if any(not isinstance(item, str) or not item.strip() for item in paragraphs):
+        return _error("google_docx_local_error", "paragraphs must contain non-empty strings."), None
+
+    try:
+        safe_name = _ensure_docx_filename(filename)
+        output_dir_path = _resolve_repo_relative_path(output_dir)
+    except ValueError as exc:
+        return _error("google_docx_local_error", str(exc)), None
+
+    output_dir_path.mkdir(parents=True, exist_ok=True)
+    local_path = output_dir_path / safe_name
+
+    try:
+        content = _build_docx_bytes(title=title, paragraphs=paragraphs)
+    except ImportError:
+        return _error("google_docx_local_error", "python-docx is not available in the environment."), None
+    except Exception as exc:
+        return _error("google_docx_local_error", f"Failed to write DOCX: {exc}"), None
+
+    try:
+        local_path.write_bytes(content)
+    except OSError as exc:
+        return _error("google_docx_local_error", f"Failed to write DOCX: {exc}"), None
+
+    result = {
+        "ok": True,
+        "source": source,
+        "local_path": str(local_path.relative_to(_repo_root())),
+        "filename": safe_name,
+        "bytes_written": len(content),
+        "error": None,
+    }
+    return result, content
+
+
+def create_local_docx(
+    *,
+    filename: str,
+    title: str | None = None,
+    paragraphs: list[str],
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+) -> dict[str, Any]:
+    result, _ = _write_local_docx(filename=filename, title=title, paragraphs=paragraphs, output_dir=output_dir)
+    return result
+
+
+def upload_file_to_google_drive(
+    *,
+    local_path: str,
+    destination_path: str = DEFAULT_UPLOAD_PATH,
+    destination_folder_id: str | None = None,
+    filename: str | None = None,
+) -> dict[str, Any]:
+    try:
+        resolved_local_path, desired_name = _prepare_local_upload(local_path, filename)
+    except ValueError as exc:
+        return _error("google_drive_upload_error", str(exc))
+
+    return _upload_to_drive(
+        desired_name=desired_name,
+        destination_path=destination_path,
+        destination_folder_id=destination_folder_id,
+        content_path=resolved_local_path,
+    )
+
+
+def upload_files_to_google_drive(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Upload several local DOCX files, sharing folder resolution and conflict checks.
+
+    Each item accepts the `upload_file_to_google_drive` keyword arguments
+    (`local_path`, `destination_path`, `destination_folder_id`, `filename`).
+    Results are returned in input order with the same shape as the single-file
+    helper.
+    """
+    if not isinstance(items, list):
+        return [_error("google_drive_upload_error", "items must be a list of upload objects.")]
+
+    results: list[dict[str, Any]] = [{} for _ in items]
+    pending: list[tuple[int, Path, str, Any, Any]] = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = _error("google_drive_upload_error", "Each upload item must be an object.")
+            continue
+        try:
+            resolved_local_path, desired_name = _prepare_local_upload(item.get("local_path"), item.get("filename"))
+        except ValueError as exc:
+            results[index] = _error("google_drive_upload_error", str(exc))
+            continue
+        pending.append(
+            (
+                index,
+                resolved_local_path,
+                desired_name,
+                item.get("destination_path", DEFAULT_UPLOAD_PATH),
+                item.get("destination_folder_id"),
+            )
+        )
+    if not pending:
+        return results
+
+    settings = _google_drive_settings()
+    timeout_sec = settings["timeout_sec"]
+    token = get_google_access_token()
+    access_token = str(token.get("access_token") or "")
+    auth_error = None
+    if not token.get("ok"):
+        auth_error = f"Google auth failed: {token.get('error')}"
+    elif not access_token:
+        auth_error = "Google auth returned empty access token."
+    if auth_error:
+        for index, *_ in pending:
+            results[index] = _error("google_drive_upload_error", auth_error)
+        return results
+
+    # Phase 1: resolve each distinct destination once, then check every name in
+    # one batch request instead of one list call per file.
+    folders: dict[tuple[str | None, str], str | Exception] = {}
+    fresh_folders: set[str] = set()
+    planned: list[tuple[int, Path, str, str, str | None, str]] = []
+    for index, resolved_local_path, desired_name, destination_path, destination_folder_id in pending:
+        target_path, target_folder_id = _normalize_destination(settings, destination_path, destination_folder_id)
+        key = (target_folder_id, target_path)
+        if key not in folders:
+            try:
+                if target_folder_id:
+                    folders[key] = _validate_folder_id(
+                        access_token=access_token,
+                        folder_id=target_folder_id,
+                        timeout_sec=timeout_sec,
+                    )
+                else:
+                    folders[key] = _resolve_destination_folder_id(
+                        access_token=access_token,
+                        settings=settings,
+                        destination_path=target_path,
+                        timeout_sec=timeout_sec,
+                    )
+            except Exception as exc:
+                folders[key] = exc
+            else:
+                if _consume_fresh_folder(folders[key]):
+                    fresh_folders.add(folders[key])
+        folder_id = folders[key]
+        if isinstance(folder_id, Exception):
+            results[index] = _error("google_drive_path_resolve_error", f"Failed to resolve destination path: {folder_id}")
+            continue
+        planned.append((index, resolved_local_path, desired_name, target_path, target_folder_id, folder_id))
+
+    checks = [(folder_id, desired_name) for _, _, desired_name, _, _, folder_id in planned if folder_id not in fresh_folders]
+    try:
+        exists = _batch_file_exists(access_token=access_token, checks=checks, timeout_sec=timeout_sec) if checks else []
+    except Exception:
+        exists = [None] * len(checks)
+    exists_iter = iter(exists)
+
+    tasks: list[tuple[int, Callable[[], dict[str, Any]]]] = []
+    claimed: set[tuple[str, str]] = set()
+    for index, resolved_local_path, desired_name, target_path, target_folder_id, folder_id in planned:
+        name_taken = False if folder_id in fresh_folders else next(exists_iter)
+        if name_taken is None:
+            # The batched check failed for this file; the single-file flow retries
+            # it and re-resolves stale cached folders.
+            tasks.append(
+                (
+                    index,
+                    partial(
+                        _upload_to_drive,
+                        desired_name=desired_name,
+                        destination_path=target_path,
+                        destination_folder_id=target_folder_id,
+                        content_path=resolved_local_path,
+                    ),
+                )
+            )
+            continue
+        final_name = desired_name
+        if name_taken or (folder_id, desired_name) in claimed:
+            final_name = _with_timestamp_suffix(desired_name)
+        claimed.add((folder_id, desired_name))
+        tasks.append(
+            (
+                index,
+                partial(
+                    _upload_resolved,
+                    access_token=access_token,
+                    folder_id=folder_id,
+                    final_name=final_name,
+                    timeout_sec=timeout_sec,
+                    content_path=resolved_local_path,
+                ),
+            )
+        )
+
+    # Phase 2: media uploads cannot be batched; run a few in parallel.
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(BATCH_UPLOAD_MAX_WORKERS, len(tasks))) as pool:
+            futures = [(index, pool.submit(task)) for index, task in tasks]
+            for index, future in futures:
+                results[index] = future.result()
+    return results
+
+
 def create_and_upload_docx(
     *,
     filename: str,
@@ -443,8 +1010,8 @@ def create_and_upload_docx(
     output_dir: str = DEFAULT_OUTPUT_DIR,
     destination_path: str = DEFAULT_UPLOAD_PATH,
 ) -> dict[str, Any]:
-    local_result = create_local_docx(filename=filename, title=title, paragraphs=paragraphs, output_dir=output_dir)
-    if not local_result.get("ok"):
+    local_result, content = _write_local_docx(filename=filename, title=title, paragraphs=paragraphs, output_dir=output_dir)
+    if not local_result.get("ok") or content is None:
         return {
             "ok": False,
             "source": "google_docx_create_upload_error",
@@ -453,10 +1020,12 @@ def create_and_upload_docx(
             "upload": None,
         }
 
-    upload_result = upload_file_to_google_drive(
-        local_path=str(local_result.get("local_path") or ""),
+    # Upload the rendered bytes directly instead of reading the file back from disk.
+    upload_result = _upload_to_drive(
+        desired_name=str(local_result.get("filename") or ""),
         destination_path=destination_path,
-        filename=str(local_result.get("filename") or ""),
+        destination_folder_id=None,
+        content=content,
     )
     if not upload_result.get("ok"):
         return {
@@ -2,30 +2,49 @@
 
 from __future__ import annotations
 
-import json
+import re
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import date, datetime
+from functools import lru_cache
+from threading import Lock
 from typing import Any
 from urllib.parse import quote
-from urllib.request import Request, urlopen
 
-from src.zubot.core.config_loader import load_config
+from src.zubot.core.config_loader import cached_settings
 from src.zubot.core.job_applications_schema import (
     ALLOWED_STATUS_VALUES as SCHEMA_ALLOWED_STATUS_VALUES,
     DEFAULT_STATUS as SCHEMA_DEFAULT_STATUS,
     REQUIRED_SHEET_COLUMNS,
     SHEET_COLUMNS,
-    db_row_to_sheet_row,
+    canonicalize_sheet_row,
     normalize_sheet_row,
-    sheet_row_to_db_row,
 )
+from src.zubot.tools.kernel._http import get_json_conditional, post_json, post_json_discard
 from src.zubot.tools.kernel.google_auth import get_google_access_token
 
+SHEETS_API_BASE = "https://sheets.googleapis.com/v4/spreadsheets"
 DEFAULT_TIMEOUT_SEC = 15
 DEFAULT_SHEET_NAME = "Job Applications"
 DEFAULT_STATUS = SCHEMA_DEFAULT_STATUS
 ALLOWED_STATUS_VALUES = set(SCHEMA_ALLOWED_STATUS_VALUES)
 COLUMNS = list(SHEET_COLUMNS)
+_COLUMNS_TUPLE = tuple(COLUMNS)
 REQUIRED_COLUMNS = list(REQUIRED_SHEET_COLUMNS)
+DATE_FOUND_IDX = COLUMNS.index("Date Found")
+JOB_KEY_RANGE = f"{DEFAULT_SHEET_NAME}!A2:A"
+_RANGE_START_ROW_RE = re.compile(r"\$?[A-Za-z]+\$?(\d+)")
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}\Z")
+_US_DATE_RE = re.compile(r"[0-9]{1,2}/[0-9]{1,2}/[0-9]{4}\Z")
+
+# (spreadsheet_id, tab title) -> sheetId; tab ids are stable for the life of a tab.
+_SHEET_ID_CACHE: dict[tuple[str, str], int] = {}
+_SHEET_ID_CACHE_LOCK = Lock()
+# url -> (ETag, payload) for GETs; revalidated with If-None-Match on every call.
+# Callers get copies, so mutating returned rows cannot corrupt a cached payload.
+_RESPONSE_CACHE: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+_RESPONSE_CACHE_LOCK = Lock()
+RESPONSE_CACHE_MAX_ENTRIES = 8
 
 
 def _column_letters(one_based_index: int) -> str:
@@ -44,25 +63,21 @@ def _sheet_row_range(*, start_row: int) -> str:
     return f"{DEFAULT_SHEET_NAME}!A{start_row}:{end_col}"
 
 
-def _sheet_single_row_range(*, row_number: int) -> str:
-    end_col = _column_letters(len(COLUMNS))
-    return f"{DEFAULT_SHEET_NAME}!A{row_number}:{end_col}{row_number}"
+def _range_start_row(range_name: Any) -> int | None:
+    """Return the first row number of an A1 range such as `'Job Applications'!A7:M7`."""
+    if not isinstance(range_name, str):
+        return None
+    match = _RANGE_START_ROW_RE.match(range_name.rsplit("!", 1)[-1])
+    return int(match.group(1)) if match else None
 
 
-def _google_drive_settings() -> dict[str, Any]:
+@cached_settings
+def _google_drive_settings(payload: dict[str, Any]) -> dict[str, Any]:
     try:
-        payload = load_config()
-    except (FileNotFoundError, ValueError):
-        payload = {}
-
-    config: dict[str, Any] = {}
-    profiles = payload.get("tool_profiles")
-    if isinstance(profiles, dict):
-        user_specific = profiles.get("user_specific")
-        if isinstance(user_specific, dict):
-            block = user_specific.get("google_drive")
-            if isinstance(block, dict):
-                config = block
+        block = payload["tool_profiles"]["user_specific"]["google_drive"]
+    except (KeyError, TypeError):
+        block = None
+    config: dict[str, Any] = block if isinstance(block, dict) else {}
 
     spreadsheet_id = config.get("job_application_spreadsheet_id")
     timeout_sec = config.get("timeout_sec", DEFAULT_TIMEOUT_SEC)
@@ -72,6 +87,10 @@ def _google_drive_settings() -> dict[str, Any]:
     }
 
 
+def _reset_settings_cache() -> None:
+    _google_drive_settings.cache_clear()
+
+
 def _authorized_headers(access_token: str) -> dict[str, str]:
     return {
         "Authorization": f"Bearer {access_token}",
@@ -79,92 +98,95 @@ def _authorized_headers(access_token: str) -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=4)
+def _spreadsheet_url(spreadsheet_id: str) -> str:
+    # The spreadsheet id is fixed per config, so encode it once per id.
+    return f"{SHEETS_API_BASE}/{quote(spreadsheet_id, safe='')}"
+
+
+@lru_cache(maxsize=16)
+def _encoded_range(range_name: str) -> str:
+    return quote(range_name, safe="!:$")
+
+
 def _build_values_get_url(spreadsheet_id: str, range_name: str) -> str:
-    encoded_sheet = quote(spreadsheet_id, safe="")
-    encoded_range = quote(range_name, safe="!:$")
-    return f"https://sheets.googleapis.com/v4/spreadsheets/{encoded_sheet}/values/{encoded_range}"
+    return f"{_spreadsheet_url(spreadsheet_id)}/values/{_encoded_range(range_name)}"
 
 
 def _build_values_append_url(spreadsheet_id: str, range_name: str) -> str:
-    encoded_sheet = quote(spreadsheet_id, safe="")
-    encoded_range = quote(range_name, safe="!:$")
     return (
-        f"https://sheets.googleapis.com/v4/spreadsheets/{encoded_sheet}/values/{encoded_range}:append"
-        "?valueInputOption=RAW&insertDataOption=INSERT_ROWS"
+        f"{_spreadsheet_url(spreadsheet_id)}/values/{_encoded_range(range_name)}:append"
+        # Only the append location is read back, so mask the response down to it.
+        "?valueInputOption=RAW&insertDataOption=INSERT_ROWS&fields=updates(updatedRange,updatedRows)"
     )
 
 
-def _build_values_update_url(spreadsheet_id: str, range_name: str) -> str:
-    encoded_sheet = quote(spreadsheet_id, safe="")
-    encoded_range = quote(range_name, safe="!:$")
-    return f"https://sheets.googleapis.com/v4/spreadsheets/{encoded_sheet}/values/{encoded_range}?valueInputOption=RAW"
-
-
 def _build_batch_update_url(spreadsheet_id: str) -> str:
-    encoded_sheet = quote(spreadsheet_id, safe="")
-    return f"https://sheets.googleapis.com/v4/spreadsheets/{encoded_sheet}:batchUpdate"
+    return f"{_spreadsheet_url(spreadsheet_id)}:batchUpdate"
 
 
 def _build_sheet_metadata_url(spreadsheet_id: str) -> str:
-    encoded_sheet = quote(spreadsheet_id, safe="")
-    return f"https://sheets.googleapis.com/v4/spreadsheets/{encoded_sheet}?fields=sheets(properties(sheetId,title))"
+    return f"{_spreadsheet_url(spreadsheet_id)}?fields=sheets(properties(sheetId,title))"
 
 
 def _fetch_json(url: str, headers: dict[str, str], timeout_sec: int) -> dict[str, Any]:
-    request = Request(url, headers=headers, method="GET")
-    with urlopen(request, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
-    payload = json.loads(body)
+    with _RESPONSE_CACHE_LOCK:
+        cached = _RESPONSE_CACHE.get(url)
+    payload, etag, modified = get_json_conditional(url, headers, timeout_sec, etag=cached[0] if cached else None)
+    if not modified and cached is not None:
+        # 304: the sheet is unchanged since the cached read.
+        with _RESPONSE_CACHE_LOCK:
+            if url in _RESPONSE_CACHE:
+                _RESPONSE_CACHE.move_to_end(url)
+        return deepcopy(cached[1])
     if not isinstance(payload, dict):
         raise ValueError("Google Sheets response must be a JSON object.")
+    with _RESPONSE_CACHE_LOCK:
+        if etag:
+            _RESPONSE_CACHE[url] = (etag, deepcopy(payload))
+            _RESPONSE_CACHE.move_to_end(url)
+            while len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAX_ENTRIES:
+                _RESPONSE_CACHE.popitem(last=False)
+        else:
+            _RESPONSE_CACHE.pop(url, None)
     return payload
 
 
+def clear_response_cache() -> None:
+    """Drop ETag-validated GET responses (tests / forced refetch)."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
 def _post_json(url: str, headers: dict[str, str], payload: dict[str, Any], timeout_sec: int) -> dict[str, Any]:
-    request_headers = dict(headers)
-    request_headers["Content-Type"] = "application/json"
-    request = Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=request_headers,
-        method="POST",
-    )
-    with urlopen(request, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
-    data = json.loads(body)
+    data = post_json(url, headers, payload, timeout_sec)
     if not isinstance(data, dict):
         raise ValueError("Google Sheets response must be a JSON object.")
     return data
 
 
-def _put_json(url: str, headers: dict[str, str], payload: dict[str, Any], timeout_sec: int) -> dict[str, Any]:
-    request_headers = dict(headers)
-    request_headers["Content-Type"] = "application/json"
-    request = Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=request_headers,
-        method="PUT",
-    )
-    with urlopen(request, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
-    data = json.loads(body)
-    if not isinstance(data, dict):
-        raise ValueError("Google Sheets response must be a JSON object.")
-    return data
+def _post_json_fire(url: str, headers: dict[str, str], payload: dict[str, Any], timeout_sec: int) -> None:
+    # For writes whose response body is never used (batchUpdate deletes).
+    post_json_discard(url, headers, payload, timeout_sec)
 
 
+@lru_cache(maxsize=4096)
 def _parse_human_date(raw_value: str) -> date:
     value = raw_value.strip()
     if not value:
         raise ValueError("date cannot be empty")
-    if "/" in value:
-        return datetime.strptime(value, "%m/%d/%Y").date()
-    if "-" in value:
+    if _ISO_DATE_RE.match(value):
+        if len(value) == 10:
+            # Canonical ISO cells (what this tool writes) skip strptime's format parsing.
+            return date.fromisoformat(value)
         return datetime.strptime(value, "%Y-%m-%d").date()
+    if _US_DATE_RE.match(value):
+        return datetime.strptime(value, "%m/%d/%Y").date()
     raise ValueError("date must be in YYYY-MM-DD or MM/DD/YYYY format")
 
 
+# Sheet date cells repeat heavily (most rows share a handful of days).
+@lru_cache(maxsize=4096)
 def _normalize_date_string(raw_value: str | None) -> str | None:
     if raw_value is None:
         return None
@@ -175,10 +197,10 @@ def _normalize_date_string(raw_value: str | None) -> str | None:
 
 
 def _row_values_to_dict(row_values: list[Any]) -> dict[str, str]:
-    raw_row: dict[str, Any] = {}
-    for index, column in enumerate(COLUMNS):
-        raw_row[column] = row_values[index] if index < len(row_values) else ""
-    mapped = normalize_sheet_row(raw_row)
+    # Sheets trims trailing blank cells; pad so every column gets a value.
+    missing = len(_COLUMNS_TUPLE) - len(row_values)
+    padded = row_values + [""] * missing if missing > 0 else row_values
+    mapped = normalize_sheet_row(dict(zip(_COLUMNS_TUPLE, padded)))
 
     for field in ("Date Found", "Date Applied"):
         try:
@@ -190,38 +212,57 @@ def _row_values_to_dict(row_values: list[Any]) -> dict[str, str]:
     return mapped
 
 
-def _extract_job_keys(values_rows: list[list[Any]]) -> set[str]:
-    keys: set[str] = set()
-    for row in values_rows:
-        if not row:
-            continue
-        value = row[0]
-        key = str(value).strip() if value is not None else ""
-        if key:
-            keys.add(key)
-    return keys
+def _date_found_iso(row_values: list[Any]) -> str | None:
+    """Normalize just the `Date Found` cell of a raw sheet row; None when blank or unparseable."""
+    raw = row_values[DATE_FOUND_IDX] if DATE_FOUND_IDX < len(row_values) else None
+    try:
+        return _normalize_date_string(str(raw) if raw is not None else None)
+    except ValueError:
+        return None
+
 
+def _cell_key(value: Any) -> str:
+    return str(value).strip() if value is not None else ""
 
-def _find_job_key_rows(values_rows: list[list[Any]], job_key: str) -> list[int]:
+
+def _extract_job_keys(job_key_column: list[Any]) -> set[str]:
+    # Inline strip instead of `_cell_key`: this runs over every key on each append.
+    return {key for key in (str(value).strip() for value in job_key_column if value is not None) if key}
+
+
+def _find_job_key_rows(job_key_column: list[Any], job_key: str, *, limit: int | None = None) -> list[int]:
+    """Return sheet row numbers holding `job_key`, stopping after `limit` matches."""
     matches: list[int] = []
-    for idx, row in enumerate(values_rows):
-        if not row:
-            continue
-        value = str(row[0]).strip() if row[0] is not None else ""
-        if value == job_key:
-            # Data starts at row 2 because A1 is header.
-            matches.append(idx + 2)
+    # Data starts at row 2 because A1 is header.
+    for idx, value in enumerate(job_key_column, start=2):
+        if value == job_key or _cell_key(value) == job_key:
+            matches.append(idx)
+            if limit is not None and len(matches) >= limit:
+                break
     return matches
 
 
-def _find_first_available_row(values_rows: list[list[Any]]) -> int:
-    for idx, row in enumerate(values_rows, start=2):
-        values = row if isinstance(row, list) else []
-        job_key = str(values[0]).strip() if len(values) > 0 and values[0] is not None else ""
-        job_title = str(values[2]).strip() if len(values) > 2 and values[2] is not None else ""
-        if not job_key and not job_title:
-            return idx
-    return len(values_rows) + 2
+def _job_key_row_map(job_key_column: list[Any]) -> dict[str, list[int]]:
+    """Map each JobKey to every sheet row number (1-based, header is row 1) holding it."""
+    rows_by_key: dict[str, list[int]] = {}
+    for idx, value in enumerate(job_key_column, start=2):
+        key = _cell_key(value)
+        if key:
+            rows_by_key.setdefault(key, []).append(idx)
+    return rows_by_key
+
+
+def _delete_row_request(sheet_id: int, row_number: int) -> dict[str, Any]:
+    return {
+        "deleteDimension": {
+            "range": {
+                "sheetId": sheet_id,
+                "dimension": "ROWS",
+                "startIndex": row_number - 1,
+                "endIndex": row_number,
+            }
+        }
+    }
 
 
 def _get_sheet_id(payload: dict[str, Any], title: str) -> int | None:
@@ -242,13 +283,35 @@ def _get_sheet_id(payload: dict[str, Any], title: str) -> int | None:
     return None
 
 
+def _resolve_sheet_id(*, spreadsheet_id: str, title: str, headers: dict[str, str], timeout_sec: int) -> int | None:
+    """Return the tab's sheetId, fetching spreadsheet metadata only on a cache miss."""
+    cache_key = (spreadsheet_id, title)
+    with _SHEET_ID_CACHE_LOCK:
+        cached = _SHEET_ID_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    sheet_id = _get_sheet_id(_fetch_json(_build_sheet_metadata_url(spreadsheet_id), headers, timeout_sec), title)
+    if sheet_id is not None:
+        with _SHEET_ID_CACHE_LOCK:
+            _SHEET_ID_CACHE[cache_key] = sheet_id
+    return sheet_id
+
+
+def _forget_sheet_id(spreadsheet_id: str, title: str) -> None:
+    with _SHEET_ID_CACHE_LOCK:
+        _SHEET_ID_CACHE.pop((spreadsheet_id, title), None)
+
+
+def clear_sheet_id_cache() -> None:
+    """Drop cached sheetId lookups (tests / after recreating a tab)."""
+    with _SHEET_ID_CACHE_LOCK:
+        _SHEET_ID_CACHE.clear()
+
+
 def _row_dict_to_sheet_values(row: dict[str, Any]) -> list[str]:
     normalized = normalize_sheet_row(row)
-    output: list[str] = []
-    for column in COLUMNS:
-        value = normalized.get(column, "")
-        output.append(str(value) if value is not None else "")
-    return output
+    # `normalize_sheet_row` already yields a string for every column.
+    return [normalized[column] for column in _COLUMNS_TUPLE]
 
 
 def _error_payload(source: str, message: str) -> dict[str, Any]:
@@ -283,7 +346,8 @@ def list_job_app_rows(*, start_date: str | None = None, end_date: str | None = N
             "error": f"Google auth failed: {token.get('error')}",
         }
 
-    url = _build_values_get_url(spreadsheet_id, _sheet_row_range(start_row=1))
+    # `fields=values` drops the echoed range/majorDimension from the response.
+    url = f"{_build_values_get_url(spreadsheet_id, _sheet_row_range(start_row=1))}?fields=values"
     try:
         payload = _fetch_json(url, _authorized_headers(str(token["access_token"])), settings["timeout_sec"])
     except Exception as exc:
@@ -293,23 +357,21 @@ def list_job_app_rows(*, start_date: str | None = None, end_date: str | None = N
     values_rows = values if isinstance(values, list) else []
     data_rows = values_rows[1:] if values_rows else []
 
+    filtering = bool(start_iso or end_iso)
     mapped_rows: list[dict[str, str]] = []
     for raw_row in data_rows:
         row_values = raw_row if isinstance(raw_row, list) else []
-        mapped = _row_values_to_dict(row_values)
-
-        try:
-            date_found_iso = _normalize_date_string(mapped.get("Date Found"))
-        except ValueError:
-            date_found_iso = None
-        if start_iso or end_iso:
+        if filtering:
+            # Filter on the raw date cell first so rejected rows are never fully mapped.
+            date_found_iso = _date_found_iso(row_values)
             if date_found_iso is None:
                 continue
             if start_iso and date_found_iso < start_iso:
                 continue
             if end_iso and date_found_iso > end_iso:
                 continue
-        mapped_rows.append(db_row_to_sheet_row(sheet_row_to_db_row(mapped)))
+        mapped = _row_values_to_dict(row_values)
+        mapped_rows.append(canonicalize_sheet_row(mapped))
 
     return {
         "ok": True,
@@ -325,31 +387,46 @@ def list_job_app_rows(*, start_date: str | None = None, end_date: str | None = N
     }
 
 
-def append_job_app_row(*, row: dict[str, Any]) -> dict[str, Any]:
-    source = "google_sheets_job_apps_append"
+def _prepare_append_row(row: Any) -> tuple[dict[str, Any] | None, str | None]:
+    """Validate and normalize one row for append; returns (row, None) or (None, error)."""
     if not isinstance(row, dict):
-        return _error_payload(source, "row must be an object.")
+        return None, "row must be an object."
 
     normalized_row: dict[str, Any] = normalize_sheet_row(row)
     for required in REQUIRED_COLUMNS:
         value = normalized_row.get(required)
         if not isinstance(value, str) or not value.strip():
-            return _error_payload(source, f"row.{required} must be non-empty.")
+            return None, f"row.{required} must be non-empty."
 
     try:
         normalized_row["Date Found"] = _normalize_date_string(str(normalized_row.get("Date Found"))) or ""
         date_applied = _normalize_date_string(str(normalized_row.get("Date Applied", "")))
         normalized_row["Date Applied"] = date_applied or ""
     except ValueError as exc:
-        return _error_payload(source, f"Invalid row date: {exc}")
+        return None, f"Invalid row date: {exc}"
 
     status = str(normalized_row.get("Status") or "").strip() or DEFAULT_STATUS
     if status not in ALLOWED_STATUS_VALUES:
-        return _error_payload(
-            source,
-            "row.Status must be one of: Recommend Apply, Recommend Maybe, Applied, Interviewing, Offer, Rejected, Closed.",
-        )
+        return None, "row.Status must be one of: Recommend Apply, Recommend Maybe, Applied, Interviewing, Offer, Rejected, Closed."
     normalized_row["Status"] = status
+    return normalized_row, None
+
+
+def _fetch_job_key_column(spreadsheet_id: str, headers: dict[str, str], timeout_sec: int) -> list[Any]:
+    # Only the JobKey column is needed for dedupe/lookups, not the full grid. Reading it
+    # column-major returns one flat list (blank cells as "") instead of one list per row.
+    url = f"{_build_values_get_url(spreadsheet_id, JOB_KEY_RANGE)}?majorDimension=COLUMNS&fields=values"
+    values = _fetch_json(url, headers, timeout_sec).get("values")
+    if not isinstance(values, list) or not values or not isinstance(values[0], list):
+        return []
+    return values[0]
+
+
+def append_job_app_row(*, row: dict[str, Any]) -> dict[str, Any]:
+    source = "google_sheets_job_apps_append"
+    normalized_row, row_error = _prepare_append_row(row)
+    if normalized_row is None:
+        return _error_payload(source, str(row_error))
 
     settings = _google_drive_settings()
     spreadsheet_id = settings["spreadsheet_id"]
@@ -366,30 +443,29 @@ def append_job_app_row(*, row: dict[str, Any]) -> dict[str, Any]:
 
     headers = _authorized_headers(str(token["access_token"]))
 
-    rows_url = _build_values_get_url(spreadsheet_id, _sheet_row_range(start_row=2))
     try:
-        rows_payload = _fetch_json(rows_url, headers, settings["timeout_sec"])
+        existing_keys = _extract_job_keys(_fetch_job_key_column(spreadsheet_id, headers, settings["timeout_sec"]))
     except Exception as exc:
         return _error_payload(source, f"Failed to read existing rows: {exc}")
 
-    values = rows_payload.get("values")
-    values_rows = values if isinstance(values, list) else []
-    existing_keys = _extract_job_keys(values_rows)
     new_key = str(normalized_row["JobKey"]).strip()
     if new_key in existing_keys:
         return _error_payload(source, f"Duplicate JobKey: {new_key}")
 
-    target_row = _find_first_available_row(values_rows)
-    update_url = _build_values_update_url(spreadsheet_id, _sheet_single_row_range(row_number=target_row))
+    # values:append places the row after the sheet's table in one atomic write.
+    append_url = _build_values_append_url(spreadsheet_id, f"{DEFAULT_SHEET_NAME}!A1")
     body = {"values": [_row_dict_to_sheet_values(normalized_row)]}
 
     try:
-        write_payload = _put_json(update_url, headers, body, settings["timeout_sec"])
+        write_payload = _post_json(append_url, headers, body, settings["timeout_sec"])
     except Exception as exc:
         return _error_payload(source, f"Failed to write row: {exc}")
 
-    updated_rows = write_payload.get("updatedRows")
-    updated_range = write_payload.get("updatedRange")
+    updates = write_payload.get("updates")
+    updates = updates if isinstance(updates, dict) else {}
+    updated_rows = updates.get("updatedRows")
+    updated_range = updates.get("updatedRange")
+    target_row = _range_start_row(updated_range)
 
     return {
         "ok": True,
@@ -397,7 +473,85 @@ def append_job_app_row(*, row: dict[str, Any]) -> dict[str, Any]:
         "updated_range": updated_range,
         "updated_rows": updated_rows,
         "target_row": target_row,
-        "row": db_row_to_sheet_row(sheet_row_to_db_row(normalized_row)),
+        "row": canonicalize_sheet_row(normalized_row),
+        "error": None,
+    }
+
+
+def append_job_app_rows(*, rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Append many rows with one JobKey read and one `values:append` write.
+
+    Invalid or duplicate rows (against the sheet or earlier rows in the same
+    call) are reported per index and skipped; the rest are written together.
+    """
+    source = "google_sheets_job_apps_append_batch"
+    if not isinstance(rows, list) or not rows:
+        return _error_payload(source, "rows must be a non-empty list of objects.")
+
+    results: list[dict[str, Any]] = []
+    prepared: list[tuple[int, dict[str, Any]]] = []
+    for index, row in enumerate(rows):
+        normalized_row, row_error = _prepare_append_row(row)
+        if normalized_row is None:
+            results.append({"index": index, "ok": False, "error": row_error})
+            continue
+        results.append({"index": index, "ok": True, "error": None})
+        prepared.append((index, normalized_row))
+
+    settings = _google_drive_settings()
+    spreadsheet_id = settings["spreadsheet_id"]
+    if not spreadsheet_id:
+        return _error_payload(source, "Missing tool_profiles.user_specific.google_drive.job_application_spreadsheet_id.")
+
+    token = get_google_access_token()
+    if not token.get("ok"):
+        return {
+            "ok": False,
+            "source": source,
+            "error": f"Google auth failed: {token.get('error')}",
+        }
+
+    headers = _authorized_headers(str(token["access_token"]))
+    try:
+        existing_keys = _extract_job_keys(_fetch_job_key_column(spreadsheet_id, headers, settings["timeout_sec"]))
+    except Exception as exc:
+        return _error_payload(source, f"Failed to read existing rows: {exc}")
+
+    to_write: list[tuple[int, dict[str, Any]]] = []
+    for index, normalized_row in prepared:
+        new_key = str(normalized_row["JobKey"]).strip()
+        if new_key in existing_keys:
+            results[index].update(ok=False, error=f"Duplicate JobKey: {new_key}")
+            continue
+        existing_keys.add(new_key)
+        to_write.append((index, normalized_row))
+
+    updated_range = None
+    updated_rows = 0
+    if to_write:
+        append_url = _build_values_append_url(spreadsheet_id, f"{DEFAULT_SHEET_NAME}!A1")
+        body = {"values": [_row_dict_to_sheet_values(normalized_row) for _, normalized_row in to_write]}
+        try:
+            write_payload = _post_json(append_url, headers, body, settings["timeout_sec"])
+        except Exception as exc:
+            return _error_payload(source, f"Failed to write rows: {exc}")
+
+        updates = write_payload.get("updates")
+        updates = updates if isinstance(updates, dict) else {}
+        updated_range = updates.get("updatedRange")
+        updated_rows = updates.get("updatedRows")
+        start_row = _range_start_row(updated_range)
+        for offset, (index, normalized_row) in enumerate(to_write):
+            results[index]["target_row"] = start_row + offset if start_row is not None else None
+            results[index]["row"] = canonicalize_sheet_row(normalized_row)
+
+    return {
+        "ok": True,
+        "source": source,
+        "results": results,
+        "appended_count": len(to_write),
+        "updated_range": updated_range,
+        "updated_rows": updated_rows,
         "error": None,
     }
 
@@ -422,49 +576,39 @@ def delete_job_app_row_by_key(*, job_key: str) -> dict[str, Any]:
         }
 
     headers = _authorized_headers(str(token["access_token"]))
-    keys_url = _build_values_get_url(spreadsheet_id, f"{DEFAULT_SHEET_NAME}!A2:A")
     try:
-        key_payload = _fetch_json(keys_url, headers, settings["timeout_sec"])
+        job_key_column = _fetch_job_key_column(spreadsheet_id, headers, settings["timeout_sec"])
     except Exception as exc:
         return _error_payload(source, f"Failed to read existing JobKey values: {exc}")
 
-    values = key_payload.get("values")
-    rows = values if isinstance(values, list) else []
-    matches = _find_job_key_rows(rows, key)
+    # Two hits are enough to know the key is duplicated.
+    matches = _find_job_key_rows(job_key_column, key, limit=2)
     if not matches:
         return _error_payload(source, f"JobKey not found: {key}")
     if len(matches) > 1:
         return _error_payload(source, f"Duplicate JobKey values found for delete: {key}")
 
-    metadata_url = _build_sheet_metadata_url(spreadsheet_id)
     try:
-        metadata_payload = _fetch_json(metadata_url, headers, settings["timeout_sec"])
+        sheet_id = _resolve_sheet_id(
+            spreadsheet_id=spreadsheet_id,
+            title=DEFAULT_SHEET_NAME,
+            headers=headers,
+            timeout_sec=settings["timeout_sec"],
+        )
     except Exception as exc:
         return _error_payload(source, f"Failed to read sheet metadata: {exc}")
 
-    sheet_id = _get_sheet_id(metadata_payload, DEFAULT_SHEET_NAME)
     if sheet_id is None:
         return _error_payload(source, f"Sheet tab not found: {DEFAULT_SHEET_NAME}")
 
     row_number = matches[0]
-    delete_body = {
-        "requests": [
-            {
-                "deleteDimension": {
-                    "range": {
-                        "sheetId": sheet_id,
-                        "dimension": "ROWS",
-                        "startIndex": row_number - 1,
-                        "endIndex": row_number,
-                    }
-                }
-            }
-        ]
-    }
+    delete_body = {"requests": [_delete_row_request(sheet_id, row_number)]}
     delete_url = _build_batch_update_url(spreadsheet_id)
     try:
-        _post_json(delete_url, headers, delete_body, settings["timeout_sec"])
+        _post_json_fire(delete_url, headers, delete_body, settings["timeout_sec"])
     except Exception as exc:
+        # A recreated tab gets a new sheetId; don't keep reusing a stale one.
+        _forget_sheet_id(spreadsheet_id, DEFAULT_SHEET_NAME)
         return _error_payload(source, f"Failed to delete row: {exc}")
 
     return {
@@ -474,3 +618,85 @@ def delete_job_app_row_by_key(*, job_key: str) -> dict[str, Any]:
         "deleted_row_number": row_number,
         "error": None,
     }
+
+
+def delete_job_app_rows_by_keys(*, keys: list[str]) -> dict[str, Any]:
+    """Delete several rows by JobKey with one key read, one metadata read and one batchUpdate.
+
+    Missing or duplicated keys are reported per key and left untouched.
+    """
+    source = "google_sheets_job_apps_delete_batch"
+    if not isinstance(keys, list) or not keys:
+        return _error_payload(source, "keys must be a non-empty list of strings.")
+
+    settings = _google_drive_settings()
+    spreadsheet_id = settings["spreadsheet_id"]
+    if not spreadsheet_id:
+        return _error_payload(source, "Missing tool_profiles.user_specific.google_drive.job_application_spreadsheet_id.")
+
+    token = get_google_access_token()
+    if not token.get("ok"):
+        return {
+            "ok": False,
+            "source": source,
+            "error": f"Google auth failed: {token.get('error')}",
+        }
+
+    headers = _authorized_headers(str(token["access_token"]))
+    try:
+        rows_by_key = _job_key_row_map(_fetch_job_key_column(spreadsheet_id, headers, settings["timeout_sec"]))
+    except Exception as exc:
+        return _error_payload(source, f"Failed to read existing JobKey values: {exc}")
+
+    results: list[dict[str, Any]] = []
+    rows_to_delete: list[int] = []
+    seen: set[str] = set()
+    for raw_key in keys:
+        key = raw_key.strip() if isinstance(raw_key, str) else ""
+        result: dict[str, Any] = {"job_key": key, "ok": False, "deleted_row_number": None, "error": None}
+        results.append(result)
+        matches = rows_by_key.get(key, [])
+        if not key:
+            result["error"] = "job_key must be non-empty."
+        elif key in seen:
+            result["error"] = f"JobKey listed more than once: {key}"
+        elif not matches:
+            result["error"] = f"JobKey not found: {key}"
+        elif len(matches) > 1:
+            result["error"] = f"Duplicate JobKey values found for delete: {key}"
+        else:
+            result.update(ok=True, deleted_row_number=matches[0])
+            rows_to_delete.append(matches[0])
+        seen.add(key)
+
+    if rows_to_delete:
+        try:
+            sheet_id = _resolve_sheet_id(
+                spreadsheet_id=spreadsheet_id,
+                title=DEFAULT_SHEET_NAME,
+                headers=headers,
+                timeout_sec=settings["timeout_sec"],
+            )
+        except Exception as exc:
+            return _error_payload(source, f"Failed to read sheet metadata: {exc}")
+
+        if sheet_id is None:
+            return _error_payload(source, f"Sheet tab not found: {DEFAULT_SHEET_NAME}")
+
+        # Delete bottom-up so earlier deletes don't shift the indices of later ones.
+        delete_body = {
+            "requests": [_delete_row_request(sheet_id, row_number) for row_number in sorted(rows_to_delete, reverse=True)]
+        }
+        try:
+            _post_json_fire(_build_batch_update_url(spreadsheet_id), headers, delete_body, settings["timeout_sec"])
+        except Exception as exc:
+            _forget_sheet_id(spreadsheet_id, DEFAULT_SHEET_NAME)
+            return _error_payload(source, f"Failed to delete rows: {exc}")
+
+    return {
+        "ok": True,
+        "source": source,
+        "results": results,
+        "deleted_count": len(rows_to_delete),
+        "error": None,
+    }
@@ -2,77 +2,91 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.parse import quote_plus, urlencode
 
-from src.zubot.core.config_loader import load_config
+from src.zubot.core.config_loader import cached_settings
 from src.zubot.core.provider_queue import execute_provider_call, provider_queue_stats
+from src.zubot.tools.kernel._http import TTLCache, cached_json, get_json_cached
 
 DEFAULT_HASDATA_BASE_URL = "https://api.hasdata.com"
 DEFAULT_INDEED_DOMAIN = "www.indeed.com"
 DEFAULT_INDEED_SORT = "date"
+_BASE_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+_FIXED_LISTING_QUERY = urlencode({"sort": DEFAULT_INDEED_SORT, "domain": DEFAULT_INDEED_DOMAIN})
 
+DEFAULT_CACHE_TTL_SEC = 900.0
 
-def _hasdata_settings() -> dict[str, Any]:
+# Listing/detail URLs carry no key (it is a header), and repeat lookups are billed calls.
+_RESPONSE_CACHE = TTLCache(maxsize=256)
+
+
+@cached_settings
+def _hasdata_settings(payload: dict[str, Any]) -> dict[str, Any]:
     try:
-        payload = load_config()
-    except (FileNotFoundError, ValueError):
-        payload = {}
-
-    config: dict[str, Any] = {}
-    profiles = payload.get("tool_profiles")
-    if isinstance(profiles, dict):
-        user_specific = profiles.get("user_specific")
-        if isinstance(user_specific, dict):
-            nested = user_specific.get("has_data")
-            if isinstance(nested, dict):
-                config = nested
+        nested = payload["tool_profiles"]["user_specific"]["has_data"]
+    except (KeyError, TypeError):
+        nested = None
+    config: dict[str, Any] = nested if isinstance(nested, dict) else {}
     if not config:
         # Backward compatibility for pre-profile configs.
         block = payload.get("has_data")
         if isinstance(block, dict):
             config = block
-    api_key = config.get("api_key")
 
+    api_key = config.get("api_key")
+    min_interval = config.get("queue_min_interval_sec", 0.0)
+    max_retries = config.get("queue_max_retries", 1)
+    retry_backoff = config.get("queue_retry_backoff_sec", 1.0)
+    jitter = config.get("queue_jitter_sec", 0.0)
+    cache_ttl = config.get("cache_ttl_sec", DEFAULT_CACHE_TTL_SEC)
+    base_url = str(config.get("base_url", DEFAULT_HASDATA_BASE_URL)).rstrip("/")
     return {
-        "base_url": str(config.get("base_url", DEFAULT_HASDATA_BASE_URL)).rstrip("/"),
+        "base_url": base_url,
+        # Endpoint prefixes are fixed per config; calls only append their encoded params.
+        "listing_endpoint": f"{base_url}/scrape/indeed/listing?",
+        "job_endpoint": f"{base_url}/scrape/indeed/job?url=",
         "api_key": api_key if isinstance(api_key, str) else None,
         "timeout_sec": int(config.get("timeout_sec", 15)),
-        "queue_min_interval_sec": float(config.get("queue_min_interval_sec", 0.0))
-        if isinstance(config.get("queue_min_interval_sec", 0.0), (int, float))
-        else 0.0,
-        "queue_max_retries": int(config.get("queue_max_retries", 1))
-        if isinstance(config.get("queue_max_retries", 1), int)
-        else 1,
-        "queue_retry_backoff_sec": float(config.get("queue_retry_backoff_sec", 1.0))
-        if isinstance(config.get("queue_retry_backoff_sec", 1.0), (int, float))
-        else 1.0,
-        "queue_jitter_sec": float(config.get("queue_jitter_sec", 0.0))
-        if isinstance(config.get("queue_jitter_sec", 0.0), (int, float))
-        else 0.0,
+        "queue_min_interval_sec": float(min_interval) if isinstance(min_interval, (int, float)) else 0.0,
+        "queue_max_retries": int(max_retries) if isinstance(max_retries, int) else 1,
+        "queue_retry_backoff_sec": float(retry_backoff) if isinstance(retry_backoff, (int, float)) else 1.0,
+        "queue_jitter_sec": float(jitter) if isinstance(jitter, (int, float)) else 0.0,
+        "cache_ttl_sec": float(cache_ttl) if isinstance(cache_ttl, (int, float)) else DEFAULT_CACHE_TTL_SEC,
     }
 
 
+def _reset_settings_cache() -> None:
+    _hasdata_settings.cache_clear()
+
+
+def clear_response_cache() -> None:
+    """Drop cached HasData responses (tests / forced refresh)."""
+    _RESPONSE_CACHE.clear()
+
+
 def _fetch_json(url: str, headers: dict[str, str], timeout_sec: int) -> dict[str, Any]:
-    req = Request(url, headers=headers, method="GET")
-    with urlopen(req, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
-    payload = json.loads(body)
+    ttl_sec = _hasdata_settings()["cache_ttl_sec"]
+    payload = get_json_cached(url, headers, timeout_sec, cache=_RESPONSE_CACHE, ttl_sec=ttl_sec)
     if not isinstance(payload, dict):
         raise ValueError("HasData response must be a JSON object.")
     return payload
 
 
+def _input_error(source: str, message: str) -> dict[str, Any]:
+    return {"ok": False, "provider": "hasdata", "source": source, "error": message}
+
+
+# Validation failures are fixed payloads; callers get a copy of the template.
+_EMPTY_KEYWORD_ERROR = _input_error("hasdata_indeed_listing", "keyword must be non-empty.")
+_EMPTY_LOCATION_ERROR = _input_error("hasdata_indeed_listing", "location must be non-empty.")
+_EMPTY_URL_ERROR = _input_error("hasdata_indeed_job", "url must be non-empty.")
+
+
 def _missing_key_payload(source: str) -> dict[str, Any]:
-    return {
-        "ok": False,
-        "provider": "hasdata",
-        "source": source,
-        "error": "Missing `tool_profiles.user_specific.has_data.api_key` in config.",
-    }
+    return _input_error(source, "Missing `tool_profiles.user_specific.has_data.api_key` in config.")
 
 
 def _is_retryable_hasdata_error(exc: Exception) -> bool:
@@ -84,6 +98,26 @@ def _is_retryable_hasdata_error(exc: Exception) -> bool:
     return False
 
 
+def _queued_fetch(url: str, headers: dict[str, str], settings: dict[str, Any]) -> dict[str, Any]:
+    """Fetch `url` through the `hasdata` provider queue unless a fresh cached response answers it.
+
+    Cache hits skip the queue, so they neither wait out its pacing nor count as calls;
+    their `queue` is None.
+    """
+    cached = cached_json(url, cache=_RESPONSE_CACHE, ttl_sec=settings["cache_ttl_sec"])
+    if isinstance(cached, dict):
+        return {"ok": True, "value": cached, "queue": None}
+    return execute_provider_call(
+        group="hasdata",
+        fn=lambda: _fetch_json(url, headers=headers, timeout_sec=settings["timeout_sec"]),
+        min_interval_sec=settings["queue_min_interval_sec"],
+        jitter_sec=settings["queue_jitter_sec"],
+        max_retries=settings["queue_max_retries"],
+        retry_backoff_sec=settings["queue_retry_backoff_sec"],
+        is_retryable=_is_retryable_hasdata_error,
+    )
+
+
 def get_indeed_jobs(
     *,
     keyword: str,
@@ -101,44 +135,17 @@ def get_indeed_jobs(
     settings = _hasdata_settings()
 
     if not keyword.strip():
-        return {
-            "ok": False,
-            "provider": "hasdata",
-            "source": source,
-            "error": "keyword must be non-empty.",
-        }
+        return dict(_EMPTY_KEYWORD_ERROR)
     if not location.strip():
-        return {
-            "ok": False,
-            "provider": "hasdata",
-            "source": source,
-            "error": "location must be non-empty.",
-        }
+        return dict(_EMPTY_LOCATION_ERROR)
     if not settings["api_key"]:
         return _missing_key_payload(source)
 
-    params = {
-        "keyword": keyword,
-        "location": location,
-        "sort": DEFAULT_INDEED_SORT,
-        "domain": DEFAULT_INDEED_DOMAIN,
-    }
-    url = f"{settings['base_url']}/scrape/indeed/listing?{urlencode(params)}"
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "x-api-key": settings["api_key"],
-    }
+    query = urlencode({"keyword": keyword, "location": location})
+    url = f"{settings['listing_endpoint']}{query}&{_FIXED_LISTING_QUERY}"
+    headers = {**_BASE_HEADERS, "x-api-key": settings["api_key"]}
 
-    queued = execute_provider_call(
-        group="hasdata",
-        fn=lambda: _fetch_json(url, headers=headers, timeout_sec=settings["timeout_sec"]),
-        min_interval_sec=settings["queue_min_interval_sec"],
-        jitter_sec=settings["queue_jitter_sec"],
-        max_retries=settings["queue_max_retries"],
-        retry_backoff_sec=settings["queue_retry_backoff_sec"],
-        is_retryable=_is_retryable_hasdata_error,
-    )
+    queued = _queued_fetch(url, headers, settings)
     if not queued.get("ok"):
         exc = queued.get("error")
         return {
@@ -190,32 +197,14 @@ def get_indeed_job_detail(*, url: str) -> dict[str, Any]:
     settings = _hasdata_settings()
     job_url = url.strip()
     if not job_url:
-        return {
-            "ok": False,
-            "provider": "hasdata",
-            "source": source,
-            "error": "url must be non-empty.",
-        }
+        return dict(_EMPTY_URL_ERROR)
     if not settings["api_key"]:
         return _missing_key_payload(source)
 
-    params = {"url": job_url}
-    request_url = f"{settings['base_url']}/scrape/indeed/job?{urlencode(params)}"
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "x-api-key": settings["api_key"],
-    }
+    request_url = settings["job_endpoint"] + quote_plus(job_url)
+    headers = {**_BASE_HEADERS, "x-api-key": settings["api_key"]}
 
-    queued = execute_provider_call(
-        group="hasdata",
-        fn=lambda: _fetch_json(request_url, headers=headers, timeout_sec=settings["timeout_sec"]),
-        min_interval_sec=settings["queue_min_interval_sec"],
-        jitter_sec=settings["queue_jitter_sec"],
-        max_retries=settings["queue_max_retries"],
-        retry_backoff_sec=settings["queue_retry_backoff_sec"],
-        is_retryable=_is_retryable_hasdata_error,
-    )
+    queued = _queued_fetch(request_url, headers, settings)
     if not queued.get("ok"):
         exc = queued.get("error")
         return {
@@ -243,3 +232,42 @@ def get_indeed_job_detail(*, url: str) -> dict[str, Any]:
         "queue_stats": provider_queue_stats("hasdata"),
         "error": None,
     }
+
+
+def get_indeed_job_details(*, urls: list[str]) -> dict[str, Any]:
+    """Fetch HasData job detail for several Indeed URLs, one after another.
+
+    Each URL goes through `get_indeed_job_detail`. The `hasdata` provider queue
+    runs one call at a time, so the batch is a plain loop that keeps input
+    order, and the HTTP calls share the keep-alive connections in `_http`.
+    """
+    source = "hasdata_indeed_job_batch"
+    if not isinstance(urls, list) or not urls:
+        return {
+            "ok": False,
+            "provider": "hasdata",
+            "source": source,
+            "error": "urls must be a non-empty list of strings.",
+        }
+
+    results = [get_indeed_job_detail(url=raw_url if isinstance(raw_url, str) else "") for raw_url in urls]
+
+    return {
+        "ok": True,
+        "provider": "hasdata",
+        "source": source,
+        "results": results,
+        "ok_count": sum(1 for item in results if item.get("ok")),
+        "queue_stats": provider_queue_stats("hasdata"),
+        "error": None,
+    }
+
+
+async def aget_indeed_jobs(*, keyword: str, location: str, **kwargs: Any) -> dict[str, Any]:
+    """Awaitable `get_indeed_jobs`; runs the blocking call on the default executor."""
+    return await asyncio.to_thread(get_indeed_jobs, keyword=keyword, location=location, **kwargs)
+
+
+async def aget_indeed_job_detail(*, url: str) -> dict[str, Any]:
+    """Awaitable `get_indeed_job_detail`, so callers can `asyncio.gather` several URLs."""
+    return await asyncio.to_thread(get_indeed_job_detail, url=url)
@@ -6,6 +6,8 @@ from typing import Any
 
 from src.zubot.core.config_loader import get_home_location, get_timezone, load_config
 
+_LOCATION_CACHE: tuple[dict[str, Any], dict[str, Any]] | None = None
+
 
 def get_location() -> dict[str, Any]:
     """Return normalized location data for the current user/session.
@@ -15,12 +17,18 @@ def get_location() -> dict[str, Any]:
     2. OS-level location/timezone signals
     3. IP geolocation fallback
     """
+    global _LOCATION_CACHE
     payload: dict[str, Any] = {}
     try:
         payload = load_config()
     except (FileNotFoundError, ValueError):
         payload = {}
 
+    # Resolved once per loaded config; callers get their own copy.
+    cached = _LOCATION_CACHE
+    if cached is not None and cached[0] is payload:
+        return dict(cached[1])
+
     home_location = get_home_location(payload) or {}
     tz = home_location.get("timezone") if isinstance(home_location.get("timezone"), str) else None
     if tz is None:
@@ -36,7 +44,7 @@ def get_location() -> dict[str, Any]:
         value is not None for value in (lat, lon, city, region, country, tz)
     )
 
-    return {
+    location = {
         "lat": lat,
         "lon": lon,
         "city": city,
@@ -45,3 +53,5 @@ def get_location() -> dict[str, Any]:
         "timezone": tz,
         "source": "config_home_location" if has_any_location_data else "unresolved",
     }
+    _LOCATION_CACHE = (payload, location)
+    return dict(location)
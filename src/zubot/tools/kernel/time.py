@@ -3,12 +3,28 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from .location import get_location
 
 
+@lru_cache(maxsize=64)
+def _zone(name: str) -> ZoneInfo:
+    # Unknown names raise and are not cached, so the fallback below still applies.
+    return ZoneInfo(name)
+
+
+def _human(moment: datetime, zone_label: str | None) -> str:
+    """`moment.strftime("%Y-%m-%d %I:%M:%S %p %Z")` without the strftime/locale round trip."""
+    hour = moment.hour
+    return (
+        f"{moment.year:04d}-{moment.month:02d}-{moment.day:02d} "
+        f"{hour % 12 or 12:02d}:{moment.minute:02d}:{moment.second:02d} {'AM' if hour < 12 else 'PM'} {zone_label or ''}"
+    )
+
+
 def get_current_time(location: dict[str, Any] | None = None) -> dict[str, Any]:
     """Return current UTC and local time from system clock + timezone context."""
     resolved_location = location or get_location()
@@ -21,7 +37,7 @@ def get_current_time(location: dict[str, Any] | None = None) -> dict[str, Any]:
 
     if isinstance(requested_tz, str) and requested_tz:
         try:
-            local_tz = ZoneInfo(requested_tz)
+            local_tz = _zone(requested_tz)
             local_now = utc_now.astimezone(local_tz)
             local_tz_name = requested_tz
             local_source = "location_timezone"
@@ -29,11 +45,14 @@ def get_current_time(location: dict[str, Any] | None = None) -> dict[str, Any]:
             local_tz_name = "UTC"
             local_source = "invalid_timezone_fallback"
 
+    iso_utc = utc_now.isoformat()
+    human_utc = _human(utc_now, "UTC")
+    is_utc = local_now is utc_now
     return {
-        "iso_utc": utc_now.isoformat(),
-        "iso_local": local_now.isoformat(),
-        "human_utc": utc_now.strftime("%Y-%m-%d %I:%M:%S %p UTC"),
-        "human_local": local_now.strftime("%Y-%m-%d %I:%M:%S %p %Z"),
+        "iso_utc": iso_utc,
+        "iso_local": iso_utc if is_utc else local_now.isoformat(),
+        "human_utc": human_utc,
+        "human_local": human_utc if is_utc else _human(local_now, local_now.tzname()),
         "timezone": local_tz_name,
         "timezone_source": local_source,
         "location": resolved_location,
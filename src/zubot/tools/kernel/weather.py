@@ -2,47 +2,149 @@
 
 from __future__ import annotations
 
-import json
+from itertools import zip_longest
 from urllib.parse import urlencode
-from urllib.request import urlopen
 from typing import Any, Literal
 
-from src.zubot.core.config_loader import load_config
+from src.zubot.core.config_loader import cached_settings
+from src.zubot.tools.kernel._http import TTLCache, get_json_cached
 
 from .location import get_location
 
 WeatherHorizon = Literal["hourly", "daily"]
 DEFAULT_OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+CURRENT_FIELDS = (
+    "temperature_2m",
+    "apparent_temperature",
+    "relative_humidity_2m",
+    "precipitation",
+    "weather_code",
+    "wind_speed_10m",
+    "is_day",
+)
+HOURLY_FIELDS = (
+    "temperature_2m",
+    "apparent_temperature",
+    "precipitation_probability",
+    "precipitation",
+    "weather_code",
+    "wind_speed_10m",
+)
+DAILY_FIELDS = (
+    "weather_code",
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "precipitation_probability_max",
+    "precipitation_sum",
+    "wind_speed_10m_max",
+    "sunrise",
+    "sunset",
+)
+# Field lists never change, so their encoded query fragments are built once.
+_CURRENT_QUERY = urlencode({"current": ",".join(CURRENT_FIELDS)})
+_HOURLY_QUERY = urlencode({"hourly": ",".join(HOURLY_FIELDS)})
+_DAILY_QUERY = urlencode({"daily": ",".join(DAILY_FIELDS)})
+
+# Output key -> Open-Meteo field for the normalized wrappers.
+_OUTLOOK_FIELD_MAP = {
+    "date": "time",
+    "high": "temperature_2m_max",
+    "low": "temperature_2m_min",
+    "precip_probability": "precipitation_probability_max",
+    "precip_total": "precipitation_sum",
+    "wind_max": "wind_speed_10m_max",
+    "weather_code": "weather_code",
+    "sunrise": "sunrise",
+    "sunset": "sunset",
+}
+_TODAY_FIELD_MAP = {
+    "date": "time",
+    "high": "temperature_2m_max",
+    "low": "temperature_2m_min",
+    "precip_probability": "precipitation_probability_max",
+    "precip_total": "precipitation_sum",
+    "wind_max": "wind_speed_10m_max",
+    "sunrise": "sunrise",
+    "sunset": "sunset",
+    "weather_code": "weather_code",
+}
+_HOURLY_FIELD_MAP = {
+    "time": "time",
+    "temp": "temperature_2m",
+    "feels_like": "apparent_temperature",
+    "precip_probability": "precipitation_probability",
+    "precip": "precipitation",
+    "wind": "wind_speed_10m",
+    "weather_code": "weather_code",
+}
+
+DEFAULT_CACHE_TTL_SEC = 600.0
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# Forecasts for the same coordinates barely move within minutes.
+_RESPONSE_CACHE = TTLCache(maxsize=128)
 
 
 def _fetch_json(url: str, timeout_sec: int = 10) -> dict[str, Any]:
-    with urlopen(url, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
-    payload = json.loads(body)
+    ttl_sec = _weather_settings()["cache_ttl_sec"]
+    payload = get_json_cached(url, _JSON_HEADERS, timeout_sec, cache=_RESPONSE_CACHE, ttl_sec=ttl_sec)
     if not isinstance(payload, dict):
         raise ValueError("Weather API response must be a JSON object.")
     return payload
 
 
-def _weather_settings() -> dict[str, Any]:
-    try:
-        payload = load_config()
-    except (FileNotFoundError, ValueError):
-        payload = {}
+def _ttl_value(raw: Any, default: float) -> float:
+    return float(raw) if isinstance(raw, (int, float)) and not isinstance(raw, bool) else default
+
 
+@cached_settings
+def _weather_settings(payload: dict[str, Any]) -> dict[str, Any]:
     weather = payload.get("weather")
     weather_config = weather if isinstance(weather, dict) else {}
 
-    return {
-        "base_url": weather_config.get("base_url", DEFAULT_OPEN_METEO_URL),
+    units = {
         "temperature_unit": weather_config.get("temperature_unit", "fahrenheit"),
         "wind_speed_unit": weather_config.get("wind_speed_unit", "mph"),
         "precipitation_unit": weather_config.get("precipitation_unit", "inch"),
+    }
+    return {
+        "base_url": weather_config.get("base_url", DEFAULT_OPEN_METEO_URL),
+        **units,
         "timeout_sec": int(weather_config.get("timeout_sec", 10)),
+        "cache_ttl_sec": _ttl_value(weather_config.get("cache_ttl_sec"), DEFAULT_CACHE_TTL_SEC),
+        "units_query": urlencode(units),
     }
 
 
-def _to_forecast_rows(block: dict[str, Any], limit: int) -> list[dict[str, Any]]:
+def _reset_settings_cache() -> None:
+    _weather_settings.cache_clear()
+
+
+def clear_response_cache() -> None:
+    """Drop cached Open-Meteo responses (tests / forced refresh)."""
+    _RESPONSE_CACHE.clear()
+
+
+def _forecast_url(settings: dict[str, Any], *, lat: Any, lon: Any, timezone: Any, fixed_query: str, **extra: Any) -> str:
+    # Only the per-call values are encoded; field lists and units are precomputed.
+    dynamic = urlencode({"latitude": lat, "longitude": lon, "timezone": timezone or "auto", **extra})
+    return f"{settings['base_url']}?{dynamic}&{fixed_query}&{settings['units_query']}"
+
+
+def _to_forecast_columns(block: dict[str, Any], limit: int) -> dict[str, Any]:
+    """Keep Open-Meteo's column layout: `{"time": [...], "fields": {name: [...]}}`, sliced to `limit`."""
+    if not isinstance(block, dict) or not isinstance(times := block.get("time"), list):
+        return {"time": [], "fields": {}}
+    fields = {field: values[:limit] for field, values in block.items() if field != "time" and isinstance(values, list)}
+    return {"time": times[:limit], "fields": fields}
+
+
+def _to_forecast_rows(block: dict[str, Any], limit: int, field_map: dict[str, str] | None = None) -> list[dict[str, Any]]:
+    """Turn an Open-Meteo column block into per-time rows.
+
+    With `field_map` (output key -> Open-Meteo field) rows are emitted directly in
+    that shape, missing values as None, so wrappers need no second reshaping pass.
+    """
     if not isinstance(block, dict):
         return []
 
@@ -50,16 +152,26 @@ def _to_forecast_rows(block: dict[str, Any], limit: int) -> list[dict[str, Any]]
     if not isinstance(times, list):
         return []
 
-    rows: list[dict[str, Any]] = []
-    for idx, timestamp in enumerate(times[:limit]):
-        row: dict[str, Any] = {"time": timestamp}
-        for field, values in block.items():
-            if field == "time" or not isinstance(values, list):
-                continue
-            if idx < len(values):
-                row[field] = values[idx]
-        rows.append(row)
-    return rows
+    times = times[:limit]
+    count = len(times)
+    # Rows are built with C-level zip/dict(zip(...)) rather than per-index lookups.
+    if field_map is not None:
+        keys = tuple(field_map)
+        columns = [values[:count] if isinstance(values := block.get(field), list) else () for field in field_map.values()]
+        # `times` bounds the row count; shorter series are padded with None.
+        return [dict(zip(keys, row[1:])) for row in zip_longest(times, *columns)]
+
+    names = [field for field, values in block.items() if field != "time" and isinstance(values, list)]
+    columns = [block[field][:count] for field in names]
+    if all(len(values) == count for values in columns):
+        keys = ("time", *names)
+        return [dict(zip(keys, row)) for row in zip(times, *columns)]
+    # Ragged block: short series simply stop contributing.
+    series = list(zip(names, columns))
+    return [
+        {"time": timestamp, **{field: values[idx] for field, values in series if idx < len(values)}}
+        for idx, timestamp in enumerate(times)
+    ]
 
 
 def get_weather(location: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -84,26 +196,7 @@ def get_weather(location: dict[str, Any] | None = None) -> dict[str, Any]:
             "error": None,
         }
 
-    params = {
-        "latitude": lat,
-        "longitude": lon,
-        "current": ",".join(
-            [
-                "temperature_2m",
-                "apparent_temperature",
-                "relative_humidity_2m",
-                "precipitation",
-                "weather_code",
-                "wind_speed_10m",
-                "is_day",
-            ]
-        ),
-        "temperature_unit": settings["temperature_unit"],
-        "wind_speed_unit": settings["wind_speed_unit"],
-        "precipitation_unit": settings["precipitation_unit"],
-        "timezone": timezone or "auto",
-    }
-    url = f"{settings['base_url']}?{urlencode(params)}"
+    url = _forecast_url(settings, lat=lat, lon=lon, timezone=timezone, fixed_query=_CURRENT_QUERY)
 
     try:
         payload = _fetch_json(url, timeout_sec=settings["timeout_sec"])
@@ -143,6 +236,37 @@ def get_future_weather(
     days: int = 7,
 ) -> dict[str, Any]:
     """Return future forecast data for hourly or daily horizons via Open-Meteo."""
+    return _future_weather(location, horizon=horizon, hours=hours, days=days)
+
+
+def get_future_weather_columns(
+    location: dict[str, Any] | None = None,
+    *,
+    horizon: WeatherHorizon = "daily",
+    hours: int = 24,
+    days: int = 7,
+) -> dict[str, Any]:
+    """Like `get_future_weather`, but `forecast` stays column-oriented.
+
+    `forecast` is `{"time": [...], "fields": {name: [...]}}`, so aggregates such as
+    `max(forecast["fields"]["temperature_2m_max"])` need no per-row dicts. A series
+    Open-Meteo returned short stays short.
+    """
+    payload = _future_weather(location, horizon=horizon, hours=hours, days=days, columns=True)
+    if not isinstance(payload.get("forecast"), dict):
+        payload["forecast"] = {"time": [], "fields": {}}
+    return payload
+
+
+def _future_weather(
+    location: dict[str, Any] | None,
+    *,
+    horizon: WeatherHorizon,
+    hours: int,
+    days: int,
+    field_map: dict[str, str] | None = None,
+    columns: bool = False,
+) -> dict[str, Any]:
     resolved_location = location or get_location()
     lat = resolved_location.get("lat")
     lon = resolved_location.get("lon")
@@ -166,42 +290,20 @@ def get_future_weather(
             "error": None,
         }
 
-    params: dict[str, Any] = {
-        "latitude": lat,
-        "longitude": lon,
-        "temperature_unit": settings["temperature_unit"],
-        "wind_speed_unit": settings["wind_speed_unit"],
-        "precipitation_unit": settings["precipitation_unit"],
-        "timezone": timezone or "auto",
-    }
     if horizon == "hourly":
-        params["hourly"] = ",".join(
-            [
-                "temperature_2m",
-                "apparent_temperature",
-                "precipitation_probability",
-                "precipitation",
-                "weather_code",
-                "wind_speed_10m",
-            ]
-        )
-        params["forecast_days"] = max(1, min(16, ((hours - 1) // 24) + 1))
+        fixed_query = _HOURLY_QUERY
+        forecast_days = max(1, min(16, ((hours - 1) // 24) + 1))
     else:
-        params["daily"] = ",".join(
-            [
-                "weather_code",
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "precipitation_probability_max",
-                "precipitation_sum",
-                "wind_speed_10m_max",
-                "sunrise",
-                "sunset",
-            ]
-        )
-        params["forecast_days"] = max(1, min(16, days))
-
-    url = f"{settings['base_url']}?{urlencode(params)}"
+        fixed_query = _DAILY_QUERY
+        forecast_days = max(1, min(16, days))
+    url = _forecast_url(
+        settings,
+        lat=lat,
+        lon=lon,
+        timezone=timezone,
+        fixed_query=fixed_query,
+        forecast_days=forecast_days,
+    )
 
     try:
         payload = _fetch_json(url, timeout_sec=settings["timeout_sec"])
@@ -224,7 +326,8 @@ def get_future_weather(
 
     key = "hourly" if horizon == "hourly" else "daily"
     limit = hours if horizon == "hourly" else days
-    forecast_rows = _to_forecast_rows(payload.get(key, {}), limit=limit)
+    block = payload.get(key, {})
+    forecast_rows = _to_forecast_columns(block, limit) if columns else _to_forecast_rows(block, limit=limit, field_map=field_map)
 
     return {
         "location": resolved_location,
@@ -245,29 +348,11 @@ def get_future_weather(
 
 def get_week_outlook(location: dict[str, Any] | None = None) -> dict[str, Any]:
     """Return 7-day weather outlook with normalized daily fields."""
-    payload = get_future_weather(location=location, horizon="daily", days=7)
-    outlook: list[dict[str, Any]] = []
-    for row in payload.get("forecast", []):
-        if not isinstance(row, dict):
-            continue
-        outlook.append(
-            {
-                "date": row.get("time"),
-                "high": row.get("temperature_2m_max"),
-                "low": row.get("temperature_2m_min"),
-                "precip_probability": row.get("precipitation_probability_max"),
-                "precip_total": row.get("precipitation_sum"),
-                "wind_max": row.get("wind_speed_10m_max"),
-                "weather_code": row.get("weather_code"),
-                "sunrise": row.get("sunrise"),
-                "sunset": row.get("sunset"),
-            }
-        )
-
+    payload = _future_weather(location, horizon="daily", hours=24, days=7, field_map=_OUTLOOK_FIELD_MAP)
     return {
         "location": payload.get("location"),
         "days": 7,
-        "outlook": outlook,
+        "outlook": payload.get("forecast", []),
         "units": payload.get("units"),
         "provider": payload.get("provider"),
         "source": payload.get("source"),
@@ -277,27 +362,11 @@ def get_week_outlook(location: dict[str, Any] | None = None) -> dict[str, Any]:
 
 def get_weather_24hr(location: dict[str, Any] | None = None) -> dict[str, Any]:
     """Return 24-hour weather outlook with normalized hourly fields."""
-    payload = get_future_weather(location=location, horizon="hourly", hours=24)
-    hourly: list[dict[str, Any]] = []
-    for row in payload.get("forecast", []):
-        if not isinstance(row, dict):
-            continue
-        hourly.append(
-            {
-                "time": row.get("time"),
-                "temp": row.get("temperature_2m"),
-                "feels_like": row.get("apparent_temperature"),
-                "precip_probability": row.get("precipitation_probability"),
-                "precip": row.get("precipitation"),
-                "wind": row.get("wind_speed_10m"),
-                "weather_code": row.get("weather_code"),
-            }
-        )
-
+    payload = _future_weather(location, horizon="hourly", hours=24, days=7, field_map=_HOURLY_FIELD_MAP)
     return {
         "location": payload.get("location"),
         "hours": 24,
-        "hourly": hourly,
+        "hourly": payload.get("forecast", []),
         "units": payload.get("units"),
         "provider": payload.get("provider"),
         "source": payload.get("source"),
@@ -307,23 +376,13 @@ def get_weather_24hr(location: dict[str, Any] | None = None) -> dict[str, Any]:
 
 def get_today_weather(location: dict[str, Any] | None = None) -> dict[str, Any]:
     """Return compact summary for today's weather."""
-    payload = get_future_weather(location=location, horizon="daily", days=1)
+    payload = _future_weather(location, horizon="daily", hours=24, days=1, field_map=_TODAY_FIELD_MAP)
     today = payload.get("forecast", [])
-    first = today[0] if isinstance(today, list) and today else {}
-    if not isinstance(first, dict):
-        first = {}
+    first = today[0] if today else dict.fromkeys(_TODAY_FIELD_MAP)
 
     return {
         "location": payload.get("location"),
-        "date": first.get("time"),
-        "high": first.get("temperature_2m_max"),
-        "low": first.get("temperature_2m_min"),
-        "precip_probability": first.get("precipitation_probability_max"),
-        "precip_total": first.get("precipitation_sum"),
-        "wind_max": first.get("wind_speed_10m_max"),
-        "sunrise": first.get("sunrise"),
-        "sunset": first.get("sunset"),
-        "weather_code": first.get("weather_code"),
+        **first,
         "units": payload.get("units"),
         "provider": payload.get("provider"),
         "source": payload.get("source"),
@@ -2,62 +2,150 @@
 
 from __future__ import annotations
 
-import re
+from collections import OrderedDict
 from html.parser import HTMLParser
+from threading import Lock
 from typing import Any
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+from urllib.request import Request
 
-from src.zubot.core.config_loader import load_config
+from src.zubot.core.config_loader import cached_settings
+from src.zubot.tools.kernel._http import open_pooled
+
+DEFAULT_MAX_BYTES = 2_000_000
+READ_CHUNK_BYTES = 64 * 1024
+_SKIPPED_TAGS = frozenset({"script", "style"})
+_HTTP_PREFIXES = ("http://", "https://")
+
+VALIDATED_CACHE_MAX_ENTRIES = 16
+
+# url -> (etag, last_modified, result) for pages that sent validators; LRU-bounded.
+_VALIDATED_CACHE: OrderedDict[str, tuple[str | None, str | None, dict[str, Any]]] = OrderedDict()
+_VALIDATED_CACHE_LOCK = Lock()
 
 
 class _TextExtractor(HTMLParser):
+    """Collect visible text and the first `<title>` in a single parse."""
+
     def __init__(self) -> None:
         super().__init__()
-        self._chunks: list[str] = []
+        self._words: list[str] = []
         self._skip_depth = 0
+        self._title_chunks: list[str] | None = None
+        self._title_done = False
 
     def handle_starttag(self, tag: str, attrs) -> None:  # type: ignore[override]
-        if tag in {"script", "style"}:
+        if tag in _SKIPPED_TAGS:
             self._skip_depth += 1
+        elif tag == "title" and not self._title_done:
+            self._title_chunks = []
 
     def handle_endtag(self, tag: str) -> None:  # type: ignore[override]
-        if tag in {"script", "style"} and self._skip_depth > 0:
+        if tag in _SKIPPED_TAGS and self._skip_depth > 0:
             self._skip_depth -= 1
+        elif tag == "title" and self._title_chunks is not None:
+            self._title_done = True
 
     def handle_data(self, data: str) -> None:  # type: ignore[override]
-        if self._skip_depth == 0 and data.strip():
-            self._chunks.append(data.strip())
+        if self._skip_depth == 0:
+            # Keep words, not chunks: whitespace is collapsed as text arrives.
+            self._words.extend(data.split())
+        if self._title_chunks is not None and not self._title_done:
+            self._title_chunks.append(data)
 
     def text(self) -> str:
-        raw = " ".join(self._chunks)
-        return re.sub(r"\s+", " ", raw).strip()
+        return " ".join(self._words)
 
+    def title(self) -> str | None:
+        if self._title_chunks is None:
+            return None
+        return " ".join("".join(self._title_chunks).split())
 
-def _web_fetch_settings() -> dict[str, Any]:
-    try:
-        payload = load_config()
-    except (FileNotFoundError, ValueError):
-        payload = {}
 
+@cached_settings
+def _web_fetch_settings(payload: dict[str, Any]) -> dict[str, Any]:
     block = payload.get("web_fetch")
     config = block if isinstance(block, dict) else {}
     return {
         "timeout_sec": int(config.get("timeout_sec", 10)),
         "max_chars": int(config.get("max_chars", 20000)),
+        "max_bytes": int(config.get("max_bytes", DEFAULT_MAX_BYTES)),
         "user_agent": config.get("user_agent", "Zubot/0.1 (+local-first-agent)"),
     }
 
 
-def _extract_text(content_type: str, body: bytes, max_chars: int) -> str:
+def _reset_settings_cache() -> None:
+    _web_fetch_settings.cache_clear()
+
+
+def clear_response_cache() -> None:
+    """Drop remembered validators and extracted pages (tests / forced refresh)."""
+    with _VALIDATED_CACHE_LOCK:
+        _VALIDATED_CACHE.clear()
+
+
+def _cached_page(url: str) -> tuple[str | None, str | None, dict[str, Any]] | None:
+    with _VALIDATED_CACHE_LOCK:
+        entry = _VALIDATED_CACHE.get(url)
+        if entry is not None:
+            _VALIDATED_CACHE.move_to_end(url)
+        return entry
+
+
+def _remember_page(url: str, etag: str | None, last_modified: str | None, result: dict[str, Any]) -> None:
+    with _VALIDATED_CACHE_LOCK:
+        _VALIDATED_CACHE[url] = (etag, last_modified, result)
+        _VALIDATED_CACHE.move_to_end(url)
+        while len(_VALIDATED_CACHE) > VALIDATED_CACHE_MAX_ENTRIES:
+            _VALIDATED_CACHE.popitem(last=False)
+
+
+def _body_cap(content_type: str, settings: dict[str, Any]) -> int:
+    # Plain text needs at most 4 UTF-8 bytes per kept char; HTML markup can dwarf its
+    # visible text, so it only gets the overall byte ceiling.
+    if "text/html" in content_type:
+        return settings["max_bytes"]
+    return min(settings["max_bytes"], settings["max_chars"] * 4)
+
+
+def _read_capped(response: Any, cap: int) -> bytes:
+    """Read at most `cap` bytes so an oversized response never sits fully in memory."""
+    buf = bytearray()
+    while len(buf) < cap:
+        chunk = response.read(min(READ_CHUNK_BYTES, cap - len(buf)))
+        if not chunk:
+            break
+        buf += chunk
+    # Guard against responses whose `read(amt)` can overshoot `amt`.
+    return bytes(buf[:cap])
+
+
+def _extract_text(content_type: str, body: bytes, max_chars: int) -> tuple[str, str | None]:
+    """Return `(text, title)`; the body is decoded once and HTML is parsed once."""
     text = body.decode("utf-8", errors="replace")
+    title: str | None = None
     if "text/html" in content_type:
         parser = _TextExtractor()
         parser.feed(text)
+        parser.close()
         extracted = parser.text()
+        title = parser.title()
     else:
         extracted = text
-    return extracted[:max_chars]
+    return extracted[:max_chars], title
+
+
+def _fetch_error(url: str, exc: Exception) -> dict[str, Any]:
+    return {
+        "ok": False,
+        "url": url,
+        "status": None,
+        "content_type": None,
+        "title": None,
+        "text": "",
+        "error": str(exc),
+        "source": "web_fetch_error",
+    }
 
 
 def fetch_url(url: str) -> dict[str, Any]:
@@ -65,8 +153,8 @@ def fetch_url(url: str) -> dict[str, Any]:
     source = "web_fetch"
     settings = _web_fetch_settings()
 
-    parsed = urlparse(url)
-    if parsed.scheme not in {"http", "https"}:
+    # Schemes are case-insensitive; a prefix check avoids a full URL parse.
+    if not url[:8].lower().startswith(_HTTP_PREFIXES):
         return {
             "ok": False,
             "url": url,
@@ -82,35 +170,38 @@ def fetch_url(url: str) -> dict[str, Any]:
         "User-Agent": settings["user_agent"],
         "Accept": "text/html, text/plain, application/xhtml+xml;q=0.9, */*;q=0.8",
     }
+    # Revisits send the page's validators; a 304 reuses the earlier extraction.
+    cached = _cached_page(url)
+    if cached is not None:
+        if cached[0]:
+            headers["If-None-Match"] = cached[0]
+        if cached[1]:
+            headers["If-Modified-Since"] = cached[1]
     req = Request(url, headers=headers, method="GET")
 
     try:
-        with urlopen(req, timeout=settings["timeout_sec"]) as response:
+        with open_pooled(req, timeout=settings["timeout_sec"]) as response:
             status = getattr(response, "status", None)
-            raw_content_type = response.headers.get("Content-Type", "text/plain")
+            if status == 304 and cached is not None:
+                response.read()
+                return dict(cached[2])
+            response_headers = response.headers
+            raw_content_type = response_headers.get("Content-Type", "text/plain")
             content_type = raw_content_type.split(";")[0].strip().lower()
-            body = response.read()
+            body = _read_capped(response, _body_cap(content_type, settings))
+            etag = response_headers.get("ETag")
+            last_modified = response_headers.get("Last-Modified")
+    except HTTPError as exc:
+        # The urlopen fallback reports 304 as an HTTPError.
+        if exc.code == 304 and cached is not None:
+            return dict(cached[2])
+        return _fetch_error(url, exc)
     except Exception as exc:
-        return {
-            "ok": False,
-            "url": url,
-            "status": None,
-            "content_type": None,
-            "title": None,
-            "text": "",
-            "error": str(exc),
-            "source": "web_fetch_error",
-        }
+        return _fetch_error(url, exc)
 
-    text = _extract_text(content_type, body, settings["max_chars"])
+    text, title = _extract_text(content_type, body, settings["max_chars"])
 
-    title: str | None = None
-    if "text/html" in content_type:
-        match = re.search(r"<title[^>]*>(.*?)</title>", body.decode("utf-8", errors="replace"), re.IGNORECASE | re.DOTALL)
-        if match:
-            title = re.sub(r"\s+", " ", match.group(1)).strip()
-
-    return {
+    result = {
         "ok": True,
         "url": url,
         "status": status,
@@ -120,3 +211,7 @@ def fetch_url(url: str) -> dict[str, Any]:
         "error": None,
         "source": source,
     }
+    if status == 200 and (etag or last_modified):
+        _remember_page(url, etag, last_modified, result)
+        return dict(result)
+    return result
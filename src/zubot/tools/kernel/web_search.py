@@ -2,39 +2,52 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
-from src.zubot.core.config_loader import load_config
+from src.zubot.core.config_loader import cached_settings
+from src.zubot.tools.kernel._http import TTLCache, get_json_cached
 
 DEFAULT_BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
 
+DEFAULT_CACHE_TTL_SEC = 60.0
+_BASE_HEADERS = {"Accept": "application/json"}
+
+# The Brave key travels in a header, so the request URL alone identifies a search.
+_RESPONSE_CACHE = TTLCache(maxsize=256)
 
-def _web_search_settings() -> dict[str, Any]:
-    try:
-        payload = load_config()
-    except (FileNotFoundError, ValueError):
-        payload = {}
 
+@cached_settings
+def _web_search_settings(payload: dict[str, Any]) -> dict[str, Any]:
     block = payload.get("web_search")
     config = block if isinstance(block, dict) else {}
 
     api_key = config.get("brave_api_key")
+    cache_ttl = config.get("cache_ttl_sec")
+    base_url = config.get("base_url", DEFAULT_BRAVE_SEARCH_URL)
     return {
         "provider": config.get("provider", "brave"),
-        "base_url": config.get("base_url", DEFAULT_BRAVE_SEARCH_URL),
+        "base_url": base_url,
+        # Fixed per config; searches only append their encoded params.
+        "endpoint": f"{base_url}?",
         "brave_api_key": api_key if isinstance(api_key, str) else None,
         "timeout_sec": int(config.get("timeout_sec", 10)),
+        "cache_ttl_sec": float(cache_ttl) if isinstance(cache_ttl, (int, float)) else DEFAULT_CACHE_TTL_SEC,
     }
 
 
+def _reset_settings_cache() -> None:
+    _web_search_settings.cache_clear()
+
+
+def clear_response_cache() -> None:
+    """Drop cached Brave search responses (tests / forced refresh)."""
+    _RESPONSE_CACHE.clear()
+
+
 def _fetch_json(url: str, headers: dict[str, str], timeout_sec: int) -> dict[str, Any]:
-    req = Request(url, headers=headers, method="GET")
-    with urlopen(req, timeout=timeout_sec) as response:
-        body = response.read().decode("utf-8")
-    payload = json.loads(body)
+    ttl_sec = _web_search_settings()["cache_ttl_sec"]
+    payload = get_json_cached(url, headers, timeout_sec, cache=_RESPONSE_CACHE, ttl_sec=ttl_sec)
     if not isinstance(payload, dict):
         raise ValueError("Web search response must be a JSON object.")
     return payload
@@ -78,11 +91,8 @@ def web_search(
         "country": country,
         "search_lang": search_lang,
     }
-    url = f"{settings['base_url']}?{urlencode(params)}"
-    headers = {
-        "Accept": "application/json",
-        "X-Subscription-Token": api_key,
-    }
+    url = settings["endpoint"] + urlencode(params)
+    headers = {**_BASE_HEADERS, "X-Subscription-Token": api_key}
 
     try:
         payload = _fetch_json(url, headers=headers, timeout_sec=settings["timeout_sec"])
@@ -1,3 +1,8 @@
+import threading
+import uuid
+from functools import lru_cache
+from types import SimpleNamespace
+
 import app.chat_logic as chat_logic
 import pytest
 from app.chat_logic import (
@@ -9,80 +14,159 @@ from app.chat_logic import (
 )
 
 
+def _ok():
+    return {"ok": True}
+
+
+def _worker_stub(*, kick=_ok):
+    """Memory summary worker stand-in; only `kick` is ever customized."""
+    return SimpleNamespace(start=_ok, kick=kick, stop=_ok)
+
+
+_IDLE_WORKER = _worker_stub()
+
+
+def _idle_worker():
+    return _IDLE_WORKER
+
+
+_TASK_AGENT_RUN_FINISHED = {
+    "event_id": "tevt_1",
+    "type": "task_agent_event",
+    "timestamp": "2026-01-01T00:00:00+00:00",
+    "payload": {"event_type": "run_finished", "profile_id": "profile_a"},
+}
+
+
+def _central_stub(*events):
+    """Central-service stand-in whose forward queue yields `events`."""
+    return SimpleNamespace(list_forward_events=lambda consume=True: {"ok": True, "events": list(events)})
+
+
+_FORWARDING_CENTRAL = _central_stub(_TASK_AGENT_RUN_FINISHED)
+
+
+def _forwarding_central():
+    return _FORWARDING_CENTRAL
+
+
+def _patch(monkeypatch, **targets):
+    """Patch several `chat_logic` attributes in one call; undone with the fixture like any `setattr`."""
+    for name, value in targets.items():
+        monkeypatch.setattr(chat_logic, name, value)
+
+
 @pytest.fixture(autouse=True)
 def _fake_summary_worker(monkeypatch):
-    class _Worker:
-        def start(self):
-            return {"ok": True}
+    monkeypatch.setattr(chat_logic, "get_memory_summary_worker", _idle_worker)
 
-        def kick(self):
-            return {"ok": True}
 
-        def stop(self):
-            return {"ok": True}
+@pytest.fixture()
+def session_id():
+    """Unique session id per test; its runtime is dropped afterwards so tests never share session state."""
+    sid = f"test-{uuid.uuid4().hex[:8]}"
+    yield sid
+    chat_logic._SESSIONS.pop(sid, None)
 
-    monkeypatch.setattr(chat_logic, "get_memory_summary_worker", lambda: _Worker())
 
+_CONTEXT_BUNDLE = {"base": {"context/AGENT.md": "x"}, "supplemental": {}}
 
-def test_handle_chat_message_empty():
-    result = handle_chat_message("   ", allow_llm_fallback=False)
-    assert not result["ok"]
-    assert result["route"] == "validation"
 
+@lru_cache(maxsize=None)
+def _llm_reply(text):
+    """`call_llm` stub that always answers `text`; built once per distinct reply."""
+    # chat_logic only reads the LLM result, so one shared payload is safe.
+    payload = {"ok": True, "text": text}
+    return lambda **kwargs: payload
 
-def test_handle_chat_message_time_uses_llm_tool_path(monkeypatch):
-    monkeypatch.setattr(chat_logic, "call_llm", lambda **kwargs: {"ok": True, "text": "Current local time: 10:00 AM"})
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
+
+_default_call_llm = _llm_reply("ok")
+
+
+def _default_context_bundle(**kwargs):
+    # chat_logic replaces top-level bundle keys (`supplemental`, `facts`) but never
+    # mutates the nested dicts, so a shallow copy keeps tests isolated.
+    return dict(_CONTEXT_BUNDLE)
+
+
+def _no_recent_daily_memory(**kwargs):
+    return {}
+
+
+def _no_pending_summary(**kwargs):
+    return {"ok": True, "messages_since_last_summary": 0}
+
+
+@pytest.fixture(autouse=True)
+def _fake_daily_memory(monkeypatch):
+    """Skip daily-memory reads and writes; tests that inspect them patch their own stubs."""
+    _patch(
+        monkeypatch,
+        load_recent_daily_memory=_no_recent_daily_memory,
+        append_daily_memory_entry=lambda **kwargs: _ok(),
+        increment_day_message_count=_no_pending_summary,
     )
-    result = handle_chat_message("what time is it?", allow_llm_fallback=True, session_id="s-time-test")
-    assert result["ok"]
-    assert result["route"] == "llm.main_agent"
-    assert "Current local time" in result["reply"]
 
 
-def test_handle_chat_message_direct_fallback():
-    result = handle_chat_message("tell me a joke", allow_llm_fallback=False)
+@pytest.fixture(autouse=True)
+def _default_chat_patches(monkeypatch):
+    """Default LLM and context-bundle stubs for every test; tests override them with `monkeypatch`."""
+    _patch(monkeypatch, call_llm=_default_call_llm, load_context_bundle=_default_context_bundle)
+
+
+@pytest.mark.parametrize(
+    ("text", "ok", "route"),
+    [
+        ("   ", False, "validation"),
+        ("tell me a joke", True, "direct_fallback"),
+    ],
+    ids=["empty", "direct_fallback"],
+)
+def test_handle_chat_message_routes_without_llm(text, ok, route):
+    result = handle_chat_message(text, allow_llm_fallback=False)
+    assert result["ok"] is ok
+    assert result["route"] == route
+
+
+def test_handle_chat_message_time_uses_llm_tool_path(monkeypatch, session_id):
+    monkeypatch.setattr(chat_logic, "call_llm", _llm_reply("Current local time: 10:00 AM"))
+    result = handle_chat_message("what time is it?", allow_llm_fallback=True, session_id=session_id)
     assert result["ok"]
-    assert result["route"] == "direct_fallback"
+    assert result["route"] == "llm.main_agent"
+    assert "Current local time" in result["reply"]
 
 
-def test_reset_session_context():
-    handle_chat_message("time", allow_llm_fallback=False, session_id="s1")
-    reset = reset_session_context("s1")
+def test_reset_session_context(session_id):
+    handle_chat_message("time", allow_llm_fallback=False, session_id=session_id)
+    reset = reset_session_context(session_id)
     assert reset["ok"]
     assert reset["reset"] is True
 
 
-def test_initialize_session_context():
-    out = initialize_session_context("s-init")
+def test_initialize_session_context(session_id):
+    out = initialize_session_context(session_id)
     assert out["ok"] is True
     assert out["initialized"] is True
-    assert out["session_id"] == "s-init"
+    assert out["session_id"] == session_id
 
 
-def test_initialize_session_context_rehydrates_recent_persisted_messages(monkeypatch):
-    monkeypatch.setattr(chat_logic, "load_recent_daily_memory", lambda **kwargs: {})
-    monkeypatch.setattr(chat_logic, "get_days_pending_summary", lambda **kwargs: [])
-    monkeypatch.setattr(chat_logic, "_session_rehydrate_message_limit", lambda: 100)
-    monkeypatch.setattr(
-        chat_logic,
-        "list_session_chat_messages",
-        lambda **kwargs: [
+def test_initialize_session_context_rehydrates_recent_persisted_messages(monkeypatch, session_id):
+    _patch(
+        monkeypatch,
+        get_days_pending_summary=lambda **kwargs: [],
+        _session_rehydrate_message_limit=lambda: 100,
+        list_session_chat_messages=lambda **kwargs: [
             {"role": "user", "content": "hello"},
             {"role": "assistant", "content": "hi"},
         ],
     )
-    out = initialize_session_context("rehydrate-init")
+    out = initialize_session_context(session_id)
     assert out["ok"] is True
     assert out["preload"]["rehydrated_message_count"] == 2
     assert out["preload"]["recent_event_count"] == 2
 
 
-def test_restart_session_context_rehydrates_recent_persisted_messages(monkeypatch):
-    monkeypatch.setattr(chat_logic, "load_recent_daily_memory", lambda **kwargs: {})
+def test_restart_session_context_rehydrates_recent_persisted_messages(monkeypatch, session_id):
     monkeypatch.setattr(chat_logic, "_session_rehydrate_message_limit", lambda: 100)
     monkeypatch.setattr(
         chat_logic,
@@ -92,14 +176,14 @@ def test_restart_session_context_rehydrates_recent_persisted_messages(monkeypatc
             {"role": "assistant", "content": "Current local time: 10:00 AM"},
         ],
     )
-    out = restart_session_context("rehydrate-restart", history_limit=100)
+    out = restart_session_context(session_id, history_limit=100)
     assert out["ok"] is True
     assert out["restarted"] is True
     assert out["hydrated_message_count"] == 2
     assert out["hydrated_recent_event_count"] == 2
 
 
-def test_initialize_session_context_auto_finalizes_prior_days(monkeypatch):
+def test_initialize_session_context_auto_finalizes_prior_days(monkeypatch, session_id):
     monkeypatch.setattr(
         chat_logic,
         "get_days_pending_summary",
@@ -111,29 +195,23 @@ def test_initialize_session_context_auto_finalizes_prior_days(monkeypatch):
         "summarize_day_from_raw",
         lambda **kwargs: summaries.append(kwargs) or {"ok": True},
     )
-    out = initialize_session_context("auto-fin")
+    out = initialize_session_context(session_id)
     assert out["preload"]["auto_finalized_days"] == ["2026-02-10"]
     assert summaries[0]["day"] == "2026-02-10"
     assert summaries[0]["finalize"] is True
 
 
-def test_get_session_context_snapshot_returns_last_assembled_context(monkeypatch):
-    monkeypatch.setattr(chat_logic, "call_llm", lambda **kwargs: {"ok": True, "text": "hello"})
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {"context/a.md": "a"}},
-    )
-    monkeypatch.setattr(
-        chat_logic,
-        "invoke_tool",
-        lambda name, **kwargs: (
+def test_get_session_context_snapshot_returns_last_assembled_context(monkeypatch, session_id):
+    _patch(
+        monkeypatch,
+        call_llm=_llm_reply("hello"),
+        load_context_bundle=lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {"context/a.md": "a"}},
+        invoke_tool=lambda name, **kwargs: (
             {"ok": True, "city": "Austin", "timezone": "America/Chicago", "source": "test"}
             if name == "get_location"
             else {"ok": True, "iso_local": "2026-02-14T12:00:00-06:00", "timezone": "America/Chicago", "source": "test"}
         ),
     )
-    session_id = "ctx-snapshot"
     handle_chat_message("show context", allow_llm_fallback=True, session_id=session_id)
     out = get_session_context_snapshot(session_id)
     assert out["ok"] is True
@@ -142,20 +220,15 @@ def test_get_session_context_snapshot_returns_last_assembled_context(monkeypatch
     assert len(out["snapshot"]["assembled"]["messages"]) >= 1
 
 
-def test_handle_chat_message_llm_session_id_in_debug(monkeypatch):
-    monkeypatch.setattr(chat_logic, "call_llm", lambda **kwargs: {"ok": True, "text": "hello"})
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
-    )
-    result = handle_chat_message("who am i", allow_llm_fallback=True, session_id="s-debug")
+def test_handle_chat_message_llm_session_id_in_debug(monkeypatch, session_id):
+    monkeypatch.setattr(chat_logic, "call_llm", _llm_reply("hello"))
+    result = handle_chat_message("who am i", allow_llm_fallback=True, session_id=session_id)
     assert result["ok"]
     assert result["route"] == "llm.main_agent"
-    assert result["data"]["context_debug"]["session_id"] == "s-debug"
+    assert result["data"]["context_debug"]["session_id"] == session_id
 
 
-def test_handle_chat_message_llm_tool_loop_executes_tool(monkeypatch):
+def test_handle_chat_message_llm_tool_loop_executes_tool(monkeypatch, session_id):
     calls = {"n": 0}
 
     def fake_call_llm(**kwargs):
@@ -174,17 +247,11 @@ def test_handle_chat_message_llm_tool_loop_executes_tool(monkeypatch):
             }
         return {"ok": True, "text": "Current local time: 10:00 AM", "tool_calls": None}
 
-    monkeypatch.setattr(chat_logic, "call_llm", fake_call_llm)
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
-    )
-    monkeypatch.setattr(chat_logic, "invoke_tool", lambda name, **kwargs: {"ok": True, "human_local": "10:00 AM"})
-    monkeypatch.setattr(
-        chat_logic,
-        "list_tools",
-        lambda **kwargs: [
+    _patch(
+        monkeypatch,
+        call_llm=fake_call_llm,
+        invoke_tool=lambda name, **kwargs: {"ok": True, "human_local": "10:00 AM"},
+        list_tools=lambda **kwargs: [
             {
                 "name": "get_current_time",
                 "category": "kernel",
@@ -194,7 +261,7 @@ def test_handle_chat_message_llm_tool_loop_executes_tool(monkeypatch):
         ],
     )
 
-    result = handle_chat_message("please help with this task", allow_llm_fallback=True, session_id="tool-loop")
+    result = handle_chat_message("please help with this task", allow_llm_fallback=True, session_id=session_id)
     assert result["ok"] is True
     assert result["route"] == "llm.main_agent"
     assert "10:00 AM" in result["reply"]
@@ -202,7 +269,7 @@ def test_handle_chat_message_llm_tool_loop_executes_tool(monkeypatch):
     assert result["data"]["tool_execution"][0]["name"] == "get_current_time"
 
 
-def test_handle_chat_message_refreshes_daily_memory_each_turn(monkeypatch):
+def test_handle_chat_message_refreshes_daily_memory_each_turn(monkeypatch, session_id):
     calls = {"n": 0}
 
     def fake_recent(*, days=2):
@@ -210,61 +277,57 @@ def test_handle_chat_message_refreshes_daily_memory_each_turn(monkeypatch):
         return {}
 
     monkeypatch.setattr(chat_logic, "load_recent_daily_memory", fake_recent)
-    handle_chat_message("time", allow_llm_fallback=False, session_id="daily-refresh")
-    handle_chat_message("time", allow_llm_fallback=False, session_id="daily-refresh")
+    handle_chat_message("time", allow_llm_fallback=False, session_id=session_id)
+    handle_chat_message("time", allow_llm_fallback=False, session_id=session_id)
     assert calls["n"] >= 2
 
 
-def test_daily_memory_enqueues_summary_job_when_threshold_reached(monkeypatch):
+def test_daily_memory_enqueues_summary_job_when_threshold_reached(monkeypatch, session_id):
     enqueued = []
     kicked = {"n": 0}
-    monkeypatch.setattr(chat_logic, "_realtime_summary_turn_threshold", lambda: 1)
-    monkeypatch.setattr(
-        chat_logic,
-        "increment_day_message_count",
-        lambda **kwargs: {"ok": True, "messages_since_last_summary": 1},
-    )
-    monkeypatch.setattr(
-        chat_logic,
-        "enqueue_day_summary_job",
-        lambda **kwargs: enqueued.append(kwargs) or {"ok": True, "enqueued": True},
+    _patch(
+        monkeypatch,
+        _realtime_summary_turn_threshold=lambda: 1,
+        increment_day_message_count=lambda **kwargs: {"ok": True, "messages_since_last_summary": 1},
+        enqueue_day_summary_job=lambda **kwargs: enqueued.append(kwargs) or {"ok": True, "enqueued": True},
     )
 
-    class _Worker:
-        def start(self):
-            return {"ok": True}
+    def kick():
+        kicked["n"] += 1
+        return {"ok": True}
 
-        def kick(self):
-            kicked["n"] += 1
-            return {"ok": True}
+    worker = _worker_stub(kick=kick)
+    monkeypatch.setattr(chat_logic, "get_memory_summary_worker", lambda: worker)
+    handle_chat_message("time", allow_llm_fallback=True, session_id=session_id)
+    assert len(enqueued) == 1
+    assert enqueued[0]["reason"].startswith("chat_turn:")
+    assert kicked["n"] == 1
 
-        def stop(self):
-            return {"ok": True}
 
-    monkeypatch.setattr(chat_logic, "get_memory_summary_worker", lambda: _Worker())
-    monkeypatch.setattr(chat_logic, "call_llm", lambda **kwargs: {"ok": True, "text": "ok"})
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
+def test_daily_memory_waits_for_turn_threshold(monkeypatch, session_id):
+    enqueued = []
+    pending = {"n": 0}
+
+    def fake_increment(**kwargs):
+        pending["n"] += kwargs.get("amount", 1)
+        return {"ok": True, "messages_since_last_summary": pending["n"]}
+
+    _patch(
+        monkeypatch,
+        _realtime_summary_turn_threshold=lambda: 3,
+        increment_day_message_count=fake_increment,
+        enqueue_day_summary_job=lambda **kwargs: enqueued.append(kwargs) or {"ok": True, "enqueued": True},
     )
-    session_id = "daily-interval"
+    for _ in range(2):
+        handle_chat_message("time", allow_llm_fallback=True, session_id=session_id)
+    assert enqueued == []
     handle_chat_message("time", allow_llm_fallback=True, session_id=session_id)
     assert len(enqueued) == 1
-    assert enqueued[0]["reason"].startswith("chat_turn:")
-    assert kicked["n"] == 1
 
 
-def test_daily_memory_flushes_on_session_reset(monkeypatch):
+def test_daily_memory_flushes_on_session_reset(monkeypatch, session_id):
     summaries = []
     monkeypatch.setattr(chat_logic, "summarize_day_from_raw", lambda **kwargs: summaries.append(kwargs) or {"ok": True})
-    monkeypatch.setattr(chat_logic, "call_llm", lambda **kwargs: {"ok": True, "text": "ok"})
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
-    )
-    session_id = "daily-reset"
     handle_chat_message("time", allow_llm_fallback=True, session_id=session_id)
     reset_session_context(session_id)
     assert len(summaries) == 1
@@ -288,21 +351,15 @@ def test_daily_memory_summary_attempts_low_model(monkeypatch):
     assert "low" in calls["models"]
 
 
-def test_session_events_persist_in_order(monkeypatch):
+def test_session_events_persist_in_order(monkeypatch, session_id):
     captured = []
 
     def fake_append(session_id, events, **kwargs):
         captured.extend([event.to_dict() for event in events])
 
     monkeypatch.setattr(chat_logic, "load_config", lambda: {"memory": {"session_event_logging_enabled": True}})
-    monkeypatch.setattr(chat_logic, "call_llm", lambda **kwargs: {"ok": True, "text": "ok"})
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
-    )
     monkeypatch.setattr(chat_logic, "append_session_events", fake_append)
-    handle_chat_message("time", allow_llm_fallback=True, session_id="order-test")
+    handle_chat_message("time", allow_llm_fallback=True, session_id=session_id)
     assert len(captured) == 2
     assert captured[0]["event_type"] == "user_message"
     assert captured[1]["event_type"] == "assistant_message"
@@ -347,35 +404,15 @@ def test_daily_summary_fallback_prefers_signal_turns(monkeypatch):
     assert "implemented weather tool wiring" in out or "added parser and tests" in out
 
 
-def test_handle_chat_message_injects_forwarded_task_agent_events(monkeypatch):
-    class _FakeCentral:
-        def list_forward_events(self, consume=True):
-            _ = consume
-            return {
-                "ok": True,
-                "events": [
-                    {
-                        "event_id": "tevt_1",
-                        "type": "task_agent_event",
-                        "timestamp": "2026-01-01T00:00:00+00:00",
-                        "payload": {"event_type": "run_finished", "profile_id": "profile_a"},
-                    }
-                ],
-            }
-
-    monkeypatch.setattr(chat_logic, "get_central_service", lambda: _FakeCentral())
-    monkeypatch.setattr(chat_logic, "call_llm", lambda **kwargs: {"ok": True, "text": "ack"})
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
-    )
-    result = handle_chat_message("status?", allow_llm_fallback=True, session_id="task-forward")
+def test_handle_chat_message_injects_forwarded_task_agent_events(monkeypatch, session_id):
+    monkeypatch.setattr(chat_logic, "get_central_service", _forwarding_central)
+    monkeypatch.setattr(chat_logic, "call_llm", _llm_reply("ack"))
+    result = handle_chat_message("status?", allow_llm_fallback=True, session_id=session_id)
     assert result["ok"] is True
     assert result["data"]["context_debug"]["forwarded_task_agent_events_injected"] == 1
 
 
-def test_handle_chat_message_injects_time_location_context(monkeypatch):
+def test_handle_chat_message_injects_time_location_context(monkeypatch, session_id):
     captured = {"messages": None}
     calls = {"n": 0}
 
@@ -400,12 +437,7 @@ def test_handle_chat_message_injects_time_location_context(monkeypatch):
 
     monkeypatch.setattr(chat_logic, "invoke_tool", fake_invoke_tool)
     monkeypatch.setattr(chat_logic, "call_llm", fake_call_llm)
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
-    )
-    result = handle_chat_message("check status", allow_llm_fallback=True, session_id="worker-isolation")
+    result = handle_chat_message("check status", allow_llm_fallback=True, session_id=session_id)
     assert result["ok"] is True
     all_content = " ".join(str(msg.get("content", "")) for msg in (captured["messages"] or []))
     assert "RuntimeTimeLocation" in all_content
@@ -414,7 +446,8 @@ def test_handle_chat_message_injects_time_location_context(monkeypatch):
 
 
 def test_session_pruning_respects_max_active_sessions(monkeypatch):
-    chat_logic._SESSIONS.clear()
+    # A private session table keeps pruning from touching other tests' sessions.
+    monkeypatch.setattr(chat_logic, "_SESSIONS", {})
     monkeypatch.setattr(chat_logic, "_session_retention_policy", lambda: (720, 1))
 
     handle_chat_message("one", allow_llm_fallback=False, session_id="s1")
@@ -424,107 +457,136 @@ def test_session_pruning_respects_max_active_sessions(monkeypatch):
     assert "s2" in chat_logic._SESSIONS
 
 
-def test_daily_memory_ingests_worker_task_tool_and_system_events(monkeypatch):
-    chat_logic._SESSIONS.clear()
+_TIME_TOOL_CALL = {
+    "ok": True,
+    "text": "",
+    "tool_calls": [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_current_time", "arguments": "{}"},
+        }
+    ],
+}
+_TOOL_LOOP_DONE = {"ok": True, "text": "ack", "tool_calls": None}
+_TIME_TOOL_LISTING = [{"name": "get_current_time", "category": "kernel", "description": "time", "parameters": {}}]
+
+
+def _time_tool_loop_llm(*, messages, **kwargs):
+    """Request `get_current_time` once, then answer once its result is in the transcript."""
+    if any(message.get("role") == "tool" for message in messages):
+        return _TOOL_LOOP_DONE
+    return _TIME_TOOL_CALL
+
+
+@pytest.mark.parametrize(
+    ("tool_ok", "central", "absent_kinds"),
+    [
+        (True, _forwarding_central, {"task_agent_event", "tool_event", "system"}),
+        (False, lambda: _central_stub(), {"tool_event"}),
+    ],
+    ids=["worker_task_tool_and_system_events", "failed_tool_events"],
+)
+def test_daily_memory_ingests_only_conversation_turns(monkeypatch, session_id, tool_ok, central, absent_kinds):
     captured: list[dict] = []
-    calls = {"n": 0}
-
-    class _FakeCentral:
-        def list_forward_events(self, consume=True):
-            _ = consume
-            return {
-                "ok": True,
-                "events": [
-                    {
-                        "event_id": "tevt_1",
-                        "type": "task_agent_event",
-                        "timestamp": "2026-01-01T00:00:00+00:00",
-                        "payload": {"event_type": "run_finished", "profile_id": "profile_a"},
-                    }
-                ],
-            }
-
-    def fake_call_llm(**kwargs):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return {
-                "ok": True,
-                "text": "",
-                "tool_calls": [
-                    {
-                        "id": "call_1",
-                        "type": "function",
-                        "function": {"name": "get_current_time", "arguments": "{}"},
-                    }
-                ],
-            }
-        return {"ok": True, "text": "ack", "tool_calls": None}
 
-    monkeypatch.setattr(chat_logic, "get_central_service", lambda: _FakeCentral())
-    monkeypatch.setattr(chat_logic, "call_llm", fake_call_llm)
-    monkeypatch.setattr(chat_logic, "invoke_tool", lambda name, **kwargs: {"ok": True, "name": name})
-    monkeypatch.setattr(
-        chat_logic,
-        "list_tools",
-        lambda **kwargs: [{"name": "get_current_time", "category": "kernel", "description": "time", "parameters": {}}],
-    )
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
+    _patch(
+        monkeypatch,
+        get_central_service=central,
+        call_llm=_time_tool_loop_llm,
+        invoke_tool=lambda name, **kwargs: {"ok": tool_ok, "name": name},
+        list_tools=lambda **kwargs: _TIME_TOOL_LISTING,
+        _realtime_summary_turn_threshold=lambda: 1000,
+        append_daily_memory_entry=lambda **kwargs: captured.append(kwargs) or {"ok": True},
     )
-    monkeypatch.setattr(chat_logic, "_realtime_summary_turn_threshold", lambda: 1000)
-    monkeypatch.setattr(chat_logic, "append_daily_memory_entry", lambda **kwargs: captured.append(kwargs) or {"ok": True})
-    monkeypatch.setattr(chat_logic, "increment_day_message_count", lambda **kwargs: {"ok": True})
 
-    result = handle_chat_message("status?", allow_llm_fallback=True, session_id="ingest-events")
+    result = handle_chat_message("status?", allow_llm_fallback=True, session_id=session_id)
     assert result["ok"] is True
     kinds = {entry.get("kind") for entry in captured}
-    assert "user" in kinds
-    assert "main_agent" in kinds
-    assert "task_agent_event" not in kinds
-    assert "tool_event" not in kinds
-    assert "system" not in kinds
+    assert {"user", "main_agent"} <= kinds
+    assert not kinds & absent_kinds
 
 
-def test_daily_memory_ignores_tool_events(monkeypatch):
-    chat_logic._SESSIONS.clear()
-    captured: list[dict] = []
-    calls = {"n": 0}
+def test_invoke_tool_calls_overlaps_calls_and_keeps_order(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
 
-    def fake_call_llm(**kwargs):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return {
-                "ok": True,
-                "text": "",
-                "tool_calls": [
-                    {
-                        "id": "call_1",
-                        "type": "function",
-                        "function": {"name": "get_current_time", "arguments": "{}"},
-                    }
-                ],
-            }
-        return {"ok": True, "text": "ack", "tool_calls": None}
+    def fake_invoke_tool(name, **kwargs):
+        barrier.wait()  # both calls must be in flight at once
+        return {"ok": True, "name": name, "args": kwargs}
 
-    monkeypatch.setattr(chat_logic, "call_llm", fake_call_llm)
-    monkeypatch.setattr(chat_logic, "invoke_tool", lambda name, **kwargs: {"ok": False, "error": "boom", "name": name})
-    monkeypatch.setattr(
-        chat_logic,
-        "list_tools",
-        lambda **kwargs: [{"name": "get_current_time", "category": "kernel", "description": "time", "parameters": {}}],
-    )
-    monkeypatch.setattr(
-        chat_logic,
-        "load_context_bundle",
-        lambda **kwargs: {"base": {"context/AGENT.md": "x"}, "supplemental": {}},
-    )
-    monkeypatch.setattr(chat_logic, "_realtime_summary_turn_threshold", lambda: 1000)
-    monkeypatch.setattr(chat_logic, "append_daily_memory_entry", lambda **kwargs: captured.append(kwargs) or {"ok": True})
-    monkeypatch.setattr(chat_logic, "increment_day_message_count", lambda **kwargs: {"ok": True})
+    monkeypatch.setattr(chat_logic, "invoke_tool", fake_invoke_tool)
+    payloads = list(chat_logic._invoke_tool_calls([("get_weather", {"city": "x"}), ("web_search", {"query": "q"})]))
+    assert [payload["name"] for payload in payloads] == ["get_weather", "web_search"]
+    assert payloads[1]["args"] == {"query": "q"}
+
+
+def _tool_call(call_id, name, arguments):
+    function = {"arguments": arguments} if name is None else {"name": name, "arguments": arguments}
+    return {"id": call_id, "type": "function", "function": function}
+
+
+def test_run_llm_with_tools_runs_write_steps_in_call_order(monkeypatch):
+    step = {
+        "ok": True,
+        "text": "",
+        "tool_calls": [
+            _tool_call("c1", "write_file", '{"path": "notes.txt", "content": "a"}'),
+            _tool_call("c2", None, "{}"),
+            _tool_call("c3", "read_file", '{"path": "notes.txt"}'),
+            _tool_call("c4", "append_file", "{not json"),
+            _tool_call("c5", "append_file", '{"path": "notes.txt", "content": "b"}'),
+        ],
+    }
+    invoked = []
 
-    result = handle_chat_message("status?", allow_llm_fallback=True, session_id="ingest-tool-failure")
-    assert result["ok"] is True
-    kinds = {entry.get("kind") for entry in captured}
-    assert "tool_event" not in kinds
+    def fake_call_llm(*, messages, **kwargs):
+        return _TOOL_LOOP_DONE if any(m.get("role") == "tool" for m in messages) else step
+
+    def fake_invoke_tool(name, **kwargs):
+        invoked.append((name, kwargs, threading.current_thread() is threading.main_thread()))
+        return {"ok": True, "name": name}
+
+    _patch(monkeypatch, call_llm=fake_call_llm, invoke_tool=fake_invoke_tool, list_tools=lambda **kwargs: [])
+    _, reply, executed = chat_logic._run_llm_with_tools(messages=[{"role": "user", "content": "edit notes"}])
+
+    assert reply == "ack"
+    # Valid calls run on the caller's thread, one after another, in the model's order.
+    assert [(name, on_main) for name, _, on_main in invoked] == [
+        ("write_file", True),
+        ("read_file", True),
+        ("append_file", True),
+    ]
+    assert invoked[2][1] == {"path": "notes.txt", "content": "b"}
+    # Malformed calls are reported in place without being invoked.
+    assert [(item["name"], item["result_ok"]) for item in executed] == [
+        ("write_file", True),
+        ("unknown_tool", False),
+        ("read_file", True),
+        ("append_file", False),
+        ("append_file", True),
+    ]
+    assert "Invalid JSON" in executed[3]["error"]
+
+
+def test_run_llm_with_tools_overlaps_read_only_steps(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+    step = {
+        "ok": True,
+        "text": "",
+        "tool_calls": [
+            _tool_call("c1", "web_search", '{"query": "q"}'),
+            _tool_call("c2", "fetch_url", '{"url": "https://example.com"}'),
+        ],
+    }
+
+    def fake_call_llm(*, messages, **kwargs):
+        return _TOOL_LOOP_DONE if any(m.get("role") == "tool" for m in messages) else step
+
+    def fake_invoke_tool(name, **kwargs):
+        barrier.wait()  # both read-only calls must be in flight at once
+        return {"ok": True, "name": name}
+
+    _patch(monkeypatch, call_llm=fake_call_llm, invoke_tool=fake_invoke_tool, list_tools=lambda **kwargs: [])
+    _, reply, executed = chat_logic._run_llm_with_tools(messages=[{"role": "user", "content": "look it up"}])
+    assert reply == "ack"
+    assert [item["name"] for item in executed] == ["web_search", "fetch_url"]
@@ -3,24 +3,75 @@ import pytest
 pytest.importorskip("fastapi")
 from fastapi.testclient import TestClient
 
+import app.main as main
 from app.main import app
 
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    import json
+
+    _loads = json.loads
+
+    def _dumps(payload):
+        return json.dumps(payload).encode("utf-8")
+
+
 client = TestClient(app)
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _post(url, body=None):
+    """POST a JSON `body` that was encoded once at import (see the `_*_BODY` constants)."""
+    if body is None:
+        return client.post(url)
+    return client.post(url, content=body, headers=_JSON_HEADERS)
+
+
+def _ok(res, **expect):
+    """Assert a 200 response whose JSON body (parsed once) has the `expect` key/values; return the body."""
+    assert res.status_code == 200
+    body = _loads(res.content)
+    for key, value in expect.items():
+        assert body[key] == value, key
+    return body
+
+
+# Replies that do not depend on arguments are built once; app.main passes runtime
+# results through without mutating them, so sharing the dicts is safe.
+_OK = {"ok": True}
+_HEALTH = {
+    "ok": True,
+    "source": "runtime_service",
+    "runtime": {"started": True},
+    "central": {"running": False},
+    "task_runtime": {"running_count": 0, "queued_count": 0},
+}
+_SNAPSHOT_ASSEMBLED = {"messages": [{"role": "user", "content": "hello"}]}
+_HISTORY_ENTRIES = [
+    {"event_id": 1, "event_time": "2026-02-16T00:00:00+00:00", "role": "user", "content": "hello"},
+    {"event_id": 2, "event_time": "2026-02-16T00:00:01+00:00", "role": "assistant", "content": "hi"},
+]
+_CENTRAL_STATUS = {
+    "ok": True,
+    "service": {"running": False, "enabled_in_config": False},
+    "runtime": {"queued_count": 0, "running_count": 0},
+    "task_agents": [],
+}
+_CENTRAL_RUNNING = {"ok": True, "running": True}
+_CENTRAL_STOPPED = {"ok": True, "running": False}
+_CENTRAL_SCHEDULES = {"ok": True, "schedules": [{"schedule_id": "sched_1"}]}
+_CENTRAL_METRICS = {"ok": True, "runtime": {"queued_count": 0, "warnings": []}}
+_CENTRAL_TASKS = {"ok": True, "tasks": [{"task_id": "task_a", "name": "Task A"}]}
 
 
 class _FakeRuntimeService:
     def health(self):
-        return {
-            "ok": True,
-            "source": "runtime_service",
-            "runtime": {"started": True},
-            "central": {"running": False},
-            "task_runtime": {"running_count": 0, "queued_count": 0},
-        }
+        return _HEALTH
 
     def start(self, **kwargs):
         _ = kwargs
-        return {"ok": True}
+        return _OK
 
     def chat(self, *, message: str, session_id: str = "default", allow_llm_fallback: bool = True):
         return {"ok": True, "reply": f"echo:{message}", "session_id": session_id, "allow_llm_fallback": allow_llm_fallback}
@@ -46,7 +97,7 @@ class _FakeRuntimeService:
             "snapshot": {
                 "session_id": session_id,
                 "user_message": "hello",
-                "assembled": {"messages": [{"role": "user", "content": "hello"}]},
+                "assembled": _SNAPSHOT_ASSEMBLED,
             },
         }
 
@@ -55,40 +106,32 @@ class _FakeRuntimeService:
             "ok": True,
             "session_id": session_id,
             "limit": limit,
-            "entries": [
-                {"event_id": 1, "event_time": "2026-02-16T00:00:00+00:00", "role": "user", "content": "hello"},
-                {"event_id": 2, "event_time": "2026-02-16T00:00:01+00:00", "role": "assistant", "content": "hi"},
-            ],
+            "entries": _HISTORY_ENTRIES,
         }
 
     def clear_session_history(self, *, session_id: str = "default"):
         return {"ok": True, "session_id": session_id, "deleted_chat_messages": 2}
 
     def central_status(self):
-        return {
-            "ok": True,
-            "service": {"running": False, "enabled_in_config": False},
-            "runtime": {"queued_count": 0, "running_count": 0},
-            "task_agents": [],
-        }
+        return _CENTRAL_STATUS
 
     def central_start(self):
-        return {"ok": True, "running": True}
+        return _CENTRAL_RUNNING
 
     def central_stop(self):
-        return {"ok": True, "running": False}
+        return _CENTRAL_STOPPED
 
     def central_schedules(self):
-        return {"ok": True, "schedules": [{"schedule_id": "sched_1"}]}
+        return _CENTRAL_SCHEDULES
 
     def central_runs(self, *, limit: int = 50):
         return {"ok": True, "runs": [{"run_id": "run_1"}], "limit": limit}
 
     def central_metrics(self):
-        return {"ok": True, "runtime": {"queued_count": 0, "warnings": []}}
+        return _CENTRAL_METRICS
 
     def central_list_defined_tasks(self):
-        return {"ok": True, "tasks": [{"task_id": "task_a", "name": "Task A"}]}
+        return _CENTRAL_TASKS
 
     def central_upsert_task_profile(
         self,
@@ -230,206 +273,163 @@ class _FakeRuntimeService:
         return {"ok": True, "seen": True, "seen_count": 1}
 
 
-def test_health_endpoint_uses_runtime_service(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    res = client.get("/health")
-    assert res.status_code == 200
-    body = res.json()
-    assert body["ok"] is True
-    assert body["source"] == "runtime_service"
+# The fake is stateless, so one instance serves every request in the module.
+_FAKE_RUNTIME = _FakeRuntimeService()
 
 
-def test_chat_endpoint(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    res = client.post("/api/chat", json={"message": "hello", "session_id": "api-chat"})
-    assert res.status_code == 200
-    body = res.json()
+def _fake_runtime():
+    return _FAKE_RUNTIME
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _client_portal():
+    """Serve the module's `client` from one event-loop portal against the fake runtime.
+
+    Outside a `with` block every TestClient request starts and tears down its own
+    portal thread and loop; entering the client once lets all requests share one.
+    The runtime patch stays in place for the whole module (startup hook included);
+    tests that need a different runtime override it with their own `monkeypatch`.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.main.get_runtime_service", _fake_runtime)
+        with client:
+            yield client
+
+
+def test_health_endpoint_uses_runtime_service():
+    _ok(client.get("/health"), ok=True, source="runtime_service")
+
+
+_NON_ASCII_CHAT_BODY = _dumps({"message": "héllo ☕", "session_id": "api-chat"})
+
+
+def test_json_responses_keep_non_ascii_text():
+    res = _post("/api/chat", _NON_ASCII_CHAT_BODY)
+    assert res.headers["content-type"] == "application/json"
+    _ok(res, reply="echo:héllo ☕")
+
+
+# Echo-style handlers are called directly: routing and JSON round-trips are covered
+# by the HTTP tests for the same router group (`/api/chat`, `/api/session/*`).
+def test_chat_handler():
+    body = main.chat(main.ChatRequest(message="hello", session_id="api-chat"))
     assert body["ok"] is True
     assert body["reply"] == "echo:hello"
+    assert body["allow_llm_fallback"] is True
 
 
-def test_session_init_endpoint(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    res = client.post("/api/session/init", json={"session_id": "api-init"})
-    assert res.status_code == 200
-    body = res.json()
+def test_session_init_handler():
+    body = main.init_session(main.InitRequest(session_id="api-init"))
     assert body["ok"] is True
     assert body["initialized"] is True
 
 
-def test_session_reset_endpoint(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    res = client.post("/api/session/reset", json={"session_id": "api-reset"})
-    assert res.status_code == 200
-    body = res.json()
+def test_session_reset_handler():
+    body = main.reset_session(main.ResetRequest(session_id="api-reset"))
     assert body["ok"] is True
     assert body["reset"] is True
 
 
-def test_session_restart_context_endpoint(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    res = client.post("/api/session/restart_context", json={"session_id": "api-restart", "history_limit": 42})
-    assert res.status_code == 200
-    body = res.json()
-    assert body["ok"] is True
-    assert body["restarted"] is True
-    assert body["session_id"] == "api-restart"
-    assert body["history_limit"] == 42
+_RESTART_CONTEXT_BODY = _dumps({"session_id": "api-restart", "history_limit": 42})
 
 
-def test_session_context_endpoint(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    res = client.post("/api/session/context", json={"session_id": "ctx-1"})
-    assert res.status_code == 200
-    body = res.json()
-    assert body["ok"] is True
-    assert body["session_id"] == "ctx-1"
-    assert body["snapshot"]["session_id"] == "ctx-1"
+def test_session_restart_context_endpoint():
+    _ok(
+        _post("/api/session/restart_context", _RESTART_CONTEXT_BODY),
+        ok=True,
+        restarted=True,
+        session_id="api-restart",
+        history_limit=42,
+    )
 
-    hist = client.get("/api/session/history?session_id=ctx-1&limit=5")
-    assert hist.status_code == 200
-    hbody = hist.json()
-    assert hbody["ok"] is True
-    assert hbody["session_id"] == "ctx-1"
-    assert len(hbody["entries"]) == 2
 
-    cleared = client.post("/api/session/history/clear", json={"session_id": "ctx-1"})
-    assert cleared.status_code == 200
-    cbody = cleared.json()
-    assert cbody["ok"] is True
-    assert cbody["session_id"] == "ctx-1"
-
-
-def test_central_endpoints(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-
-    status = client.get("/api/central/status")
-    assert status.status_code == 200
-    assert status.json()["ok"] is True
-
-    start = client.post("/api/central/start")
-    assert start.status_code == 200
-    assert start.json()["running"] is True
-
-    schedules = client.get("/api/central/schedules")
-    assert schedules.status_code == 200
-    assert schedules.json()["ok"] is True
-
-    runs = client.get("/api/central/runs?limit=10")
-    assert runs.status_code == 200
-    assert runs.json()["ok"] is True
-
-    metrics = client.get("/api/central/metrics")
-    assert metrics.status_code == 200
-    assert metrics.json()["ok"] is True
-
-    tasks = client.get("/api/central/tasks")
-    assert tasks.status_code == 200
-    assert tasks.json()["ok"] is True
-
-    upsert_task = client.post(
-        "/api/central/tasks",
-        json={
-            "task_id": "task_new",
-            "name": "Task New",
-            "kind": "script",
-            "entrypoint_path": "src/zubot/tasks/task_new/task.py",
-            "timeout_sec": 120,
-            "enabled": True,
-        },
-    )
-    assert upsert_task.status_code == 200
-    assert upsert_task.json()["ok"] is True
-    assert upsert_task.json()["task_id"] == "task_new"
-
-    delete_task = client.delete("/api/central/tasks/task_new")
-    assert delete_task.status_code == 200
-    assert delete_task.json()["ok"] is True
-
-    save_sched = client.post(
-        "/api/central/schedules",
-        json={
-            "task_id": "task_a",
-            "enabled": True,
-            "mode": "frequency",
-            "execution_order": 100,
-            "run_frequency_minutes": 60,
-        },
-    )
-    assert save_sched.status_code == 200
-    assert save_sched.json()["ok"] is True
-
-    del_sched = client.delete("/api/central/schedules/sched_x")
-    assert del_sched.status_code == 200
-    assert del_sched.json()["ok"] is True
-
-    trigger = client.post("/api/central/trigger/profile_x", json={"description": "manual"})
-    assert trigger.status_code == 200
-    assert trigger.json()["profile_id"] == "profile_x"
-
-    agentic = client.post(
-        "/api/central/agentic/enqueue",
-        json={
-            "task_name": "Research",
-            "instructions": "Research topic X and summarize.",
-            "requested_by": "ui",
-            "model_tier": "medium",
-            "tool_access": [],
-            "skill_access": [],
-            "timeout_sec": 120,
-            "metadata": {"source": "test"},
-        },
-    )
-    assert agentic.status_code == 200
-    assert agentic.json()["ok"] is True
-    assert agentic.json()["run_id"] == "trun_agentic_1"
-
-    kill_run = client.post("/api/central/runs/run_x/kill", json={"requested_by": "ui"})
-    assert kill_run.status_code == 200
-    assert kill_run.json()["run_id"] == "run_x"
-
-    waiting = client.get("/api/central/runs/waiting?limit=5")
-    assert waiting.status_code == 200
-    assert waiting.json()["ok"] is True
-    assert waiting.json()["runs"][0]["run_id"] == "run_wait_1"
-
-    resumed = client.post("/api/central/runs/run_wait_1/resume", json={"user_response": "continue", "requested_by": "ui"})
-    assert resumed.status_code == 200
-    assert resumed.json()["ok"] is True
-    assert resumed.json()["resumed"] is True
-
-    sql = client.post("/api/central/sql", json={"sql": "SELECT 1 AS ok;", "read_only": True, "max_rows": 10})
-    assert sql.status_code == 200
-    assert sql.json()["ok"] is True
-    assert sql.json()["row_count"] == 1
-
-    state_upsert = client.post(
-        "/api/central/task-state/upsert",
-        json={"task_id": "t1", "state_key": "cursor", "value": {"x": 1}, "updated_by": "ui"},
-    )
-    assert state_upsert.status_code == 200
-    assert state_upsert.json()["ok"] is True
+_CTX_SESSION_BODY = _dumps({"session_id": "ctx-1"})
 
-    state_get = client.post("/api/central/task-state/get", json={"task_id": "t1", "state_key": "cursor"})
-    assert state_get.status_code == 200
-    assert state_get.json()["ok"] is True
-    assert state_get.json()["value"]["v"] == 1
 
-    seen_mark = client.post(
-        "/api/central/task-seen/mark",
-        json={"task_id": "t1", "provider": "indeed", "item_key": "job_1", "metadata": {"title": "SE"}},
-    )
-    assert seen_mark.status_code == 200
-    assert seen_mark.json()["ok"] is True
+def test_session_context_endpoint():
+    body = _ok(_post("/api/session/context", _CTX_SESSION_BODY), ok=True, session_id="ctx-1")
+    assert body["snapshot"]["session_id"] == "ctx-1"
 
-    seen_has = client.post("/api/central/task-seen/has", json={"task_id": "t1", "provider": "indeed", "item_key": "job_1"})
-    assert seen_has.status_code == 200
-    assert seen_has.json()["ok"] is True
-    assert seen_has.json()["seen"] is True
+    hbody = _ok(client.get("/api/session/history?session_id=ctx-1&limit=5"), ok=True, session_id="ctx-1")
+    assert len(hbody["entries"]) == 2
 
-    stop = client.post("/api/central/stop")
-    assert stop.status_code == 200
-    assert stop.json()["running"] is False
+    _ok(_post("/api/session/history/clear", _CTX_SESSION_BODY), ok=True, session_id="ctx-1")
+
+
+_TASK_UPSERT_BODY = _dumps(
+    {
+        "task_id": "task_new",
+        "name": "Task New",
+        "kind": "script",
+        "entrypoint_path": "src/zubot/tasks/task_new/task.py",
+        "timeout_sec": 120,
+        "enabled": True,
+    }
+)
+_SCHEDULE_UPSERT_BODY = _dumps(
+    {
+        "task_id": "task_a",
+        "enabled": True,
+        "mode": "frequency",
+        "execution_order": 100,
+        "run_frequency_minutes": 60,
+    }
+)
+_TRIGGER_BODY = _dumps({"description": "manual"})
+_AGENTIC_ENQUEUE_BODY = _dumps(
+    {
+        "task_name": "Research",
+        "instructions": "Research topic X and summarize.",
+        "requested_by": "ui",
+        "model_tier": "medium",
+        "tool_access": [],
+        "skill_access": [],
+        "timeout_sec": 120,
+        "metadata": {"source": "test"},
+    }
+)
+_KILL_RUN_BODY = _dumps({"requested_by": "ui"})
+_RESUME_RUN_BODY = _dumps({"user_response": "continue", "requested_by": "ui"})
+_SQL_BODY = _dumps({"sql": "SELECT 1 AS ok;", "read_only": True, "max_rows": 10})
+_STATE_UPSERT_BODY = _dumps({"task_id": "t1", "state_key": "cursor", "value": {"x": 1}, "updated_by": "ui"})
+_STATE_GET_BODY = _dumps({"task_id": "t1", "state_key": "cursor"})
+_SEEN_MARK_BODY = _dumps({"task_id": "t1", "provider": "indeed", "item_key": "job_1", "metadata": {"title": "SE"}})
+_SEEN_HAS_BODY = _dumps({"task_id": "t1", "provider": "indeed", "item_key": "job_1"})
+
+
+# (method, url, pre-encoded body, expected subset of the JSON response)
+_CENTRAL_CASES = [
+    ("GET", "/api/central/status", None, {"ok": True}),
+    ("POST", "/api/central/start", None, {"running": True}),
+    ("GET", "/api/central/schedules", None, {"ok": True}),
+    ("GET", "/api/central/runs?limit=10", None, {"ok": True}),
+    ("GET", "/api/central/metrics", None, {"ok": True}),
+    ("GET", "/api/central/tasks", None, {"ok": True}),
+    ("POST", "/api/central/tasks", _TASK_UPSERT_BODY, {"ok": True, "task_id": "task_new"}),
+    ("DELETE", "/api/central/tasks/task_new", None, {"ok": True}),
+    ("POST", "/api/central/schedules", _SCHEDULE_UPSERT_BODY, {"ok": True}),
+    ("DELETE", "/api/central/schedules/sched_x", None, {"ok": True}),
+    ("POST", "/api/central/trigger/profile_x", _TRIGGER_BODY, {"profile_id": "profile_x"}),
+    ("POST", "/api/central/agentic/enqueue", _AGENTIC_ENQUEUE_BODY, {"ok": True, "run_id": "trun_agentic_1"}),
+    ("POST", "/api/central/runs/run_x/kill", _KILL_RUN_BODY, {"run_id": "run_x"}),
+    ("GET", "/api/central/runs/waiting?limit=5", None, {"ok": True, "runs": [{"run_id": "run_wait_1"}]}),
+    ("POST", "/api/central/runs/run_wait_1/resume", _RESUME_RUN_BODY, {"ok": True, "resumed": True}),
+    ("POST", "/api/central/sql", _SQL_BODY, {"ok": True, "row_count": 1}),
+    ("POST", "/api/central/task-state/upsert", _STATE_UPSERT_BODY, {"ok": True}),
+    ("POST", "/api/central/task-state/get", _STATE_GET_BODY, {"ok": True, "value": {"v": 1}}),
+    ("POST", "/api/central/task-seen/mark", _SEEN_MARK_BODY, {"ok": True}),
+    ("POST", "/api/central/task-seen/has", _SEEN_HAS_BODY, {"ok": True, "seen": True}),
+    ("POST", "/api/central/stop", None, {"running": False}),
+]
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "body", "expected"),
+    _CENTRAL_CASES,
+    ids=[f"{method} {url}" for method, url, _, _ in _CENTRAL_CASES],
+)
+def test_central_endpoint(method, url, body, expected):
+    _ok(_post(url, body) if method == "POST" else client.request(method, url), **expected)
 
 
 def test_startup_hook_initializes_runtime_client_mode(monkeypatch):
@@ -449,63 +449,56 @@ def test_startup_hook_initializes_runtime_client_mode(monkeypatch):
     assert calls[0]["source"] == "app"
 
 
-def test_control_approval_flow(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    action_text = (
-        "Need approval to run task.\n"
-        "[ZUBOT_CONTROL_REQUEST]\n"
-        '{"action_id":"act_approve_1","action":"enqueue_task","title":"Run task","risk_level":"high","payload":{"task_id":"task_a"}}\n'
-        "[/ZUBOT_CONTROL_REQUEST]"
-    )
-    ingested = client.post(
-        "/api/control/ingest",
-        json={"session_id": "default", "assistant_text": action_text, "route": "llm.main_agent"},
-    )
-    assert ingested.status_code == 200
-    ibody = ingested.json()
-    assert ibody["ok"] is True
-    assert ibody["count"] == 1
-
-    pending = client.get("/api/control/pending?session_id=default")
-    assert pending.status_code == 200
-    pbody = pending.json()
-    assert pbody["ok"] is True
-    assert pbody["count"] == 1
+@pytest.fixture()
+def control_actions(monkeypatch):
+    """Fresh approval-gate store, so control tests pass in any order or xdist shard."""
+    actions: dict = {}
+    monkeypatch.setattr(main, "_CONTROL_ACTIONS", actions)
+    return actions
+
+
+_APPROVE_ACTION_TEXT = (
+    "Need approval to run task.\n"
+    "[ZUBOT_CONTROL_REQUEST]\n"
+    '{"action_id":"act_approve_1","action":"enqueue_task","title":"Run task","risk_level":"high","payload":{"task_id":"task_a"}}\n'
+    "[/ZUBOT_CONTROL_REQUEST]"
+)
+_APPROVE_INGEST_BODY = _dumps(
+    {"session_id": "default", "assistant_text": _APPROVE_ACTION_TEXT, "route": "llm.main_agent"}
+)
+_APPROVE_BODY = _dumps({"action_id": "act_approve_1", "approved_by": "tester"})
+
+
+def test_control_approval_flow(control_actions):
+    _ok(_post("/api/control/ingest", _APPROVE_INGEST_BODY), ok=True, count=1)
+
+    pbody = _ok(client.get("/api/control/pending?session_id=default"), ok=True, count=1)
     assert pbody["pending"][0]["action_id"] == "act_approve_1"
 
-    approved = client.post("/api/control/approve", json={"action_id": "act_approve_1", "approved_by": "tester"})
-    assert approved.status_code == 200
-    abody = approved.json()
-    assert abody["ok"] is True
+    abody = _ok(_post("/api/control/approve", _APPROVE_BODY), ok=True)
     assert abody["action"]["status"] == "approved"
     assert abody["execution"]["result"]["ok"] is True
 
-    pending_after = client.get("/api/control/pending?session_id=default")
-    assert pending_after.status_code == 200
-    assert pending_after.json()["count"] == 0
+    _ok(client.get("/api/control/pending?session_id=default"), count=0)
+    assert control_actions["act_approve_1"]["status"] == "approved"
 
 
-def test_control_deny_flow(monkeypatch):
-    monkeypatch.setattr("app.main.get_runtime_service", lambda: _FakeRuntimeService())
-    action_text = (
-        "Need approval to stop run.\n"
-        "[ZUBOT_CONTROL_REQUEST]\n"
-        '{"action_id":"act_deny_1","action":"kill_task_run","title":"Kill stuck run","risk_level":"high","payload":{"run_id":"run_x"}}\n'
-        "[/ZUBOT_CONTROL_REQUEST]"
-    )
-    ingested = client.post(
-        "/api/control/ingest",
-        json={"session_id": "default", "assistant_text": action_text, "route": "llm.main_agent"},
-    )
-    assert ingested.status_code == 200
-    assert ingested.json()["ok"] is True
+_DENY_ACTION_TEXT = (
+    "Need approval to stop run.\n"
+    "[ZUBOT_CONTROL_REQUEST]\n"
+    '{"action_id":"act_deny_1","action":"kill_task_run","title":"Kill stuck run","risk_level":"high","payload":{"run_id":"run_x"}}\n'
+    "[/ZUBOT_CONTROL_REQUEST]"
+)
+_DENY_INGEST_BODY = _dumps(
+    {"session_id": "default", "assistant_text": _DENY_ACTION_TEXT, "route": "llm.main_agent"}
+)
+_DENY_BODY = _dumps({"action_id": "act_deny_1", "denied_by": "tester", "reason": "not_now"})
+
+
+def test_control_deny_flow(control_actions):
+    _ok(_post("/api/control/ingest", _DENY_INGEST_BODY), ok=True)
 
-    denied = client.post("/api/control/deny", json={"action_id": "act_deny_1", "denied_by": "tester", "reason": "not_now"})
-    assert denied.status_code == 200
-    dbody = denied.json()
-    assert dbody["ok"] is True
+    dbody = _ok(_post("/api/control/deny", _DENY_BODY), ok=True)
     assert dbody["action"]["status"] == "denied"
 
-    pending = client.get("/api/control/pending?session_id=default")
-    assert pending.status_code == 200
-    assert pending.json()["count"] == 0
+    _ok(client.get("/api/control/pending?session_id=default"), count=0)
@@ -0,0 +1,10 @@
+"""Shared pytest setup.
+
+`app.chat_logic` is imported once here, before any test module is collected, so
+its heavy dependency graph (core runtime, tool registry, memory layers) loads in
+the canonical order. Single-file and `-k` runs then pay that import once and no
+longer trip over the `src.zubot.tools` <-> `src.zubot.core` import cycle that
+appears when a tool module happens to be imported first.
+"""
+
+import app.chat_logic  # noqa: F401
@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 from src.zubot.core.config_loader import (
+    cached_settings,
     clear_config_cache,
     get_central_service_config,
     get_default_model,
@@ -163,3 +164,32 @@ def test_model_alias_falls_back_to_legacy_model_field():
     }
     model_id, _model = get_default_model(cfg)
     assert model_id == "gpt5_mini"
+
+
+def test_cached_settings_rebuilds_only_when_config_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cfg = tmp_path / "config.json"
+    _write_json(cfg, {"web": {"timeout_sec": 5}})
+    monkeypatch.setenv("ZUBOT_CONFIG_PATH", str(cfg))
+    clear_config_cache()
+    builds = []
+
+    @cached_settings
+    def settings(payload: dict) -> dict:
+        builds.append(payload)
+        return {"timeout_sec": payload.get("web", {}).get("timeout_sec", 10)}
+
+    first = settings()
+    assert settings() is first
+    assert len(builds) == 1
+
+    clear_config_cache()
+    _write_json(cfg, {"web": {"timeout_sec": 7}})
+    assert settings() == {"timeout_sec": 7}
+    assert len(builds) == 2
+
+    settings.cache_clear()
+    settings()
+    assert len(builds) == 3
+
+    monkeypatch.setenv("ZUBOT_CONFIG_PATH", str(tmp_path / "missing.json"))
+    assert settings() == {"timeout_sec": 10}
@@ -2,6 +2,7 @@ from src.zubot.core.job_applications_schema import (
     DB_COLUMNS,
     REQUIRED_SHEET_COLUMNS,
     SHEET_COLUMNS,
+    canonicalize_sheet_row,
     db_row_to_sheet_row,
     normalize_sheet_row,
     sheet_row_to_db_row,
@@ -70,3 +71,15 @@ def test_normalize_sheet_row_fills_missing_with_empty_string():
     assert out["Job Title"] == ""
     assert out["Notes"] == ""
     assert out["AI Notes"] == ""
+
+
+def test_canonicalize_sheet_row_matches_db_round_trip():
+    rows = [
+        {"JobKey": "k1", "Company": "Acme", "Date Found": "2026-02-16"},
+        {"JobKey": 7, "Notes": None, "Extra": "dropped", "AI Notes": "fit"},
+        {},
+    ]
+    for row in rows:
+        out = canonicalize_sheet_row(row)
+        assert out == db_row_to_sheet_row(sheet_row_to_db_row(row))
+        assert list(out.keys()) == list(SHEET_COLUMNS)
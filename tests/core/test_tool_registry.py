@@ -1,4 +1,11 @@
-from src.zubot.core.tool_registry import ToolRegistry, ToolSpec, get_tool_registry, invoke_tool, list_tools
+from src.zubot.core.tool_registry import (
+    ToolRegistry,
+    ToolSpec,
+    get_tool_registry,
+    invoke_tool,
+    is_parallel_safe_tool,
+    list_tools,
+)
 
 
 def test_list_tools_contains_expected_names():
@@ -252,3 +259,22 @@ def test_enqueue_task_and_kill_task_run_tools(monkeypatch):
     has_seen = invoke_tool("has_task_item_seen", task_id="profile_a", provider="indeed", item_key="job_1")
     assert has_seen["ok"] is True
     assert has_seen["seen"] is True
+
+
+def test_only_read_only_tools_are_parallel_safe():
+    for name in ("read_file", "web_search", "fetch_url", "get_weather", "get_indeed_jobs", "get_task_state"):
+        assert is_parallel_safe_tool(name) is True
+    for name in (
+        "write_file",
+        "append_file",
+        "write_json",
+        "enqueue_task",
+        "enqueue_agentic_task",
+        "kill_task_run",
+        "resume_task_run",
+        "upsert_task_state",
+        "mark_task_item_seen",
+        "query_central_db",
+        "missing_tool",
+    ):
+        assert is_parallel_safe_tool(name) is False
@@ -1,11 +1,18 @@
 import importlib
 import json
+import time
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
 from src.zubot.core.config_loader import clear_config_cache
-from src.zubot.tools.kernel.google_drive_docs import create_and_upload_docx, create_local_docx, upload_file_to_google_drive
+from src.zubot.tools.kernel.google_drive_docs import (
+    create_and_upload_docx,
+    create_local_docx,
+    upload_file_to_google_drive,
+    upload_files_to_google_drive,
+)
 
 module = importlib.import_module("src.zubot.tools.kernel.google_drive_docs")
 
@@ -45,6 +52,8 @@ def configured_google(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     )
     monkeypatch.setenv("ZUBOT_CONFIG_PATH", str(config_path))
     clear_config_cache()
+    module._reset_settings_cache()
+    module.clear_folder_id_cache()
     return True
 
 
@@ -79,6 +88,42 @@ def test_create_local_docx_default_output_dir(configured_google, monkeypatch: py
     assert (tmp_path / out["local_path"]).exists()
 
 
+def test_docx_filename_helpers():
+    assert module._ensure_docx_filename("Letter.DOCX") == "Letter.DOCX"
+    assert module._ensure_docx_filename("letter") == "letter.docx"
+    assert module._ensure_docx_filename("a.doc") == "a.doc.docx"
+    stamped = module._with_timestamp_suffix("letter.docx")
+    assert stamped.startswith("letter-") and stamped.endswith(".docx")
+    assert len(stamped) == len("letter-YYYYMMDD-HHMMSS.docx")
+
+
+def test_with_timestamp_suffix_uses_utc_clock(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "gmtime", lambda: time.struct_time((2026, 2, 12, 9, 5, 7, 3, 43, 0)))
+    assert module._with_timestamp_suffix("file.docx") == "file-20260212-090507.docx"
+
+
+def test_resolve_repo_relative_path_is_lexical_and_rejects_traversal():
+    root = module._repo_root()
+    assert module._resolve_repo_relative_path("./outputs//cover_letters/") == root / "outputs" / "cover_letters"
+    with pytest.raises(ValueError):
+        module._resolve_repo_relative_path("outputs/../../etc")
+    with pytest.raises(ValueError):
+        module._resolve_repo_relative_path("/etc/passwd")
+
+
+def test_google_drive_settings_coerce_values():
+    build = module._google_drive_settings.__wrapped__
+    drive = {"cover_letters_folder_id": " folder-1 ", "default_upload_path": " ", "timeout_sec": 9}
+    settings = build({"tool_profiles": {"user_specific": {"google_drive": drive}}})
+    assert settings["cover_letters_folder_id"] == "folder-1"
+    assert settings["default_upload_path"] == module.DEFAULT_UPLOAD_PATH
+    assert settings["timeout_sec"] == 9
+
+    fallback = build({"tool_profiles": {"user_specific": ["not-a-dict"]}})
+    assert fallback["default_upload_path"] == module.DEFAULT_UPLOAD_PATH
+    assert fallback["cover_letters_folder_id"] is None
+
+
 def test_resolve_or_create_folder_path_existing(configured_google, monkeypatch: pytest.MonkeyPatch):
     calls = {"create": 0}
 
@@ -127,6 +172,203 @@ def test_resolve_or_create_folder_path_creates_missing(configured_google, monkey
     assert created == [("root", "Job Applications"), ("id-1", "Cover Letters")]
 
 
+class _FakeResponse:
+    def __init__(self, payload: dict, headers: dict | None = None):
+        self._raw = json.dumps(payload).encode("utf-8")
+        self.headers = headers or {}
+
+    def read(self) -> bytes:
+        return self._raw
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def test_upload_multipart_streams_file_with_content_length(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    local_file = tmp_path / "stream.docx"
+    local_file.write_bytes(b"x" * (module.UPLOAD_READ_CHUNK_BYTES + 10))
+    captured = {}
+
+    def fake_urlopen(req, timeout: int):
+        captured["chunks"] = list(req.data)
+        captured["length"] = int(req.get_header("Content-length"))
+        return _FakeResponse({"id": "drive-file-stream"})
+
+    monkeypatch.setattr(module, "urlopen", fake_urlopen)
+    out = module._upload_multipart(
+        access_token="tok",
+        metadata={"name": "stream.docx"},
+        content_path=local_file,
+        content_type=module.DOCX_MIME_TYPE,
+        timeout_sec=9,
+    )
+    body = b"".join(captured["chunks"])
+    assert out["id"] == "drive-file-stream"
+    assert len(captured["chunks"]) == 4
+    assert captured["length"] == len(body)
+    assert local_file.read_bytes() in body
+    assert body.startswith(
+        b"--zubotBoundary7MA4YWxkTrZu0gW\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n"
+        b'{"name": "stream.docx"}\r\n--zubotBoundary7MA4YWxkTrZu0gW\r\n'
+        b"Content-Type: " + module.DOCX_MIME_TYPE.encode("utf-8") + b"\r\n\r\nxxx"
+    )
+    assert body.endswith(b"x\r\n--zubotBoundary7MA4YWxkTrZu0gW--\r\n")
+
+
+def test_escape_query_value_escapes_quotes_and_backslashes():
+    assert module._escape_query_value("Zubin's Letters") == "Zubin\\'s Letters"
+    assert module._escape_query_value("a\\b") == "a\\\\b"
+    assert module._escape_query_value("plain") == "plain"
+
+
+def test_build_drive_list_url_quotes_query_and_keeps_constant_params():
+    url = module._build_drive_list_url("name = 'a&b' and trashed = false", "files(id,name)")
+    assert url == (
+        "https://www.googleapis.com/drive/v3/files?pageSize=50&spaces=drive"
+        "&q=name%20%3D%20%27a%26b%27%20and%20trashed%20%3D%20false&fields=files(id,name)"
+    )
+    query = parse_qs(urlsplit(url).query)
+    assert query["q"] == ["name = 'a&b' and trashed = false"]
+    assert query["pageSize"] == ["50"]
+
+
+def test_auth_headers_are_built_once_per_token():
+    first = module._authorized_headers("token-a")
+    assert module._authorized_headers("token-a") is first
+    assert first == {"Authorization": "Bearer token-a", "Accept": "application/json"}
+    json_headers = module._json_headers("token-a")
+    assert module._json_headers("token-a") is json_headers
+    assert json_headers["Content-Type"] == "application/json"
+    assert "Content-Type" not in first
+
+
+def test_create_folder_posts_shared_json_headers(monkeypatch: pytest.MonkeyPatch):
+    captured = []
+
+    def fake_urlopen(req, timeout: int):
+        captured.append(req)
+        return _FakeResponse({"id": "folder-new"})
+
+    monkeypatch.setattr(module, "urlopen", fake_urlopen)
+    folder_id = module._create_folder(access_token="token-b", parent_id="root", folder_name="Letters", timeout_sec=9)
+    assert folder_id == "folder-new"
+    assert captured[0].get_header("Content-type") == "application/json"
+    assert captured[0].get_header("Authorization") == "Bearer token-b"
+    assert "Content-Type" not in module._authorized_headers("token-b")
+
+
+def test_drive_query_templates_escape_values_once(monkeypatch: pytest.MonkeyPatch):
+    assert module._file_exists_query("parent'1", "O'Brien $n.docx") == (
+        "name = 'O\\'Brien $n.docx' and 'parent\\'1' in parents and trashed = false"
+    )
+    captured = []
+
+    def fake_fetch_json(url: str, headers: dict, timeout_sec: int):
+        captured.append(parse_qs(urlsplit(url).query)["q"][0])
+        return {"files": [{"id": "child-1"}]}
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    found = module._find_child_folder_id(access_token="t", parent_id="root", folder_name="Cover $p", timeout_sec=9)
+    assert found == "child-1"
+    assert captured == [
+        f"name = 'Cover $p' and mimeType = '{module.FOLDER_MIME_TYPE}' and 'root' in parents and trashed = false"
+    ]
+
+
+def test_fetch_json_retries_transient_errors_with_backoff(monkeypatch: pytest.MonkeyPatch):
+    attempts = {"count": 0}
+    sleeps = []
+
+    def fake_urlopen(req, timeout: int):
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise module.HTTPError(req.full_url, 503, "unavailable", None, None)
+        return _FakeResponse({"id": "folder-1"})
+
+    monkeypatch.setattr(module, "urlopen", fake_urlopen)
+    monkeypatch.setattr(module, "sleep", sleeps.append)
+    out = module._fetch_json("https://www.googleapis.com/drive/v3/files/x", {}, 9)
+    assert out == {"id": "folder-1"}
+    assert attempts["count"] == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_after_delay_is_capped(monkeypatch: pytest.MonkeyPatch):
+    attempts = {"count": 0}
+    sleeps = []
+
+    def fake_urlopen(req, timeout: int):
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise module.HTTPError(req.full_url, 429, "rate limited", {"Retry-After": "86400"}, None)
+        if attempts["count"] == 2:
+            raise module.HTTPError(req.full_url, 503, "unavailable", {"Retry-After": "2"}, None)
+        return _FakeResponse({"id": "folder-1"})
+
+    monkeypatch.setattr(module, "urlopen", fake_urlopen)
+    monkeypatch.setattr(module, "sleep", sleeps.append)
+    out = module._fetch_json("https://www.googleapis.com/drive/v3/files/x", {}, 9)
+    assert out == {"id": "folder-1"}
+    assert sleeps == [module.RETRY_AFTER_MAX_SEC, 2.0]
+
+
+def test_post_json_does_not_retry_server_errors(monkeypatch: pytest.MonkeyPatch):
+    attempts = {"count": 0}
+
+    def fake_urlopen(req, timeout: int):
+        attempts["count"] += 1
+        raise module.HTTPError(req.full_url, 500, "server error", None, None)
+
+    monkeypatch.setattr(module, "urlopen", fake_urlopen)
+    monkeypatch.setattr(module, "sleep", lambda _delay: None)
+    with pytest.raises(module.HTTPError):
+        module._post_json("https://www.googleapis.com/drive/v3/files", {}, {"name": "x"}, 9)
+    assert attempts["count"] == 1
+
+
+def test_upload_resumable_resumes_from_committed_offset(monkeypatch: pytest.MonkeyPatch):
+    content = b"abcdefghij"
+    puts = []
+    state = {"failed_once": False}
+
+    def fake_urlopen(req, timeout: int):
+        if req.get_method() == "POST":
+            assert req.get_header("X-upload-content-length") == "10"
+            return _FakeResponse({}, headers={"Location": "https://upload.example/session-1"})
+        content_range = req.get_header("Content-range")
+        puts.append((content_range, bytes(req.data)))
+        if content_range == "bytes */10":
+            raise module.HTTPError(req.full_url, 308, "resume", {"Range": "bytes=0-5"}, None)
+        if content_range == "bytes 0-3/10":
+            raise module.HTTPError(req.full_url, 308, "resume", {"Range": "bytes=0-3"}, None)
+        if content_range == "bytes 4-7/10" and not state["failed_once"]:
+            state["failed_once"] = True
+            raise module.HTTPError(req.full_url, 503, "unavailable", None, None)
+        return _FakeResponse({"id": "drive-file-resumable"})
+
+    monkeypatch.setattr(module, "RESUMABLE_CHUNK_BYTES", 4)
+    monkeypatch.setattr(module, "urlopen", fake_urlopen)
+    monkeypatch.setattr(module, "sleep", lambda _delay: None)
+
+    out = module._upload_resumable(
+        access_token="tok",
+        metadata={"name": "big.docx"},
+        content=content,
+        content_type=module.DOCX_MIME_TYPE,
+        timeout_sec=9,
+    )
+    assert out == {"id": "drive-file-resumable"}
+    assert puts == [
+        ("bytes 0-3/10", b"abcd"),
+        ("bytes 4-7/10", b"efgh"),
+        ("bytes */10", b""),
+        ("bytes 6-9/10", b"ghij"),
+    ]
+
+
 def test_upload_file_to_google_drive_success(configured_google, monkeypatch: pytest.MonkeyPatch):
     local_file = Path(module._repo_root()) / "outputs/test_google_drive_docs/upload-success.docx"
     local_file.parent.mkdir(parents=True, exist_ok=True)
@@ -308,6 +550,83 @@ def test_upload_file_to_google_drive_falls_back_to_path_for_non_default_destinat
     assert out["destination_folder_id"] == "custom-folder-1"
 
 
+def test_upload_file_to_google_drive_reuses_cached_folder_id(configured_google, monkeypatch: pytest.MonkeyPatch):
+    local_file = Path(module._repo_root()) / "outputs/test_google_drive_docs/upload-cached-folder.docx"
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+    local_file.write_bytes(b"dummy")
+
+    calls = {"validate": 0}
+
+    def fake_validate(**kwargs):
+        calls["validate"] += 1
+        return "folder-cover-letters-1"
+
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    monkeypatch.setattr(module, "_validate_folder_id", fake_validate)
+    monkeypatch.setattr(module, "_file_exists_in_folder", lambda **kwargs: False)
+    monkeypatch.setattr(module, "_upload_multipart", lambda **kwargs: {"id": "drive-file-cached", "name": "x.docx"})
+
+    rel_path = str(local_file.relative_to(module._repo_root()))
+    first = upload_file_to_google_drive(local_path=rel_path)
+    second = upload_file_to_google_drive(local_path=rel_path)
+    assert first["ok"] is True and second["ok"] is True
+    assert second["destination_folder_id"] == "folder-cover-letters-1"
+    assert calls["validate"] == 1
+
+
+def test_upload_file_to_google_drive_stale_cached_folder_is_re_resolved(
+    configured_google,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    local_file = Path(module._repo_root()) / "outputs/test_google_drive_docs/upload-stale-cache.docx"
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+    local_file.write_bytes(b"dummy")
+
+    module._store_folder_id("Job Applications/Cover Letters", "deleted-folder")
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    monkeypatch.setattr(module, "_validate_folder_id", lambda **kwargs: "fresh-folder")
+
+    def fake_exists(*, access_token: str, parent_id: str, filename: str, timeout_sec: int):
+        if parent_id == "deleted-folder":
+            raise module.HTTPError("https://example.invalid", 404, "not found", None, None)
+        return False
+
+    monkeypatch.setattr(module, "_file_exists_in_folder", fake_exists)
+    monkeypatch.setattr(module, "_upload_multipart", lambda **kwargs: {"id": "drive-file-fresh", "name": "x.docx"})
+
+    out = upload_file_to_google_drive(local_path=str(local_file.relative_to(module._repo_root())))
+    assert out["ok"] is True
+    assert out["destination_folder_id"] == "fresh-folder"
+    assert module._cached_folder_id("Job Applications/Cover Letters") == "fresh-folder"
+
+
+def test_upload_file_to_google_drive_skips_conflict_check_for_new_folder(
+    configured_google,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    local_file = Path(module._repo_root()) / "outputs/test_google_drive_docs/upload-new-folder.docx"
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+    local_file.write_bytes(b"dummy")
+
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    monkeypatch.setattr(module, "_find_child_folder_id", lambda **kwargs: None)
+    monkeypatch.setattr(module, "_create_folder", lambda **kwargs: f"new-{kwargs['folder_name']}")
+    monkeypatch.setattr(
+        module,
+        "_file_exists_in_folder",
+        lambda **kwargs: (_ for _ in ()).throw(AssertionError("new folder should not be checked for conflicts")),
+    )
+    monkeypatch.setattr(module, "_upload_multipart", lambda **kwargs: {"id": "drive-file-new", "name": "x.docx"})
+
+    out = upload_file_to_google_drive(
+        local_path=str(local_file.relative_to(module._repo_root())),
+        destination_path="Brand/New",
+    )
+    assert out["ok"] is True
+    assert out["destination_folder_id"] == "new-New"
+    assert module._consume_fresh_folder("new-New") is False
+
+
 def test_upload_file_to_google_drive_auth_error(configured_google, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     local_file = Path(module._repo_root()) / "outputs/test_google_drive_docs/upload-auth-error.docx"
     local_file.parent.mkdir(parents=True, exist_ok=True)
@@ -320,23 +639,165 @@ def test_upload_file_to_google_drive_auth_error(configured_google, monkeypatch:
     assert "bad auth" in out["error"]
 
 
-def test_create_and_upload_docx_success(configured_google, monkeypatch: pytest.MonkeyPatch):
+def _batch_response(parts: list[tuple[str, int, dict]]) -> _FakeResponse:
+    chunks = []
+    for content_id, status, body in parts:
+        chunks.append(
+            f"--batch_resp\r\nContent-Type: application/http\r\nContent-ID: <response-{content_id}>\r\n\r\n"
+            f"HTTP/1.1 {status} OK\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n{json.dumps(body)}\r\n"
+        )
+    chunks.append("--batch_resp--\r\n")
+    response = _FakeResponse({}, headers={"Content-Type": "multipart/mixed; boundary=batch_resp"})
+    response._raw = "".join(chunks).encode("utf-8")
+    return response
+
+
+def test_batch_file_exists_sends_one_request_and_parses_parts(monkeypatch: pytest.MonkeyPatch):
+    captured = []
+
+    def fake_urlopen(req, timeout: int):
+        captured.append(req)
+        return _batch_response(
+            [
+                ("item1", 200, {"files": [{"id": "existing"}]}),
+                ("item0", 200, {"files": []}),
+                ("item2", 404, {"error": {"code": 404}}),
+            ]
+        )
+
+    monkeypatch.setattr(module, "urlopen", fake_urlopen)
+    out = module._batch_file_exists(
+        access_token="token",
+        checks=[("folder-1", "a.docx"), ("folder-1", "b.docx"), ("gone", "c.docx")],
+        timeout_sec=9,
+    )
+    assert out == [False, True, None]
+    assert len(captured) == 1
+    req = captured[0]
+    assert req.full_url == module.DRIVE_BATCH_URL
+    assert req.get_header("Content-type") == f"multipart/mixed; boundary={module.BATCH_BOUNDARY}"
+    body = req.data.decode("utf-8")
+    assert body.count("Content-Type: application/http") == 3
+    assert "Content-ID: <item2>" in body
+    assert "GET /drive/v3/files?" in body
+
+
+def test_upload_files_to_google_drive_batches_checks_and_preserves_order(
+    configured_google,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    base = Path(module._repo_root()) / "outputs/test_google_drive_docs"
+    base.mkdir(parents=True, exist_ok=True)
+    for name in ("batch-a.docx", "batch-b.docx"):
+        (base / name).write_bytes(b"dummy")
+
+    def rel(name: str) -> str:
+        return str((base / name).relative_to(module._repo_root()))
+
+    calls = {"validate": 0, "batch": 0}
+
+    def fake_validate(**kwargs):
+        calls["validate"] += 1
+        return "folder-cover-letters-1"
+
+    def fake_batch(*, access_token: str, checks: list, timeout_sec: int):
+        calls["batch"] += 1
+        assert checks == [("folder-cover-letters-1", "batch-a.docx"), ("folder-cover-letters-1", "batch-b.docx")]
+        return [False, True]
+
+    uploaded = []
+
+    def fake_upload_multipart(**kwargs):
+        uploaded.append(kwargs["metadata"]["name"])
+        return {"id": f"id-{kwargs['metadata']['name']}", "name": kwargs["metadata"]["name"]}
+
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    monkeypatch.setattr(module, "_validate_folder_id", fake_validate)
+    monkeypatch.setattr(module, "_batch_file_exists", fake_batch)
     monkeypatch.setattr(
         module,
-        "create_local_docx",
-        lambda **kwargs: {
-            "ok": True,
-            "source": "google_docx_local",
-            "local_path": "outputs/cover_letters/x.docx",
-            "filename": "x.docx",
-            "bytes_written": 12,
-            "error": None,
-        },
+        "_file_exists_in_folder",
+        lambda **kwargs: (_ for _ in ()).throw(AssertionError("checks should be batched")),
+    )
+    monkeypatch.setattr(module, "_with_timestamp_suffix", lambda name: "batch-b-20260212-111111.docx")
+    monkeypatch.setattr(module, "_upload_multipart", fake_upload_multipart)
+
+    out = upload_files_to_google_drive(
+        [
+            {"local_path": rel("batch-a.docx")},
+            {"local_path": "outputs/test_google_drive_docs/missing.docx"},
+            {"local_path": rel("batch-b.docx")},
+        ]
     )
+    assert [item["ok"] for item in out] == [True, False, True]
+    assert out[0]["drive_file_name"] == "batch-a.docx"
+    assert out[1]["error"] == "local_path does not exist as a file."
+    assert out[2]["drive_file_name"] == "batch-b-20260212-111111.docx"
+    assert sorted(uploaded) == ["batch-a.docx", "batch-b-20260212-111111.docx"]
+    assert calls == {"validate": 1, "batch": 1}
+
+
+def test_upload_files_to_google_drive_falls_back_when_batch_fails(
+    configured_google,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    local_file = Path(module._repo_root()) / "outputs/test_google_drive_docs/batch-fallback.docx"
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+    local_file.write_bytes(b"dummy")
+
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    monkeypatch.setattr(module, "_validate_folder_id", lambda **kwargs: "folder-cover-letters-1")
     monkeypatch.setattr(
         module,
-        "upload_file_to_google_drive",
-        lambda **kwargs: {
+        "_batch_file_exists",
+        lambda **kwargs: (_ for _ in ()).throw(module.URLError("batch unavailable")),
+    )
+    monkeypatch.setattr(module, "_file_exists_in_folder", lambda **kwargs: False)
+    monkeypatch.setattr(module, "_upload_multipart", lambda **kwargs: {"id": "drive-file-fb", "name": "batch-fallback.docx"})
+
+    out = upload_files_to_google_drive([{"local_path": str(local_file.relative_to(module._repo_root()))}])
+    assert len(out) == 1
+    assert out[0]["ok"] is True
+    assert out[0]["drive_file_id"] == "drive-file-fb"
+
+
+def test_upload_files_to_google_drive_auth_error_marks_every_item(
+    configured_google,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    local_file = Path(module._repo_root()) / "outputs/test_google_drive_docs/batch-auth.docx"
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+    local_file.write_bytes(b"dummy")
+
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": False, "error": "bad auth"})
+    rel_path = str(local_file.relative_to(module._repo_root()))
+    out = upload_files_to_google_drive([{"local_path": rel_path}, {"local_path": rel_path}, "bad"])
+    assert [item["ok"] for item in out] == [False, False, False]
+    assert out[0]["error"] == "Google auth failed: bad auth"
+    assert out[2]["error"] == "Each upload item must be an object."
+
+
+def test_create_and_upload_docx_success(configured_google, monkeypatch: pytest.MonkeyPatch):
+    uploads = []
+    monkeypatch.setattr(
+        module,
+        "_write_local_docx",
+        lambda **kwargs: (
+            {
+                "ok": True,
+                "source": "google_docx_local",
+                "local_path": "outputs/cover_letters/x.docx",
+                "filename": "x.docx",
+                "bytes_written": 12,
+                "error": None,
+            },
+            b"docx-bytes",
+        ),
+    )
+
+    def fake_upload(**kwargs):
+        uploads.append(kwargs)
+        return {
             "ok": True,
             "source": "google_drive_upload",
             "drive_file_id": "id-1",
@@ -344,17 +805,20 @@ def test_create_and_upload_docx_success(configured_google, monkeypatch: pytest.M
             "destination_folder_id": "folder-1",
             "web_view_link": "link",
             "error": None,
-        },
-    )
+        }
+
+    monkeypatch.setattr(module, "_upload_to_drive", fake_upload)
 
     out = create_and_upload_docx(filename="x", title="t", paragraphs=["p"])
     assert out["ok"] is True
     assert out["local"]["ok"] is True
     assert out["upload"]["ok"] is True
+    assert uploads[0]["content"] == b"docx-bytes"
+    assert uploads[0]["desired_name"] == "x.docx"
 
 
 def test_create_and_upload_docx_local_failure(configured_google, monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setattr(module, "create_local_docx", lambda **kwargs: {"ok": False, "error": "local fail"})
+    monkeypatch.setattr(module, "_write_local_docx", lambda **kwargs: ({"ok": False, "error": "local fail"}, None))
     out = create_and_upload_docx(filename="x", title="t", paragraphs=["p"])
     assert out["ok"] is False
     assert out["upload"] is None
@@ -364,12 +828,15 @@ def test_create_and_upload_docx_local_failure(configured_google, monkeypatch: py
 def test_create_and_upload_docx_upload_failure(configured_google, monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(
         module,
-        "create_local_docx",
-        lambda **kwargs: {"ok": True, "local_path": "outputs/cover_letters/x.docx", "filename": "x.docx", "error": None},
+        "_write_local_docx",
+        lambda **kwargs: (
+            {"ok": True, "local_path": "outputs/cover_letters/x.docx", "filename": "x.docx", "error": None},
+            b"docx-bytes",
+        ),
     )
     monkeypatch.setattr(
         module,
-        "upload_file_to_google_drive",
+        "_upload_to_drive",
         lambda **kwargs: {"ok": False, "source": "google_drive_upload_error", "error": "upload fail"},
     )
 
@@ -7,7 +7,9 @@ import pytest
 from src.zubot.core.config_loader import clear_config_cache
 from src.zubot.tools.kernel.google_sheets_job_apps import (
     append_job_app_row,
+    append_job_app_rows,
     delete_job_app_row_by_key,
+    delete_job_app_rows_by_keys,
     list_job_app_rows,
 )
 
@@ -43,9 +45,25 @@ def configured_google_drive(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     )
     monkeypatch.setenv("ZUBOT_CONFIG_PATH", str(config_path))
     clear_config_cache()
+    module._reset_settings_cache()
+    module.clear_sheet_id_cache()
+    module.clear_response_cache()
     return True
 
 
+def test_google_drive_settings_coerce_values():
+    build = module._google_drive_settings.__wrapped__
+    drive = {"job_application_spreadsheet_id": "sheet-123", "timeout_sec": "9"}
+    assert build({"tool_profiles": {"user_specific": {"google_drive": drive}}}) == {
+        "spreadsheet_id": "sheet-123",
+        "timeout_sec": 9,
+    }
+    assert build({"tool_profiles": {"user_specific": {"google_drive": {"job_application_spreadsheet_id": 7}}}}) == {
+        "spreadsheet_id": None,
+        "timeout_sec": module.DEFAULT_TIMEOUT_SEC,
+    }
+
+
 def test_list_job_app_rows_invalid_date_filter(configured_google_drive):
     out = list_job_app_rows(start_date="13/35/2026")
     assert out["ok"] is False
@@ -56,7 +74,7 @@ def test_list_job_app_rows_inclusive_date_filter_and_mapping(configured_google_d
     monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
 
     def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
-        assert "Job%20Applications!A1:M" in url
+        assert url.endswith("/values/Job%20Applications!A1:M?fields=values")
         assert headers["Authorization"] == "Bearer token"
         assert timeout_sec == 9
         return {
@@ -93,6 +111,28 @@ def test_list_job_app_rows_inclusive_date_filter_and_mapping(configured_google_d
     assert out["filter"]["end_date"] == "2026-02-11"
 
 
+def test_list_job_app_rows_date_filter_maps_only_matching_rows(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    header = list(module.COLUMNS)
+    rows = [["k%d" % i, "Co", "Role", "Remote", "2026-01-%02d" % (i % 28 + 1)] for i in range(50)]
+    rows.append(["k-none", "Co", "Role", "Remote"])
+    rows.append(["k-num", "Co", "Role", "Remote", None])
+    monkeypatch.setattr(module, "_fetch_json", lambda *args, **kwargs: {"values": [header, *rows]})
+
+    mapped_calls = []
+    original = module._row_values_to_dict
+
+    def counting_row_values_to_dict(row_values):
+        mapped_calls.append(row_values[0])
+        return original(row_values)
+
+    monkeypatch.setattr(module, "_row_values_to_dict", counting_row_values_to_dict)
+    out = list_job_app_rows(start_date="2026-01-05", end_date="2026-01-05")
+    assert out["ok"] is True
+    assert [row["JobKey"] for row in out["rows"]] == ["k4", "k32"]
+    assert mapped_calls == ["k4", "k32"]
+
+
 def test_list_job_app_rows_short_row_mapping(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
     monkeypatch.setattr(
@@ -149,14 +189,14 @@ def test_append_job_app_row_duplicate_job_key(configured_google_drive, monkeypat
     monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
 
     def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
-        assert "Job%20Applications!A2:M" in url
-        return {"values": [["existing-key", "", "Engineer"], ["other-key", "", "Analyst"]]}
+        assert url.endswith("/values/Job%20Applications!A2:A?majorDimension=COLUMNS&fields=values")
+        return {"values": [["existing-key", "other-key"]]}
 
-    def fail_put(*args, **kwargs):
+    def fail_post(*args, **kwargs):
         raise AssertionError("write should not be called for duplicate key")
 
     monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
-    monkeypatch.setattr(module, "_put_json", fail_put)
+    monkeypatch.setattr(module, "_post_json", fail_post)
 
     out = append_job_app_row(
         row={
@@ -178,25 +218,21 @@ def test_append_job_app_row_success(configured_google_drive, monkeypatch: pytest
     monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
 
     def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
-        assert "Job%20Applications!A2:M" in url
-        return {
-            "values": [
-                ["", "", ""],
-                ["other-key", "Other Co", "Other Title"],
-            ]
-        }
+        assert url.endswith("/values/Job%20Applications!A2:A?majorDimension=COLUMNS&fields=values")
+        return {"values": [["first-key", "other-key"]]}
 
-    def fake_put_json(url: str, headers: dict[str, str], payload: dict, timeout_sec: int):
-        assert "Job%20Applications!A2:M2" in url
+    def fake_post_json(url: str, headers: dict[str, str], payload: dict, timeout_sec: int):
+        assert "/values/Job%20Applications!A1:append?" in url
+        assert "insertDataOption=INSERT_ROWS" in url
         assert payload["values"][0][0] == "new-key"
         assert payload["values"][0][4] == "2026-02-10"
         return {
-            "updatedRange": "Job Applications!A2:M2",
-            "updatedRows": 1,
+            "tableRange": "'Job Applications'!A1:M3",
+            "updates": {"updatedRange": "'Job Applications'!A4:M4", "updatedRows": 1},
         }
 
     monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
-    monkeypatch.setattr(module, "_put_json", fake_put_json)
+    monkeypatch.setattr(module, "_post_json", fake_post_json)
 
     out = append_job_app_row(
         row={
@@ -217,10 +253,82 @@ def test_append_job_app_row_success(configured_google_drive, monkeypatch: pytest
     )
     assert out["ok"] is True
     assert out["updated_rows"] == 1
-    assert out["target_row"] == 2
+    assert out["updated_range"] == "'Job Applications'!A4:M4"
+    assert out["target_row"] == 4
     assert out["row"]["Date Found"] == "2026-02-10"
 
 
+def _append_row(job_key: str, **overrides) -> dict:
+    row = {
+        "JobKey": job_key,
+        "Company": "Acme",
+        "Job Title": "Engineer",
+        "Location": "Remote",
+        "Date Found": "02/10/2026",
+        "Status": "Recommend Apply",
+        "Job Link": "https://example.com/job",
+        "Source": "Indeed",
+    }
+    row.update(overrides)
+    return row
+
+
+def test_append_job_app_rows_single_read_and_write(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    calls = {"fetch": 0, "post": 0}
+
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        calls["fetch"] += 1
+        assert url.endswith("/values/Job%20Applications!A2:A?majorDimension=COLUMNS&fields=values")
+        return {"values": [["existing-key"]]}
+
+    def fake_post_json(url: str, headers: dict[str, str], payload: dict, timeout_sec: int):
+        calls["post"] += 1
+        assert ":append?" in url
+        assert [values[0] for values in payload["values"]] == ["k1", "k2"]
+        return {"updates": {"updatedRange": "'Job Applications'!A6:M7", "updatedRows": 2}}
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    monkeypatch.setattr(module, "_post_json", fake_post_json)
+
+    out = append_job_app_rows(
+        rows=[
+            _append_row("k1"),
+            _append_row("existing-key"),
+            _append_row("k2", **{"Date Found": "2026-02-11"}),
+            _append_row("k1"),
+            _append_row("bad", Status="Unknown"),
+        ]
+    )
+    assert out["ok"] is True
+    assert calls == {"fetch": 1, "post": 1}
+    assert out["appended_count"] == 2
+    assert out["updated_rows"] == 2
+    results = out["results"]
+    assert [item["ok"] for item in results] == [True, False, True, False, False]
+    assert results[0]["target_row"] == 6
+    assert results[2]["target_row"] == 7
+    assert results[2]["row"]["Date Found"] == "2026-02-11"
+    assert results[1]["error"] == "Duplicate JobKey: existing-key"
+    assert results[3]["error"] == "Duplicate JobKey: k1"
+    assert "row.Status" in results[4]["error"]
+
+
+def test_append_job_app_rows_skips_write_when_nothing_new(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    monkeypatch.setattr(module, "_fetch_json", lambda *args, **kwargs: {"values": [["k1"]]})
+
+    def fail_post(*args, **kwargs):
+        raise AssertionError("nothing should be written")
+
+    monkeypatch.setattr(module, "_post_json", fail_post)
+    out = append_job_app_rows(rows=[_append_row("k1")])
+    assert out["ok"] is True
+    assert out["appended_count"] == 0
+    assert out["results"][0]["ok"] is False
+    assert append_job_app_rows(rows=[])["ok"] is False
+
+
 def test_list_job_app_rows_api_error(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
 
@@ -235,12 +343,12 @@ def test_list_job_app_rows_api_error(configured_google_drive, monkeypatch: pytes
 
 def test_append_job_app_row_api_error(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
-    monkeypatch.setattr(module, "_fetch_json", lambda *args, **kwargs: {"values": [["k1", "Co", "Title"]]})
+    monkeypatch.setattr(module, "_fetch_json", lambda *args, **kwargs: {"values": [["k1"]]})
 
     def boom(*args, **kwargs):
         raise RuntimeError("network fail")
 
-    monkeypatch.setattr(module, "_put_json", boom)
+    monkeypatch.setattr(module, "_post_json", boom)
 
     out = append_job_app_row(
         row={
@@ -269,7 +377,7 @@ def test_delete_job_app_row_by_key_not_found(configured_google_drive, monkeypatc
 
     def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
         assert "Job%20Applications!A2:A" in url
-        return {"values": [["a"], ["b"]]}
+        return {"values": [["a", "b"]]}
 
     monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
     out = delete_job_app_row_by_key(job_key="missing")
@@ -281,7 +389,7 @@ def test_delete_job_app_row_by_key_duplicate(configured_google_drive, monkeypatc
     monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
 
     def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
-        return {"values": [["dup"], ["x"], ["dup"]]}
+        return {"values": [["dup", "x", "dup"]]}
 
     monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
     out = delete_job_app_row_by_key(job_key="dup")
@@ -294,7 +402,7 @@ def test_delete_job_app_row_by_key_success(configured_google_drive, monkeypatch:
 
     def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
         if "Job%20Applications!A2:A" in url:
-            return {"values": [["k1"], ["k2"], ["k3"]]}
+            return {"values": [["k1", "k2", "k3"]]}
         if "fields=sheets(properties(sheetId,title))" in url:
             return {"sheets": [{"properties": {"sheetId": 777, "title": "Job Applications"}}]}
         raise AssertionError(f"unexpected URL: {url}")
@@ -307,7 +415,7 @@ def test_delete_job_app_row_by_key_success(configured_google_drive, monkeypatch:
         return {"replies": [{}]}
 
     monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
-    monkeypatch.setattr(module, "_post_json", fake_post_json)
+    monkeypatch.setattr(module, "_post_json_fire", fake_post_json)
     out = delete_job_app_row_by_key(job_key="k2")
     assert out["ok"] is True
     assert out["deleted_row_number"] == 3
@@ -345,7 +453,209 @@ def test_delete_job_app_row_by_key_api_error(configured_google_drive, monkeypatc
         raise RuntimeError("delete fail")
 
     monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
-    monkeypatch.setattr(module, "_post_json", boom)
+    monkeypatch.setattr(module, "_post_json_fire", boom)
     out = delete_job_app_row_by_key(job_key="k1")
     assert out["ok"] is False
     assert "Failed to delete row" in out["error"]
+
+
+def test_delete_job_app_rows_by_keys_single_batch_update(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    fetched = []
+
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        fetched.append(url)
+        if "Job%20Applications!A2:A" in url:
+            return {"values": [["k1", "k2", "dup", "k3", "dup", "k4"]]}
+        if "fields=sheets(properties(sheetId,title))" in url:
+            return {"sheets": [{"properties": {"sheetId": 42, "title": "Job Applications"}}]}
+        raise AssertionError(f"unexpected URL: {url}")
+
+    posted = []
+
+    def fake_post_json(url: str, headers: dict[str, str], payload: dict, timeout_sec: int):
+        assert ":batchUpdate" in url
+        posted.append(payload)
+        return {"replies": [{}, {}]}
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    monkeypatch.setattr(module, "_post_json_fire", fake_post_json)
+
+    out = delete_job_app_rows_by_keys(keys=["k1", "missing", "k4", "dup", "k1", " "])
+    assert out["ok"] is True
+    assert out["deleted_count"] == 2
+    assert len(fetched) == 2
+    assert len(posted) == 1
+    ranges = [item["deleteDimension"]["range"] for item in posted[0]["requests"]]
+    assert [(r["sheetId"], r["startIndex"], r["endIndex"]) for r in ranges] == [(42, 6, 7), (42, 1, 2)]
+    results = out["results"]
+    assert [item["ok"] for item in results] == [True, False, True, False, False, False]
+    assert results[0]["deleted_row_number"] == 2
+    assert results[2]["deleted_row_number"] == 7
+    assert "JobKey not found" in results[1]["error"]
+    assert "Duplicate JobKey values found" in results[3]["error"]
+    assert "more than once" in results[4]["error"]
+    assert "non-empty" in results[5]["error"]
+
+
+def test_delete_job_app_rows_by_keys_no_matches_skips_writes(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        assert "Job%20Applications!A2:A" in url
+        return {"values": [["k1"]]}
+
+    def fail_post(*args, **kwargs):
+        raise AssertionError("nothing should be deleted")
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    monkeypatch.setattr(module, "_post_json_fire", fail_post)
+    out = delete_job_app_rows_by_keys(keys=["missing"])
+    assert out["ok"] is True
+    assert out["deleted_count"] == 0
+    assert delete_job_app_rows_by_keys(keys=[])["ok"] is False
+
+
+def test_delete_job_app_row_by_key_reuses_cached_sheet_id(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    calls = {"metadata": 0}
+
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        if "Job%20Applications!A2:A" in url:
+            return {"values": [["k1", "k2"]]}
+        if "fields=sheets(properties(sheetId,title))" in url:
+            calls["metadata"] += 1
+            return {"sheets": [{"properties": {"sheetId": 555, "title": "Job Applications"}}]}
+        raise AssertionError(f"unexpected URL: {url}")
+
+    posted = []
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    monkeypatch.setattr(module, "_post_json_fire", lambda url, headers, payload, timeout_sec: posted.append(payload) or {})
+
+    assert delete_job_app_row_by_key(job_key="k1")["ok"] is True
+    assert delete_job_app_row_by_key(job_key="k2")["ok"] is True
+    assert calls["metadata"] == 1
+    assert [p["requests"][0]["deleteDimension"]["range"]["sheetId"] for p in posted] == [555, 555]
+
+
+def test_delete_failure_forgets_cached_sheet_id(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    module._SHEET_ID_CACHE[("sheet-123", "Job Applications")] = 999
+    monkeypatch.setattr(module, "_fetch_json", lambda *args, **kwargs: {"values": [["k1"]]})
+
+    def boom(*args, **kwargs):
+        raise RuntimeError("invalid sheet id")
+
+    monkeypatch.setattr(module, "_post_json_fire", boom)
+    out = delete_job_app_row_by_key(job_key="k1")
+    assert out["ok"] is False
+    assert ("sheet-123", "Job Applications") not in module._SHEET_ID_CACHE
+
+
+def test_delete_job_app_row_by_key_counts_blank_cells_in_column(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(module, "get_google_access_token", lambda: {"ok": True, "access_token": "token"})
+    posted: list[dict] = []
+
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        if "Job%20Applications!A2:A" in url:
+            assert url.endswith("?majorDimension=COLUMNS&fields=values")
+            return {"values": [["k1", "", "k3"]]}
+        return {"sheets": [{"properties": {"title": "Job Applications", "sheetId": 5}}]}
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    monkeypatch.setattr(module, "_post_json_fire", lambda url, headers, payload, timeout_sec: posted.append(payload) or {})
+    out = delete_job_app_row_by_key(job_key="k3")
+    assert out["ok"] is True
+    assert out["deleted_row_number"] == 4
+    assert posted[0]["requests"][0]["deleteDimension"]["range"]["startIndex"] == 3
+
+
+def test_url_builders_encode_ids_and_ranges():
+    assert module._build_values_get_url("a/b", "Job Applications!A2:A") == (
+        "https://sheets.googleapis.com/v4/spreadsheets/a%2Fb/values/Job%20Applications!A2:A"
+    )
+    assert module._build_values_append_url("a/b", "Job Applications!A1").endswith(
+        "/a%2Fb/values/Job%20Applications!A1:append?valueInputOption=RAW&insertDataOption=INSERT_ROWS"
+        "&fields=updates(updatedRange,updatedRows)"
+    )
+    assert module._build_batch_update_url("a/b").endswith("/spreadsheets/a%2Fb:batchUpdate")
+    assert module._build_sheet_metadata_url("a/b").endswith("/spreadsheets/a%2Fb?fields=sheets(properties(sheetId,title))")
+
+
+def test_find_job_key_rows_stops_at_limit():
+    column = ["a", " dup ", "b", "dup", "", "dup"]
+    assert module._find_job_key_rows(column, "dup") == [3, 5, 7]
+    assert module._find_job_key_rows(column, "dup", limit=2) == [3, 5]
+    assert module._find_job_key_rows(column, "missing", limit=2) == []
+
+
+def test_extract_job_keys_skips_blank_and_missing_cells():
+    assert module._extract_job_keys(["k1", " k2 ", "", None, "   ", 7, "k1"]) == {"k1", "k2", "7"}
+    assert module._extract_job_keys([]) == set()
+
+
+def test_parse_human_date_iso_fast_path_matches_strptime():
+    assert module._parse_human_date("2026-02-16").isoformat() == "2026-02-16"
+    assert module._parse_human_date("2026-2-6").isoformat() == "2026-02-06"
+    assert module._parse_human_date("02/16/2026").isoformat() == "2026-02-16"
+    for bad in ("2026-02-30", "2026-13-01", "2026-02-1a"):
+        with pytest.raises(ValueError):
+            module._parse_human_date(bad)
+
+
+def test_row_value_mappers_pad_truncate_and_round_trip():
+    short = module._row_values_to_dict(["k1", "Acme", None])
+    assert list(short.keys()) == module.COLUMNS
+    assert short["JobKey"] == "k1" and short["Job Title"] == "" and short["AI Notes"] == ""
+    long_row = [str(i) for i in range(len(module.COLUMNS) + 2)]
+    assert list(module._row_values_to_dict(long_row).values()) == long_row[: len(module.COLUMNS)]
+    values = module._row_dict_to_sheet_values({"JobKey": "k1", "Notes": None, "Extra": "x"})
+    assert len(values) == len(module.COLUMNS)
+    assert values[0] == "k1" and all(value == "" for value in values[1:])
+
+
+def test_fetch_json_revalidates_cached_response_with_etag(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    calls: list[tuple[str, str | None]] = []
+    responses = [({"values": [["v1"]]}, '"e1"', True), (None, '"e1"', False), ({"values": [["v2"]]}, '"e2"', True)]
+
+    def fake_get_json_conditional(url, headers, timeout, *, etag=None):
+        calls.append((url, etag))
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(module, "get_json_conditional", fake_get_json_conditional)
+    url = "https://sheets.example/values/x"
+    assert module._fetch_json(url, {}, 9) == {"values": [["v1"]]}
+    assert module._fetch_json(url, {}, 9) == {"values": [["v1"]]}
+    assert module._fetch_json(url, {}, 9) == {"values": [["v2"]]}
+    assert [etag for _, etag in calls] == [None, '"e1"', '"e1"']
+
+
+def test_fetch_json_callers_cannot_mutate_cached_payload(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    responses = [({"values": [["v1"]]}, '"e1"', True), (None, '"e1"', False), (None, '"e1"', False)]
+    monkeypatch.setattr(
+        module, "get_json_conditional", lambda url, headers, timeout, *, etag=None: responses.pop(0)
+    )
+    url = "https://sheets.example/values/x"
+    module._fetch_json(url, {}, 9)["values"].append(["fresh-write"])
+    revalidated = module._fetch_json(url, {}, 9)
+    assert revalidated == {"values": [["v1"]]}
+    revalidated["values"][0][0] = "edited"
+    assert module._fetch_json(url, {}, 9) == {"values": [["v1"]]}
+
+
+def test_fetch_json_response_cache_is_bounded(configured_google_drive, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        module, "get_json_conditional", lambda url, headers, timeout, *, etag=None: ({"url": url}, '"e"', True)
+    )
+    for idx in range(module.RESPONSE_CACHE_MAX_ENTRIES + 3):
+        module._fetch_json(f"https://sheets.example/{idx}", {}, 9)
+    assert len(module._RESPONSE_CACHE) == module.RESPONSE_CACHE_MAX_ENTRIES
+    assert "https://sheets.example/0" not in module._RESPONSE_CACHE
+
+
+def test_normalize_date_string_rejects_unknown_shapes():
+    assert module._normalize_date_string(" 2/5/2026 ") == "2026-02-05"
+    assert module._normalize_date_string("  ") is None
+    for bad in ("2026/02/05", "02-05-2026", "Feb 5 2026", "2026-02-05T00:00"):
+        with pytest.raises(ValueError):
+            module._normalize_date_string(bad)
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import json
 from pathlib import Path
@@ -5,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from src.zubot.core.config_loader import clear_config_cache
-from src.zubot.tools.kernel.hasdata_indeed import get_indeed_job_detail, get_indeed_jobs
+from src.zubot.tools.kernel.hasdata_indeed import get_indeed_job_detail, get_indeed_job_details, get_indeed_jobs
 
 module = importlib.import_module("src.zubot.tools.kernel.hasdata_indeed")
 
@@ -31,9 +32,50 @@ def configured_hasdata(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     )
     monkeypatch.setenv("ZUBOT_CONFIG_PATH", str(config_path))
     clear_config_cache()
+    module._reset_settings_cache()
+    module.clear_response_cache()
     return True
 
 
+def test_hasdata_settings_prefer_profile_block_over_legacy():
+    build = module._hasdata_settings.__wrapped__
+    profile = {"tool_profiles": {"user_specific": {"has_data": {"api_key": "PROFILE", "timeout_sec": 12}}}}
+    assert build({**profile, "has_data": {"api_key": "LEGACY"}})["api_key"] == "PROFILE"
+
+    legacy = build({"has_data": {"api_key": "LEGACY", "timeout_sec": 3, "base_url": "https://h.example/"}})
+    assert legacy["api_key"] == "LEGACY"
+    assert legacy["timeout_sec"] == 3
+    assert legacy["listing_endpoint"] == "https://h.example/scrape/indeed/listing?"
+
+
+def test_hasdata_settings_coerces_queue_values(configured_hasdata, tmp_path: Path):
+    (tmp_path / "config.json").write_text(
+        json.dumps(
+            {
+                "tool_profiles": {
+                    "user_specific": {
+                        "has_data": {
+                            "api_key": "k",
+                            "queue_min_interval_sec": 2,
+                            "queue_max_retries": "3",
+                            "queue_retry_backoff_sec": None,
+                            "queue_jitter_sec": 0.25,
+                        }
+                    }
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    clear_config_cache()
+    settings = module._hasdata_settings()
+    assert settings["queue_min_interval_sec"] == 2.0
+    assert settings["queue_max_retries"] == 1
+    assert settings["queue_retry_backoff_sec"] == 1.0
+    assert settings["queue_jitter_sec"] == 0.25
+    assert settings["timeout_sec"] == 15
+
+
 def test_get_indeed_jobs_validates_inputs(configured_hasdata):
     a = get_indeed_jobs(keyword=" ", location="Columbus, OH")
     b = get_indeed_jobs(keyword="software engineer", location=" ")
@@ -172,3 +214,79 @@ def test_get_indeed_job_detail_error_path(configured_hasdata, monkeypatch):
     assert out["ok"] is False
     assert out["source"] == "hasdata_indeed_job_error"
     assert "network fail" in out["error"]
+
+
+def test_cache_hits_skip_the_provider_queue(configured_hasdata, monkeypatch):
+    calls = []
+
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        calls.append(url)
+        payload = {"job": {"title": "cached"}}
+        module._RESPONSE_CACHE.set(url, (payload, None, None), 60)
+        return payload
+
+    def fail_queue(**_kwargs):
+        raise AssertionError("cache hit must not enter the provider queue")
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    first = get_indeed_job_detail(url="https://www.indeed.com/viewjob?jk=abc")
+    assert first["queue"]["group"] == "hasdata"
+
+    monkeypatch.setattr(module, "execute_provider_call", fail_queue)
+    second = get_indeed_job_detail(url="https://www.indeed.com/viewjob?jk=abc")
+    assert second["ok"] is True
+    assert second["job"] == {"title": "cached"}
+    assert second["queue"] is None
+    assert len(calls) == 1
+
+
+def test_get_indeed_job_details_keeps_input_order(configured_hasdata, monkeypatch):
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        if "jk%3Dbad" in url:
+            raise RuntimeError("network fail")
+        return {"job": {"title": url.rsplit("jk%3D", 1)[-1]}}
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+    urls = [f"https://www.indeed.com/viewjob?jk={jk}" for jk in ("a", "bad", "c")] + [" "]
+    out = get_indeed_job_details(urls=urls)
+    assert out["ok"] is True
+    assert out["source"] == "hasdata_indeed_job_batch"
+    assert [item["ok"] for item in out["results"]] == [True, False, True, False]
+    assert out["results"][0]["job"]["title"] == "a"
+    assert out["results"][2]["job"]["title"] == "c"
+    assert "url must be non-empty" in out["results"][3]["error"]
+    assert out["ok_count"] == 2
+
+
+def test_get_indeed_job_details_requires_urls(configured_hasdata):
+    out = get_indeed_job_details(urls=[])
+    assert out["ok"] is False
+    assert "urls must be a non-empty list" in out["error"]
+
+
+def test_async_wrappers_return_sync_payloads(configured_hasdata, monkeypatch):
+    def fake_fetch_json(url: str, headers: dict[str, str], timeout_sec: int):
+        if "/scrape/indeed/listing?" in url:
+            return {"jobs": [{"title": "A"}]}
+        return {"job": {"title": url.rsplit("jk%3D", 1)[-1]}}
+
+    monkeypatch.setattr(module, "_fetch_json", fake_fetch_json)
+
+    async def run():
+        listing = await module.aget_indeed_jobs(keyword="python", location="Remote")
+        details = await asyncio.gather(
+            *(module.aget_indeed_job_detail(url=f"https://www.indeed.com/viewjob?jk={jk}") for jk in ("a", "b"))
+        )
+        return listing, details
+
+    listing, details = asyncio.run(run())
+    assert listing["ok"] is True and listing["jobs_count"] == 1
+    assert [item["job"]["title"] for item in details] == ["a", "b"]
+
+
+def test_input_errors_are_independent_copies(configured_hasdata):
+    first = get_indeed_jobs(keyword="  ", location="Columbus, OH")
+    assert first == {"ok": False, "provider": "hasdata", "source": "hasdata_indeed_listing", "error": "keyword must be non-empty."}
+    first["error"] = "mutated"
+    assert get_indeed_jobs(keyword="", location="Columbus, OH")["error"] == "keyword must be non-empty."
+    assert get_indeed_jobs(keyword="python", location=" ")["error"] == "location must be non-empty."
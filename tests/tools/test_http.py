@@ -0,0 +1,333 @@
+import gzip
+import importlib
+import json
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.error import HTTPError
+from urllib.request import Request
+
+import pytest
+
+_http = importlib.import_module("src.zubot.tools.kernel._http")
+web_fetch_module = importlib.import_module("src.zubot.tools.kernel.web_fetch")
+
+# 16 MiB of zeros compresses to ~16 KiB: a single 64 KiB read of it would decode to everything.
+_BOMB_SIZE = 16 * 1024 * 1024
+_BOMB = gzip.compress(b"\0" * _BOMB_SIZE)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ports: list[int] = []
+    bodies: list[bytes] = []
+    paths: list[str] = []
+
+    def _redirect(self, status):
+        self.send_response(status)
+        self.send_header("Location", "/landing?from=redirect")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self.ports.append(self.client_address[1])
+        self.paths.append(f"GET {self.path}")
+        if self.path.startswith("/redirect"):
+            self._redirect(302)
+            return
+        status = 404 if self.path.startswith("/missing") else 200
+        if self.path.startswith("/etag"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            body = json.dumps({"path": self.path}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path.startswith("/lm"):
+            stamp = "Wed, 11 Feb 2026 07:00:00 GMT"
+            fresh = self.headers.get("If-Modified-Since") == stamp
+            body = b"" if fresh else json.dumps({"path": self.path}).encode("utf-8")
+            self.send_response(304 if fresh else 200)
+            self.send_header("Last-Modified", stamp)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path.startswith("/bomb"):
+            body = _BOMB
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        encoding = "gzip" if self.path.startswith("/gz") else "deflate" if self.path.startswith(("/deflate", "/rawdeflate")) else None
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        if encoding:
+            raw = json.dumps({"path": self.path, "accept_encoding": self.headers.get("Accept-Encoding")}).encode("utf-8")
+            if encoding == "gzip":
+                body = gzip.compress(raw)
+            elif self.path.startswith("/rawdeflate"):
+                packer = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+                body = packer.compress(raw) + packer.flush()
+            else:
+                body = zlib.compress(raw)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/close"):
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.ports.append(self.client_address[1])
+        self.paths.append(f"POST {self.path}")
+        raw = self.rfile.read(int(self.headers["Content-Length"]))
+        self.bodies.append(raw)
+        if self.path.startswith("/redirect"):
+            self._redirect(307)
+            return
+        received = json.loads(raw)
+        body = json.dumps({"path": self.path, "received": received, "type": self.headers["Content-Type"]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return None
+
+
+@pytest.fixture()
+def server(monkeypatch: pytest.MonkeyPatch):
+    for name in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    _Handler.ports = []
+    _Handler.bodies = []
+    _Handler.paths = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    _http.clear_pool()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    _http.clear_pool()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_open_pooled_reuses_keep_alive_connection(server):
+    for path in ("/a", "/b", "/c"):
+        with _http.open_pooled(Request(f"{server}{path}?x=1"), timeout=5) as response:
+            assert json.loads(response.read()) == {"path": f"{path}?x=1"}
+            assert response.status == 200
+    assert len(_Handler.ports) == 3
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_open_pooled_does_not_reuse_closed_or_unread_connections(server):
+    with _http.open_pooled(Request(f"{server}/close"), timeout=5) as response:
+        response.read()
+    with _http.open_pooled(Request(f"{server}/unread"), timeout=5):
+        pass
+    with _http.open_pooled(Request(f"{server}/after"), timeout=5) as response:
+        response.read()
+    assert len(set(_Handler.ports)) == 3
+
+
+def test_open_pooled_raises_http_error_and_keeps_connection(server):
+    with pytest.raises(HTTPError) as exc_info:
+        _http.open_pooled(Request(f"{server}/missing"), timeout=5)
+    assert exc_info.value.code == 404
+    assert json.loads(exc_info.value.read()) == {"path": "/missing"}
+    with _http.open_pooled(Request(f"{server}/ok"), timeout=5) as response:
+        response.read()
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_open_pooled_recovers_from_server_closed_idle_connection(server):
+    with _http.open_pooled(Request(f"{server}/first"), timeout=5) as response:
+        response.read()
+    with _http._POOL_LOCK:
+        for idle in _http._POOL.values():
+            for conn in idle:
+                conn.sock.close()
+                conn.sock = None
+    with _http.open_pooled(Request(f"{server}/second"), timeout=5) as response:
+        assert json.loads(response.read()) == {"path": "/second"}
+
+
+def test_pooled_response_supports_json_load(server):
+    with _http.open_pooled(Request(f"{server}/json"), timeout=5) as response:
+        assert json.load(response) == {"path": "/json"}
+    with _http.open_pooled(Request(f"{server}/again"), timeout=5) as response:
+        response.read()
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_get_json_and_post_json_share_the_pool(server):
+    assert _http.get_json(f"{server}/g", {"Accept": "application/json"}, 5) == {"path": "/g"}
+    out = _http.post_json(f"{server}/p", {"Accept": "application/json"}, {"a": 1}, 5)
+    assert out == {"path": "/p", "received": {"a": 1}, "type": "application/json"}
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_post_json_sends_compact_utf8_body(server):
+    _http.post_json(f"{server}/p", {}, {"k": ["é", 1]}, 5)
+    assert _Handler.bodies == ['{"k":["é",1]}'.encode("utf-8")]
+
+
+def test_open_pooled_requests_and_decodes_gzip(server):
+    assert _http.get_json(f"{server}/gz", {}, 5) == {"path": "/gz", "accept_encoding": _http.ACCEPT_ENCODING}
+    with _http.open_pooled(Request(f"{server}/gz2"), timeout=5) as response:
+        chunks = []
+        while chunk := response.read(7):
+            chunks.append(chunk)
+    assert json.loads(b"".join(chunks)) == {"path": "/gz2", "accept_encoding": _http.ACCEPT_ENCODING}
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_post_json_discard_drains_and_reuses_connection(server):
+    assert _http.post_json_discard(f"{server}/p", {}, {"requests": []}, 5) is None
+    assert _http.get_json(f"{server}/g", {}, 5) == {"path": "/g"}
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_get_json_conditional_handles_not_modified(server):
+    assert _http.get_json_conditional(f"{server}/etag", {}, 5) == ({"path": "/etag"}, '"v1"', True)
+    assert _http.get_json_conditional(f"{server}/etag", {}, 5, etag='"v1"') == (None, '"v1"', False)
+    assert _http.get_json_conditional(f"{server}/etag", {}, 5, etag='"v0"') == ({"path": "/etag"}, '"v1"', True)
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_get_json_cached_serves_fresh_entries_and_returns_copies(server):
+    cache = _http.TTLCache(maxsize=2)
+    first = _http.get_json_cached(f"{server}/c", {}, 5, cache=cache, ttl_sec=60)
+    first["path"] = "mutated"
+    assert _http.get_json_cached(f"{server}/c", {}, 5, cache=cache, ttl_sec=60) == {"path": "/c"}
+    assert len(_Handler.ports) == 1
+    assert _http.get_json_cached(f"{server}/c", {}, 5, cache=cache, ttl_sec=0) == {"path": "/c"}
+    assert len(_Handler.ports) == 2
+    hit = _http.cached_json(f"{server}/c", cache=cache, ttl_sec=60)
+    hit["path"] = "mutated"
+    assert _http.cached_json(f"{server}/c", cache=cache, ttl_sec=60) == {"path": "/c"}
+    assert _http.cached_json(f"{server}/c", cache=cache, ttl_sec=0) is None
+    assert _http.cached_json(f"{server}/missing", cache=cache, ttl_sec=60) is None
+
+
+def test_ttl_cache_expires_and_evicts_least_recent(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(_http, "monotonic", lambda: now[0])
+    cache = _http.TTLCache(maxsize=2)
+    cache.set("a", 1, 10)
+    cache.set("b", 2, 10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, 10)
+    assert cache.get("b") is None and len(cache) == 2
+    now[0] = 110.0
+    assert cache.get("a") is None and cache.get("c") is None
+
+
+def test_json_helpers_parse_raw_response_bytes(server, monkeypatch: pytest.MonkeyPatch):
+    seen: list[type] = []
+    recording = SimpleNamespace(loads=lambda raw: seen.append(type(raw)) or json.loads(raw))
+    monkeypatch.setattr(_http, "json", recording)
+    assert _http.get_json(f"{server}/b", {}, 5) == {"path": "/b"}
+    assert _http.post_json(f"{server}/b", {}, {"x": 1}, 5)["received"] == {"x": 1}
+    assert seen == [bytes, bytes]
+
+
+def test_open_pooled_decodes_deflate(server):
+    assert _http.get_json(f"{server}/deflate", {}, 5) == {"path": "/deflate", "accept_encoding": _http.ACCEPT_ENCODING}
+    assert "deflate" in _http.ACCEPT_ENCODING
+
+
+def test_open_pooled_decodes_raw_deflate_body(server):
+    expected = {"path": "/rawdeflate", "accept_encoding": _http.ACCEPT_ENCODING}
+    assert _http.get_json(f"{server}/rawdeflate", {}, 5) == expected
+    with _http.open_pooled(Request(f"{server}/rawdeflate"), timeout=5) as response:
+        chunks = []
+        while chunk := response.read(1):
+            chunks.append(chunk)
+    assert json.loads(b"".join(chunks)) == expected
+
+
+def test_deflate_decoder_replays_header_split_across_reads():
+    raw = b"x" * 5000
+    packer = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    body = packer.compress(raw) + packer.flush()
+    decoder = _http._DeflateDecoder()
+    out = decoder.decompress(body[:1]) + decoder.decompress(body[1:]) + decoder.flush()
+    assert out == raw
+
+
+@pytest.mark.parametrize("path", ["/etag", "/lm"])
+def test_get_json_cached_revalidates_expired_entries(server, monkeypatch: pytest.MonkeyPatch, path):
+    now = [0.0]
+    monkeypatch.setattr(_http, "monotonic", lambda: now[0])
+    cache = _http.TTLCache(maxsize=4)
+    assert _http.get_json_cached(f"{server}{path}", {}, 5, cache=cache, ttl_sec=10) == {"path": path}
+    now[0] = 11.0
+    revalidated = _http.get_json_cached(f"{server}{path}", {}, 5, cache=cache, ttl_sec=10)
+    assert revalidated == {"path": path}
+    revalidated["path"] = "mutated"
+    assert cache.lookup(f"{server}{path}")[1] is True
+    assert _http.get_json_cached(f"{server}{path}", {}, 5, cache=cache, ttl_sec=10) == {"path": path}
+    assert len(_Handler.ports) == 2
+
+
+def test_pooled_read_bounds_decoded_size_of_compressed_body(server):
+    with _http.open_pooled(Request(f"{server}/bomb"), timeout=5) as response:
+        sizes = []
+        while chunk := response.read(64 * 1024):
+            sizes.append(len(chunk))
+    assert max(sizes) <= 64 * 1024
+    assert sum(sizes) == _BOMB_SIZE
+
+
+def test_web_fetch_read_cap_holds_for_gzip_bomb(server):
+    with _http.open_pooled(Request(f"{server}/bomb"), timeout=5) as response:
+        body = web_fetch_module._read_capped(response, 100_000)
+    assert len(body) == 100_000
+
+
+def test_brotli_decoder_honours_max_length():
+    brotli = pytest.importorskip("brotli")
+    decoder = _http._BrotliDecoder()
+    raw = brotli.compress(b"\0" * 1_000_000)
+    out = bytearray()
+    data = decoder.decompress(raw, 4096)
+    while data:
+        assert len(data) <= 4096
+        out += data
+        data = decoder.decompress(decoder.unconsumed_tail, 4096)
+    out += decoder.flush()
+    assert len(out) == 1_000_000
+
+
+def test_open_pooled_follows_get_redirect_once_on_the_pool(server):
+    with _http.open_pooled(Request(f"{server}/redirect"), timeout=5) as response:
+        assert json.loads(response.read()) == {"path": "/landing?from=redirect"}
+        assert response.geturl() == f"{server}/landing?from=redirect"
+    # The origin sees the original request once, then the redirect target once.
+    assert _Handler.paths == ["GET /redirect", "GET /landing?from=redirect"]
+    assert len(set(_Handler.ports)) == 1
+
+
+def test_open_pooled_does_not_resend_post_on_redirect(server):
+    with pytest.raises(HTTPError) as excinfo:
+        _http.post_json(f"{server}/redirect", {}, {"write": 1}, 5)
+    assert excinfo.value.code == 307
+    assert _Handler.paths == ["POST /redirect"]
+    assert _Handler.bodies == [b'{"write":1}']
@@ -42,3 +42,18 @@ def test_get_location_uses_home_location_from_config(tmp_path: Path, monkeypatch
     assert result["region"] == "Ohio"
     assert result["country"] == "USA"
     assert result["timezone"] == "America/New_York"
+
+
+def test_get_location_reuses_resolution_until_config_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"home_location": {"city": "Worthington"}}), encoding="utf-8")
+    monkeypatch.setenv("ZUBOT_CONFIG_PATH", str(config_path))
+    clear_config_cache()
+
+    first = get_location()
+    first["city"] = "mutated by caller"
+    assert get_location()["city"] == "Worthington"
+
+    config_path.write_text(json.dumps({"home_location": {"city": "Columbus"}}), encoding="utf-8")
+    clear_config_cache()
+    assert get_location()["city"] == "Columbus"
@@ -33,3 +33,26 @@ def test_get_current_time_invalid_timezone_falls_back_to_utc():
     assert result["timezone_source"] == "invalid_timezone_fallback"
     assert result["iso_local"].endswith("+00:00")
     assert result["human_local"].endswith("UTC")
+
+
+def test_get_current_time_reuses_zone_lookups():
+    from src.zubot.tools.kernel import time as time_module
+
+    time_module._zone.cache_clear()
+    for _ in range(3):
+        assert get_current_time(location={"timezone": "America/New_York"})["timezone_source"] == "location_timezone"
+    assert time_module._zone.cache_info().misses == 1
+    assert get_current_time(location={"timezone": "Not/A_Real_TZ"})["timezone_source"] == "invalid_timezone_fallback"
+
+
+def test_human_format_matches_strftime():
+    from datetime import datetime, timezone
+
+    from src.zubot.tools.kernel.time import _human, _zone
+
+    for moment in (
+        datetime(2026, 2, 11, 0, 5, 9, tzinfo=timezone.utc),
+        datetime(2026, 2, 11, 12, 0, 0, tzinfo=timezone.utc),
+        datetime(2026, 7, 4, 23, 59, 59, tzinfo=timezone.utc).astimezone(_zone("America/New_York")),
+    ):
+        assert _human(moment, moment.tzname()) == moment.strftime("%Y-%m-%d %I:%M:%S %p %Z")
@@ -1,5 +1,8 @@
+from urllib.parse import parse_qs, urlsplit
+
 from src.zubot.tools.kernel.weather import (
     get_future_weather,
+    get_future_weather_columns,
     get_today_weather,
     get_weather,
     get_weather_24hr,
@@ -96,60 +99,54 @@ def test_get_future_weather_contract_shape_daily(monkeypatch):
     assert result["error"] is None
 
 
+_LOCATION = {"city": "Worthington", "lat": 40.09, "lon": -83.02, "timezone": None}
+
+
 def test_get_week_outlook_normalized(monkeypatch):
-    def fake_get_future_weather(**kwargs):
+    def fake_fetch_json(url, timeout_sec=10):
         return {
-            "location": {"city": "Worthington"},
-            "units": {"temperature": "fahrenheit"},
-            "provider": "open_meteo",
-            "source": "open_meteo",
-            "error": None,
-            "forecast": [
-                {
-                    "time": "2026-02-11",
-                    "temperature_2m_max": 41.0,
-                    "temperature_2m_min": 27.0,
-                    "precipitation_probability_max": 20,
-                    "precipitation_sum": 0.1,
-                    "wind_speed_10m_max": 12.0,
-                    "weather_code": 2,
-                    "sunrise": "2026-02-11T07:22",
-                    "sunset": "2026-02-11T18:02",
-                }
-            ],
+            "daily": {
+                "time": ["2026-02-11", "2026-02-12"],
+                "temperature_2m_max": [41.0, 44.0],
+                "temperature_2m_min": [27.0, 30.0],
+                "precipitation_probability_max": [20, 5],
+                "precipitation_sum": [0.1, 0.0],
+                "wind_speed_10m_max": [12.0, 9.0],
+                "weather_code": [2, 1],
+                "sunrise": ["2026-02-11T07:22", "2026-02-12T07:21"],
+                "sunset": ["2026-02-11T18:02"],
+            }
         }
 
-    monkeypatch.setattr("src.zubot.tools.kernel.weather.get_future_weather", fake_get_future_weather)
-    result = get_week_outlook()
+    monkeypatch.setattr("src.zubot.tools.kernel.weather._fetch_json", fake_fetch_json)
+    result = get_week_outlook(location=_LOCATION)
     assert result["days"] == 7
+    assert result["location"] == _LOCATION
     assert result["outlook"][0]["date"] == "2026-02-11"
     assert result["outlook"][0]["high"] == 41.0
     assert result["outlook"][0]["sunrise"] == "2026-02-11T07:22"
+    assert result["outlook"][1]["sunset"] is None
+    assert list(result["outlook"][1]) == [
+        "date", "high", "low", "precip_probability", "precip_total", "wind_max", "weather_code", "sunrise", "sunset"
+    ]
 
 
 def test_get_weather_24hr_normalized(monkeypatch):
-    def fake_get_future_weather(**kwargs):
+    def fake_fetch_json(url, timeout_sec=10):
         return {
-            "location": {"city": "Worthington"},
-            "units": {"temperature": "fahrenheit"},
-            "provider": "open_meteo",
-            "source": "open_meteo",
-            "error": None,
-            "forecast": [
-                {
-                    "time": "2026-02-11T15:00",
-                    "temperature_2m": 33.0,
-                    "apparent_temperature": 31.0,
-                    "precipitation_probability": 10,
-                    "precipitation": 0.0,
-                    "wind_speed_10m": 8.0,
-                    "weather_code": 1,
-                }
-            ],
+            "hourly": {
+                "time": ["2026-02-11T15:00"],
+                "temperature_2m": [33.0],
+                "apparent_temperature": [31.0],
+                "precipitation_probability": [10],
+                "precipitation": [0.0],
+                "wind_speed_10m": [8.0],
+                "weather_code": [1],
+            }
         }
 
-    monkeypatch.setattr("src.zubot.tools.kernel.weather.get_future_weather", fake_get_future_weather)
-    result = get_weather_24hr()
+    monkeypatch.setattr("src.zubot.tools.kernel.weather._fetch_json", fake_fetch_json)
+    result = get_weather_24hr(location=_LOCATION)
     assert result["hours"] == 24
     assert result["hourly"][0]["time"] == "2026-02-11T15:00"
     assert result["hourly"][0]["temp"] == 33.0
@@ -157,32 +154,102 @@ def test_get_weather_24hr_normalized(monkeypatch):
 
 
 def test_get_today_weather_summary(monkeypatch):
-    def fake_get_future_weather(**kwargs):
+    def fake_fetch_json(url, timeout_sec=10):
         return {
-            "location": {"city": "Worthington"},
-            "units": {"temperature": "fahrenheit"},
-            "provider": "open_meteo",
-            "source": "open_meteo",
-            "error": None,
-            "forecast": [
-                {
-                    "time": "2026-02-11",
-                    "temperature_2m_max": 43.0,
-                    "temperature_2m_min": 29.0,
-                    "precipitation_probability_max": 25,
-                    "precipitation_sum": 0.05,
-                    "wind_speed_10m_max": 11.0,
-                    "sunrise": "2026-02-11T07:22",
-                    "sunset": "2026-02-11T18:02",
-                    "weather_code": 3,
-                }
-            ],
+            "daily": {
+                "time": ["2026-02-11"],
+                "temperature_2m_max": [43.0],
+                "temperature_2m_min": [29.0],
+                "precipitation_probability_max": [25],
+                "precipitation_sum": [0.05],
+                "wind_speed_10m_max": [11.0],
+                "sunrise": ["2026-02-11T07:22"],
+                "sunset": ["2026-02-11T18:02"],
+                "weather_code": [3],
+            }
         }
 
-    monkeypatch.setattr("src.zubot.tools.kernel.weather.get_future_weather", fake_get_future_weather)
-    result = get_today_weather()
+    monkeypatch.setattr("src.zubot.tools.kernel.weather._fetch_json", fake_fetch_json)
+    result = get_today_weather(location=_LOCATION)
     assert result["date"] == "2026-02-11"
     assert result["high"] == 43.0
     assert result["low"] == 29.0
     assert result["sunrise"] == "2026-02-11T07:22"
     assert result["sunset"] == "2026-02-11T18:02"
+
+
+def test_get_today_weather_empty_forecast_keeps_keys(monkeypatch):
+    monkeypatch.setattr("src.zubot.tools.kernel.weather._fetch_json", lambda url, timeout_sec=10: {})
+    result = get_today_weather(location=_LOCATION)
+    assert result["date"] is None and result["weather_code"] is None
+    assert result["source"] == "open_meteo"
+
+
+def test_forecast_urls_carry_fixed_and_dynamic_params(monkeypatch):
+    urls: list[str] = []
+    monkeypatch.setattr(
+        "src.zubot.tools.kernel.weather._fetch_json", lambda url, timeout_sec=10: urls.append(url) or {}
+    )
+    location = {"lat": 40.0931, "lon": -83.017, "timezone": None}
+    get_weather(location=location)
+    get_future_weather(location=location, horizon="hourly", hours=30)
+
+    current = parse_qs(urlsplit(urls[0]).query)
+    assert current["latitude"] == ["40.0931"] and current["longitude"] == ["-83.017"]
+    assert current["timezone"] == ["auto"]
+    assert current["current"][0].split(",")[0] == "temperature_2m"
+    assert {"temperature_unit", "wind_speed_unit", "precipitation_unit"} <= set(current)
+    hourly = parse_qs(urlsplit(urls[1]).query)
+    assert hourly["forecast_days"] == ["2"]
+    assert "precipitation_probability" in hourly["hourly"][0].split(",")
+
+
+def test_repeat_forecast_lookups_hit_response_cache(monkeypatch):
+    from src.zubot.tools.kernel import weather
+
+    calls: list[str] = []
+
+    def fake_get_json_validated(url, headers, timeout, *, etag, last_modified):
+        calls.append(url)
+        return {"current": {"temperature_2m": 40.0}}, None, None, True
+
+    weather.clear_response_cache()
+    monkeypatch.setattr("src.zubot.tools.kernel._http._get_json_validated", fake_get_json_validated)
+    location = {"lat": 1.5, "lon": 2.5, "timezone": None}
+    assert get_weather(location=location)["error"] is None
+    assert get_weather(location=location)["current"]["temperature_2m"] == 40.0
+    get_weather(location={"lat": 3.5, "lon": 2.5, "timezone": None})
+    assert len(calls) == 2
+    weather.clear_response_cache()
+
+
+def test_to_forecast_rows_limits_and_skips_short_or_non_list_series():
+    from src.zubot.tools.kernel.weather import _to_forecast_rows
+
+    block = {"time": ["t0", "t1", "t2"], "temp": [1, 2, 3], "rain": [0.1], "unit": "F"}
+    assert _to_forecast_rows(block, 2) == [{"time": "t0", "temp": 1, "rain": 0.1}, {"time": "t1", "temp": 2}]
+    assert _to_forecast_rows({"temp": [1]}, 2) == []
+
+
+def test_to_forecast_rows_zip_paths_match_field_map_and_uniform_blocks():
+    from src.zubot.tools.kernel.weather import _to_forecast_rows
+
+    block = {"time": ["t0", "t1", "t2"], "temp": [1, 2, 3], "code": [7, 8, 9]}
+    assert _to_forecast_rows(block, 2) == [{"time": "t0", "temp": 1, "code": 7}, {"time": "t1", "temp": 2, "code": 8}]
+    mapped = _to_forecast_rows({**block, "code": [7]}, 5, {"when": "time", "t": "temp", "c": "code", "x": "missing"})
+    assert mapped[0] == {"when": "t0", "t": 1, "c": 7, "x": None}
+    assert mapped[2] == {"when": "t2", "t": 3, "c": None, "x": None}
+
+
+def test_get_future_weather_columns_keeps_column_layout(monkeypatch):
+    monkeypatch.setattr(
+        "src.zubot.tools.kernel.weather._fetch_json",
+        lambda url, timeout_sec=10: {"daily": {"time": ["d0", "d1", "d2"], "temperature_2m_max": [50, 61, 58], "unit": "F"}},
+    )
+    result = get_future_weather_columns(location=_LOCATION, horizon="daily", days=2)
+    assert result["forecast"] == {"time": ["d0", "d1"], "fields": {"temperature_2m_max": [50, 61]}}
+    assert max(result["forecast"]["fields"]["temperature_2m_max"]) == 61
+    assert result["source"] == "open_meteo"
+
+    unresolved = get_future_weather_columns(location={"timezone": None})
+    assert unresolved["forecast"] == {"time": [], "fields": {}}
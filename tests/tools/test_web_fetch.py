@@ -1,5 +1,7 @@
 import importlib
+import io
 
+from src.zubot.core.config_loader import clear_config_cache
 from src.zubot.tools.kernel.web_fetch import fetch_url
 
 web_fetch_module = importlib.import_module("src.zubot.tools.kernel.web_fetch")
@@ -12,12 +14,12 @@ class _FakeHeaders(dict):
 
 class _FakeResponse:
     def __init__(self, body: bytes, content_type: str = "text/html", status: int = 200):
-        self._body = body
+        self._body = io.BytesIO(body)
         self.headers = _FakeHeaders({"Content-Type": content_type})
         self.status = status
 
-    def read(self) -> bytes:
-        return self._body
+    def read(self, amt: int | None = None) -> bytes:
+        return self._body.read(amt)
 
     def __enter__(self):
         return self
@@ -38,10 +40,10 @@ def test_fetch_url_extracts_html(monkeypatch):
     <body><h1>Hello</h1><p>World</p><script>ignore_me()</script></body></html>
     """
 
-    def fake_urlopen(req, timeout=10):
+    def fake_open_pooled(req, timeout=10):
         return _FakeResponse(html, "text/html; charset=utf-8", 200)
 
-    monkeypatch.setattr(web_fetch_module, "urlopen", fake_urlopen)
+    monkeypatch.setattr(web_fetch_module, "open_pooled", fake_open_pooled)
     result = fetch_url("https://example.com")
     assert result["ok"]
     assert result["title"] == "Example Title"
@@ -52,10 +54,10 @@ def test_fetch_url_extracts_html(monkeypatch):
 def test_fetch_url_text_plain(monkeypatch):
     text = b"line one\nline two\n"
 
-    def fake_urlopen(req, timeout=10):
+    def fake_open_pooled(req, timeout=10):
         return _FakeResponse(text, "text/plain", 200)
 
-    monkeypatch.setattr(web_fetch_module, "urlopen", fake_urlopen)
+    monkeypatch.setattr(web_fetch_module, "open_pooled", fake_open_pooled)
     result = fetch_url("https://example.com/txt")
     assert result["ok"]
     assert result["content_type"] == "text/plain"
@@ -63,11 +65,75 @@ def test_fetch_url_text_plain(monkeypatch):
 
 
 def test_fetch_url_network_error(monkeypatch):
-    def fake_urlopen(req, timeout=10):
+    def fake_open_pooled(req, timeout=10):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(web_fetch_module, "urlopen", fake_urlopen)
+    monkeypatch.setattr(web_fetch_module, "open_pooled", fake_open_pooled)
     result = fetch_url("https://example.com")
     assert not result["ok"]
     assert result["source"] == "web_fetch_error"
     assert "boom" in result["error"]
+
+
+def test_fetch_url_title_from_single_parse(monkeypatch):
+    html = b"""<html><head><title>
+      Tom &amp; Jerry\n  Page </title></head>
+    <body><svg><title>icon</title></svg><p>Body   text</p><style>.x{}</style></body></html>"""
+
+    def fake_open_pooled(req, timeout=10):
+        return _FakeResponse(html, "text/html", 200)
+
+    monkeypatch.setattr(web_fetch_module, "open_pooled", fake_open_pooled)
+    result = fetch_url("https://example.com")
+    assert result["title"] == "Tom & Jerry Page"
+    assert "Body text" in result["text"]
+    assert ".x{}" not in result["text"]
+
+
+def test_fetch_url_caps_plain_text_body_read(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"web_fetch": {"max_chars": 10}}', encoding="utf-8")
+    monkeypatch.setenv("ZUBOT_CONFIG_PATH", str(config_path))
+    clear_config_cache()
+    response = _FakeResponse(b"x" * 1000, "text/plain", 200)
+    monkeypatch.setattr(web_fetch_module, "open_pooled", lambda req, timeout=10: response)
+
+    result = fetch_url("https://example.com/big.txt")
+    assert result["text"] == "x" * 10
+    assert response._body.tell() == 40
+
+
+def test_text_extractor_collapses_whitespace_across_chunks():
+    parser = web_fetch_module._TextExtractor()
+    parser.feed("<p>  alpha\n\tbeta </p><script>skip  me</script><div>gamma   </div>  \n ")
+    parser.close()
+    assert parser.text() == "alpha beta gamma"
+
+
+def test_fetch_url_scheme_check_is_case_insensitive(monkeypatch):
+    monkeypatch.setattr(web_fetch_module, "open_pooled", lambda req, timeout=10: _FakeResponse(b"ok", "text/plain"))
+    assert fetch_url("HTTPS://example.com")["ok"] is True
+    assert fetch_url("ftp://example.com")["ok"] is False
+    assert fetch_url("http:example.com")["ok"] is False
+
+
+def test_fetch_url_revalidates_with_etag(monkeypatch):
+    web_fetch_module.clear_response_cache()
+    sent: list[str | None] = []
+
+    def fake_open_pooled(req, timeout=10):
+        sent.append(req.get_header("If-none-match"))
+        if sent[-1] == '"v1"':
+            return _FakeResponse(b"", "text/html", 304)
+        response = _FakeResponse(b"<title>T</title><p>cached body</p>", "text/html", 200)
+        response.headers["ETag"] = '"v1"'
+        return response
+
+    monkeypatch.setattr(web_fetch_module, "open_pooled", fake_open_pooled)
+    first = fetch_url("https://example.com/page")
+    first["text"] = "mutated"
+    second = fetch_url("https://example.com/page")
+    assert sent == [None, '"v1"']
+    assert second["ok"] is True and second["status"] == 200
+    assert second["title"] == "T" and second["text"] == "T cached body"
+    web_fetch_module.clear_response_cache()
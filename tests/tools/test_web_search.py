@@ -83,3 +83,12 @@ def test_web_search_api_error(configured_search, monkeypatch):
     assert not result["ok"]
     assert result["source"] == "brave_api_error"
     assert "network fail" in result["error"]
+
+
+def test_web_search_settings_coerce_values():
+    build = web_search_module._web_search_settings.__wrapped__
+    settings = build({"web_search": {"timeout_sec": "7", "brave_api_key": 123, "cache_ttl_sec": "soon"}})
+    assert settings["timeout_sec"] == 7
+    assert settings["brave_api_key"] is None
+    assert settings["cache_ttl_sec"] == web_search_module.DEFAULT_CACHE_TTL_SEC
+    assert settings["endpoint"] == f"{web_search_module.DEFAULT_BRAVE_SEARCH_URL}?"